@@ -36,13 +36,34 @@ import imaplib
 import smtplib
 import email
 from email.mime.text import MIMEText
-from email.utils import make_msgid, formatdate, parseaddr
+from email.utils import make_msgid, formatdate, parseaddr, parsedate_to_datetime
+import bisect
+import copy
+import functools
+import gzip
+import hashlib
+import heapq
 import json
+import math
 import os
+import sys
 import time
+import fcntl
+import mmap
+import pickle
+import re
+import struct
+import zlib
+import socket
+import sqlite3
 import logging
-from datetime import datetime, timedelta
-from flask import Flask, request, jsonify
+from collections import OrderedDict
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from array import array
+from datetime import datetime, timedelta, timezone
+from urllib.parse import urlsplit
+from flask import Flask, Response, request, jsonify, send_from_directory
 from flask_cors import CORS
 from requests_oauthlib import OAuth1
 import threading
@@ -67,6 +88,20 @@ MAX_REPLIES_PER_HOUR = 30          # Global rate limit
 MAX_REPLIES_PER_SENDER_PER_HOUR = 30  # Per-sender rate limit
 MAX_REPLY_TOKENS = 800              # Keep responses reasonable
 
+# Backpressure — bounded in-flight limit for the email pipeline.
+# When every slot is taken, further UNSEEN mail is left unclaimed
+# (still UNSEEN) and picked up on a later poll instead.
+EMAIL_WORKERS       = int(os.environ.get("EMAIL_WORKERS", 2))        # concurrent DeepSeek/SMTP jobs
+EMAIL_MAX_IN_FLIGHT = int(os.environ.get("EMAIL_MAX_IN_FLIGHT", 4))  # queued + running
+
+# Inbox partitioning — several worker processes may poll the same mailbox.
+# Each message is claimed through a lease row in SQLite on the shared disk;
+# a lease left behind by a crashed worker expires and is reclaimed.
+LEASE_DB_PATH   = "/mnt/data/askian_leases.db"
+EMAIL_LEASE_TTL = int(os.environ.get("EMAIL_LEASE_TTL", 600))   # seconds
+WORKER_ID       = f"{socket.gethostname()}-{os.getpid()}"
+ASKIAN_ROLE     = os.environ.get("ASKIAN_ROLE", "all")          # "all" | "email" (extra inbox workers)
+
 # ============================================================
 # LOGGING
 # ============================================================
@@ -773,20 +808,190 @@ PERSONAS = {
     },
 }
 
+# ============================================================
+# OUTBOUND HTTP
+# ============================================================
+# Every call to a model API, X, NewsAPI, RSS feeds or GitHub goes through
+# http_request(), which sends it on a requests.Session kept per host
+# (scheme://host:port) with its own urllib3 pool, so repeat calls reuse an
+# open TCP+TLS connection instead of handshaking again. Sessions are shared
+# across threads: the adapters' pools are thread-safe and the cookie jar is
+# disabled so no per-call state lives on the session. A new connection's
+# connect() (TCP + TLS handshake) is timed, which gives the per-host
+# handshake cost and, with the reuse count, the latency saved.
+
+HTTP_POOL_SIZE       = int(os.environ.get("HTTP_POOL_SIZE", EMAIL_WORKERS + 8))  # per host: email workers, Mind, Flask, background loops
+HTTP_CONNECT_TIMEOUT = 5     # seconds to establish a connection
+HTTP_READ_TIMEOUT    = 30    # default seconds to wait for a response
+
+_http_sessions      = {}   # "scheme://host:port" → requests.Session
+_http_sessions_lock = threading.Lock()
+_http_host_stats    = {}   # "scheme://host:port" → counters
+
+def _http_host(url):
+    parts = urlsplit(url)
+    port  = parts.port or (443 if parts.scheme == "https" else 80)
+    return f"{parts.scheme}://{parts.hostname}:{port}"
+
+def http_session(url):
+    """The pooled session for url's host, created on first use."""
+    host = _http_host(url)
+    with _http_sessions_lock:
+        session = _http_sessions.get(host)
+        if session is None:
+            import requests as req
+            from requests.adapters import HTTPAdapter
+            from http.cookiejar import DefaultCookiePolicy
+            session = req.Session()
+            session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=HTTP_POOL_SIZE)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _http_sessions[host] = session
+            _http_host_stats[host] = {"calls": 0, "errors": 0, "connections": 0, "handshake_ms": 0.0}
+        return session
+
+def _http_time_connects(session, url):
+    """Wrap the host pool's connection factory once so every new connection's connect() is timed."""
+    adapter = session.get_adapter(url)
+    pool    = adapter.get_connection(url)
+    if getattr(pool, "_askian_timed", False):
+        return
+    stats    = _http_host_stats[_http_host(url)]
+    new_conn = pool._new_conn
+
+    def timed_new_conn():
+        conn    = new_conn()
+        connect = conn.connect
+
+        def timed_connect():
+            started = time.perf_counter()
+            connect()
+            stats["connections"]  += 1
+            stats["handshake_ms"] += (time.perf_counter() - started) * 1000
+        conn.connect = timed_connect
+        return conn
+    pool._new_conn     = timed_new_conn
+    pool._askian_timed = True
+
+def http_request(method, url, timeout=None, **kwargs):
+    """
+    Send a request on the pooled session for url's host. timeout defaults to
+    (HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT); a bare number sets the read
+    timeout only. Other keyword arguments are passed to requests as usual.
+    """
+    session = http_session(url)
+    stats   = _http_host_stats[_http_host(url)]
+    try:
+        _http_time_connects(session, url)
+    except Exception as e:
+        logging.debug(f"[HTTP] Handshake timing unavailable for {url}: {e}")
+    if timeout is None:
+        timeout = (HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT)
+    elif isinstance(timeout, (int, float)):
+        timeout = (HTTP_CONNECT_TIMEOUT, timeout)
+    stats["calls"] += 1
+    try:
+        return session.request(method, url, timeout=timeout, **kwargs)
+    except Exception:
+        stats["errors"] += 1
+        raise
+
+def http_get(url, **kwargs):
+    return http_request("GET", url, **kwargs)
+
+def http_post(url, **kwargs):
+    return http_request("POST", url, **kwargs)
+
+def http_put(url, **kwargs):
+    return http_request("PUT", url, **kwargs)
+
+def http_pool_stats():
+    """Per host: calls, new connections, mean handshake and the handshake time saved by reuse."""
+    out = {}
+    for host, s in list(_http_host_stats.items()):
+        mean   = s["handshake_ms"] / s["connections"] if s["connections"] else 0.0
+        reused = max(0, s["calls"] - s["connections"])
+        out[host] = {"calls": s["calls"], "errors": s["errors"], "connections": s["connections"],
+                     "reused": reused, "mean_handshake_ms": round(mean, 1),
+                     "saved_ms_per_call": round(mean * reused / s["calls"], 1) if s["calls"] else 0.0,
+                     "saved_ms_total": round(mean * reused)}
+    return out
+
 # ============================================================
 # STATE MANAGEMENT
 # ============================================================
 
+# ── JSON store cache ─────────────────────────────────────────
+# Read-through cache for the JSON files under /mnt/data. A cached value is
+# reused while the file's (mtime_ns, size, inode) is unchanged, so repeated
+# reads cost one stat(). Writers replace files or call json_cache_invalidate,
+# and other processes' writes show up as a changed signature.
+
+_json_cache       = {}   # (path, kind) → (signature, value)
+_json_cache_lock  = threading.Lock()
+_json_cache_stats = {"hits": 0, "misses": 0, "invalidations": 0}
+
+def cached_file(path, build, kind="json"):
+    """
+    Return build()'s value for path, rebuilding only when the file changes.
+    The value is shared between callers and must not be mutated.
+    Raises FileNotFoundError if path does not exist.
+    """
+    st  = os.stat(path)
+    sig = (st.st_mtime_ns, st.st_size, st.st_ino)
+    key = (path, kind)
+    with _json_cache_lock:
+        hit = _json_cache.get(key)
+        if hit and hit[0] == sig:
+            _json_cache_stats["hits"] += 1
+            return hit[1]
+        _json_cache_stats["misses"] += 1
+    # Signature was taken before reading, so a write racing this build
+    # leaves a stale signature behind and the next call rebuilds.
+    value = build()
+    with _json_cache_lock:
+        _json_cache[key] = (sig, value)
+    return value
+
+def _read_json_file(path):
+    with open(path, "r") as f:
+        return json.load(f)
+
+def json_cache_read(path, default=None, readonly=False):
+    """
+    Parsed JSON at path, or default if the file is missing.
+    readonly=True returns the shared cached snapshot; otherwise a private
+    deep copy the caller may mutate and save.
+    """
+    try:
+        value = cached_file(path, lambda: _read_json_file(path))
+    except FileNotFoundError:
+        return default
+    return value if readonly else copy.deepcopy(value)
+
+def json_cache_invalidate(path):
+    with _json_cache_lock:
+        for key in [k for k in _json_cache if k[0] == path]:
+            del _json_cache[key]
+        _json_cache_stats["invalidations"] += 1
+
+def json_cache_stats():
+    with _json_cache_lock:
+        return dict(_json_cache_stats, entries=len(_json_cache))
+
 def load_state():
     """Load replied message IDs, rate limit state, and conversation histories."""
     if os.path.exists(STATE_FILE):
         with open(STATE_FILE, "r") as f:
             state = json.load(f)
-            # Ensure conversations key exists
+            # Ensure conversations and thread index keys exist
             if "conversations" not in state:
                 state["conversations"] = {}
+            if "threads" not in state:
+                state["threads"] = {}
             return state
-    return {"replied_ids": [], "reply_log": [], "conversations": {}}
+    return {"replied_ids": [], "reply_log": [], "conversations": {}, "threads": {}}
 
 def save_state(state):
     """Save state to disk."""
@@ -797,8 +1002,30 @@ def save_state(state):
     state["reply_log"] = [r for r in state["reply_log"] if r["time"] > cutoff]
     # Prune old conversation histories (older than 6 months)
     prune_old_conversations(state, days=180)
-    with open(STATE_FILE, "w") as f:
+    prune_thread_index(state)
+    # Write-then-rename so other worker processes never read a half-written file
+    tmp = f"{STATE_FILE}.{os.getpid()}.tmp"
+    with open(tmp, "w") as f:
         json.dump(state, f, indent=2)
+    os.replace(tmp, STATE_FILE)
+
+_state_lock = threading.RLock()
+
+@contextmanager
+def state_transaction():
+    """
+    Load state, yield it for mutation, save it on exit.
+    Email workers run concurrently — as threads here and possibly as other
+    processes on the shared disk — so every write goes through here.
+    """
+    with _state_lock, open(STATE_FILE + ".lock", "a") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            state = load_state()
+            yield state
+            save_state(state)
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
 
 def check_rate_limit(state, sender_addr):
     """Check if we've hit rate limits. Returns True if OK to send."""
@@ -936,17 +1163,76 @@ def should_skip(msg, state):
 # DEEPSEEK API
 # ============================================================
 
-def get_conversation_history(state, user_email, persona_key, max_exchanges=3):
-    """Get recent conversation history for this user with this character."""
+def get_conversation_history(state, user_email, persona_key, max_exchanges=3, thread=None):
+    """
+    Get conversation history for this user with this character.
+    If `thread` (from resolve_thread) points at one of this sender's own
+    exchanges with this character, return the history up to and including
+    that exchange; otherwise the sender's most recent exchanges. A thread
+    belonging to someone else (forwarded mail, a quoted header) is ignored.
+    """
     conversations = state.get("conversations", {})
+
+    if thread_matches(thread, user_email, persona_key):
+        thread_history = conversations.get(user_email, {}).get(persona_key, [])
+        for i, exchange in enumerate(thread_history):
+            if exchange.get("message_id") == thread["exchange"]:
+                return thread_history[max(0, i + 1 - max_exchanges):i + 1]
+
     user_convos = conversations.get(user_email, {})
     character_history = user_convos.get(persona_key, [])
     
     # Return only the most recent exchanges
     return character_history[-max_exchanges:] if character_history else []
 
-def save_conversation_exchange(state, user_email, persona_key, user_message, character_reply, max_history=5):
-    """Save this exchange to conversation history."""
+def thread_ids_from_message(msg):
+    """Message-IDs an email replies to, nearest first: In-Reply-To, then References newest→oldest."""
+    ids = re.findall(r"<[^<>]+>", msg.get("In-Reply-To", "") or "")
+    ids += re.findall(r"<[^<>]+>", msg.get("References", "") or "")[::-1]
+    seen = set()
+    return [i for i in ids if not (i in seen or seen.add(i))]
+
+def thread_matches(thread, user_email, persona_key):
+    """True if a resolved thread is this sender's exchange with this character."""
+    return bool(thread) and thread.get("user") == user_email and thread.get("persona") == persona_key
+
+def resolve_thread(state, msg):
+    """
+    Find the exchange an incoming email belongs to via its threading headers.
+    Returns {"user", "persona", "exchange"} or None. One dict lookup per header ID.
+    """
+    threads = state.get("threads", {})
+    for message_id in thread_ids_from_message(msg):
+        hit = threads.get(message_id)
+        if hit:
+            return hit
+    return None
+
+def index_thread(state, user_email, persona_key, exchange_id, *message_ids):
+    """Map each Message-ID (their letter, our reply) to the stored exchange."""
+    threads = state.setdefault("threads", {})
+    for message_id in message_ids:
+        if message_id:
+            threads[message_id] = {"user": user_email, "persona": persona_key, "exchange": exchange_id}
+
+def prune_thread_index(state):
+    """Drop index entries whose exchange has aged out of conversation history."""
+    live = set()
+    for user_convos in state.get("conversations", {}).values():
+        for history in user_convos.values():
+            live.update(ex["message_id"] for ex in history if ex.get("message_id"))
+    threads = state.get("threads", {})
+    for message_id in [m for m, t in threads.items() if t["exchange"] not in live]:
+        del threads[message_id]
+
+def save_conversation_exchange(state, user_email, persona_key, user_message, character_reply,
+                               max_history=5, message_id="", in_reply_to="", timestamp=None):
+    """
+    Save this exchange to conversation history.
+    `message_id` is our reply's Message-ID and `in_reply_to` theirs; both are
+    added to the thread index so later replies resolve to this exchange.
+    `timestamp` is given by the mailbox backfill for historical exchanges.
+    """
     if "conversations" not in state:
         state["conversations"] = {}
     if user_email not in state["conversations"]:
@@ -954,13 +1240,25 @@ def save_conversation_exchange(state, user_email, persona_key, user_message, cha
     if persona_key not in state["conversations"][user_email]:
         state["conversations"][user_email][persona_key] = []
     
+    history = state["conversations"][user_email][persona_key]
+    if message_id and any(ex.get("message_id") == message_id for ex in history):
+        return
+
     # Add new exchange
     exchange = {
-        "timestamp": datetime.utcnow().isoformat(),
+        "timestamp": timestamp or datetime.utcnow().isoformat(),
         "user_message": user_message[:500],  # Truncate to save space
         "character_reply": character_reply[:1000]
     }
-    state["conversations"][user_email][persona_key].append(exchange)
+    if message_id:
+        exchange["message_id"] = message_id
+        if in_reply_to:
+            exchange["in_reply_to"] = in_reply_to
+        index_thread(state, user_email, persona_key, message_id, message_id, in_reply_to)
+    history.append(exchange)
+    if timestamp:
+        # Backfilled exchanges can be older than ones already stored
+        history.sort(key=lambda ex: ex.get("timestamp", ""))
     
     # Keep only last N exchanges per character
     state["conversations"][user_email][persona_key] = \
@@ -987,8 +1285,6 @@ def prune_old_conversations(state, days=180):
 
 def generate_reply(email_body, persona_key, persona, conversation_history=None):
     """Generate a reply using DeepSeek API."""
-    import requests
-
     if not is_appropriate(email_body):
         logging.warning("Email failed content filter — sending polite decline.")
         return (
@@ -1007,7 +1303,7 @@ def generate_reply(email_body, persona_key, persona, conversation_history=None):
                 history_context += f"You replied: {exchange['character_reply'][:300]}\n\n"
             history_context += "---\n\n"
         
-        response = requests.post(
+        response = http_post(
             "https://api.deepseek.com/v1/chat/completions",
             headers={
                 "Authorization": f"Bearer {DEEPSEEK_API_KEY}",
@@ -1051,7 +1347,10 @@ def generate_reply(email_body, persona_key, persona, conversation_history=None):
         )
 
 def send_reply(to_address, subject, body, original_msg, persona):
-    """Send reply with proper headers to prevent loops."""
+    """
+    Send reply with proper headers to prevent loops.
+    Returns the reply's Message-ID on success, None on failure.
+    """
     try:
         msg = MIMEText(body)
 
@@ -1064,13 +1363,15 @@ def send_reply(to_address, subject, body, original_msg, persona):
         msg["From"] = f"{persona['name']} <{persona['email']}>"
         msg["To"] = to_address
         msg["Date"] = formatdate(localtime=True)
-        msg["Message-ID"] = make_msgid(domain="askian.net")
+        reply_message_id = make_msgid(domain="askian.net")
+        msg["Message-ID"] = reply_message_id
 
-        # Threading headers — links reply to original
+        # Threading headers — links reply to original, keeping the chain
         original_message_id = original_msg.get("Message-ID", "")
         if original_message_id:
             msg["In-Reply-To"] = original_message_id
-            msg["References"] = original_message_id
+            references = " ".join(thread_ids_from_message(original_msg)[::-1][-9:] + [original_message_id])
+            msg["References"] = references
 
         # Anti-loop headers
         msg["Auto-Submitted"] = "auto-replied"
@@ -1083,19 +1384,22 @@ def send_reply(to_address, subject, body, original_msg, persona):
             server.sendmail(persona["email"], [to_address], msg.as_string())
 
         logging.info(f"Reply sent to {to_address} as {persona['name']} <{persona['email']}> — Subject: \"{subject}\"")
-        return True
+        return reply_message_id
 
     except Exception as e:
         logging.error(f"Failed to send reply to {to_address}: {e}")
-        return False
+        return None
 
 # ============================================================
 # MAIN FETCH & REPLY LOOP
 # ============================================================
 
-def _handle_consilium_reply(sender_name, sender_addr, subject, body, original_msg, message_id, state):
+def _handle_consilium_reply(sender_name, sender_addr, subject, body, original_msg, message_id, state,
+                            still_held=None):
     """
     Full cycle handler for emails received at consilium@askian.net.
+    still_held(), if given, is checked just before sending; when it returns
+    False the reply is abandoned and the handler returns False.
 
     1. Log the inbound email to the Consilium record.
     2. Broadcast to all four models: read the record + the reply, deliberate.
@@ -1103,8 +1407,6 @@ def _handle_consilium_reply(sender_name, sender_addr, subject, body, original_ms
     4. Run through AI team review.
     5. Send from consilium@askian.net, maintaining thread.
     """
-    import requests as req
-
     logging.info(f"Consilium reply handler: {sender_name} <{sender_addr}>")
 
     # ── 1. Log inbound to Consilium ──────────────────────────────────
@@ -1170,7 +1472,7 @@ def _handle_consilium_reply(sender_name, sender_addr, subject, body, original_ms
     reply_body = None
     if anthropic_key:
         try:
-            r = req.post(
+            r = http_post(
                 "https://api.anthropic.com/v1/messages",
                 headers={
                     "x-api-key": anthropic_key,
@@ -1212,6 +1514,9 @@ def _handle_consilium_reply(sender_name, sender_addr, subject, body, original_ms
         return
 
     # ── 5. Send reply, maintaining thread ────────────────────────────
+    if still_held and not still_held():
+        logging.warning(f"Consilium reply to {sender_addr} abandoned: message lease lost")
+        return False
     full_body = (
         f"Dear {sender_name.split()[0] if sender_name else 'there'},\n\n"
         f"{reply_body}\n\n"
@@ -1250,14 +1555,296 @@ def _handle_consilium_reply(sender_name, sender_addr, subject, body, original_ms
         logging.error(f"Consilium reply send failed: {e}")
 
 
+# ── Message leases (multi-worker partitioning) ───────────────
+
+def _lease_db():
+    db = sqlite3.connect(LEASE_DB_PATH, timeout=30, isolation_level=None)
+    db.execute("CREATE TABLE IF NOT EXISTS leases "
+               "(message_key TEXT PRIMARY KEY, worker TEXT, expires REAL, done INTEGER DEFAULT 0)")
+    return db
+
+
+def claim_lease(message_key):
+    """
+    Try to claim a message for this worker. Returns "claimed", "held"
+    (another live worker has it) or "done" (already handled by someone).
+    An expired, unfinished lease is taken over.
+    """
+    now = time.time()
+    db  = _lease_db()
+    try:
+        db.execute("BEGIN IMMEDIATE")
+        cur = db.execute(
+            "INSERT INTO leases (message_key, worker, expires, done) VALUES (?, ?, ?, 0) "
+            "ON CONFLICT(message_key) DO UPDATE SET worker=excluded.worker, expires=excluded.expires "
+            "WHERE leases.done = 0 AND leases.expires < ?",
+            (message_key, WORKER_ID, now + EMAIL_LEASE_TTL, now))
+        if cur.rowcount == 1:
+            db.execute("COMMIT")
+            return "claimed"
+        row = db.execute("SELECT done FROM leases WHERE message_key=?", (message_key,)).fetchone()
+        db.execute("COMMIT")
+        return "done" if row and row[0] else "held"
+    finally:
+        db.close()
+
+
+def lease_status(message_key):
+    """Without claiming: "done", "held" (a live lease exists) or "free"."""
+    db = _lease_db()
+    try:
+        row = db.execute("SELECT done, expires FROM leases WHERE message_key=?", (message_key,)).fetchone()
+    finally:
+        db.close()
+    if row and row[0]:
+        return "done"
+    return "held" if row and row[1] >= time.time() else "free"
+
+
+def lease_held(message_key):
+    """True while this worker holds a live, unfinished lease on the message."""
+    db = _lease_db()
+    try:
+        row = db.execute("SELECT worker, expires, done FROM leases WHERE message_key=?", (message_key,)).fetchone()
+    finally:
+        db.close()
+    return bool(row) and row[0] == WORKER_ID and row[1] > time.time() and not row[2]
+
+
+def renew_lease(message_key):
+    """Extend this worker's live lease by EMAIL_LEASE_TTL. False if it has expired or been taken over."""
+    now = time.time()
+    db  = _lease_db()
+    try:
+        cur = db.execute("UPDATE leases SET expires=? WHERE message_key=? AND worker=? AND done=0 AND expires > ?",
+                         (now + EMAIL_LEASE_TTL, message_key, WORKER_ID, now))
+        return cur.rowcount == 1
+    finally:
+        db.close()
+
+
+@contextmanager
+def lease_heartbeat(message_key):
+    """Renew the lease every third of EMAIL_LEASE_TTL while the block runs. Yields an Event set once it is lost."""
+    stop, lost = threading.Event(), threading.Event()
+
+    def beat():
+        while not stop.wait(EMAIL_LEASE_TTL / 3):
+            try:
+                if not renew_lease(message_key):
+                    lost.set()
+                    return
+            except Exception as e:
+                logging.warning(f"  Lease renewal failed for {message_key}: {e}")
+    threading.Thread(target=beat, daemon=True).start()
+    try:
+        yield lost
+    finally:
+        stop.set()
+
+
+def complete_lease(message_key):
+    """Mark a claimed message as handled — it will never be claimed again."""
+    db = _lease_db()
+    try:
+        db.execute("UPDATE leases SET done=1, expires=? WHERE message_key=? AND worker=?",
+                   (time.time(), message_key, WORKER_ID))
+        # Finished leases only need to outlive the message being UNSEEN
+        db.execute("DELETE FROM leases WHERE done=1 AND expires < ?", (time.time() - 7 * 86400,))
+    finally:
+        db.close()
+
+
+# Handled UIDs waiting to be flagged \Seen by the poll loop's IMAP connection
+_email_seen_lock  = threading.Lock()
+_email_seen_queue = []
+
+
+def _finish_message(message_key, uid):
+    complete_lease(message_key)
+    with _email_seen_lock:
+        _email_seen_queue.append(uid)
+
+
+# ── Email pipeline (bounded in-flight) ───────────────────────
+
+_email_pool  = ThreadPoolExecutor(max_workers=EMAIL_WORKERS, thread_name_prefix="email")
+_email_queued      = set()   # lease keys queued or running in this process
+_email_queued_lock = threading.Lock()
+_email_slots = threading.BoundedSemaphore(EMAIL_MAX_IN_FLIGHT)
+_email_stats_lock = threading.Lock()
+_email_stats = {
+    "in_flight": 0,    # admitted, not yet finished (queued + running)
+    "running":   0,
+    "admitted":  0,
+    "deferred":  0,    # left UNSEEN because the pipeline was full
+    "lease_held": 0,   # already leased — in flight here or on another worker
+    "lease_lost": 0,   # lease expired or taken over mid-job; abandoned unsent
+    "completed": 0,
+    "failed":    0,
+    "last_cycle": None,
+}
+
+
+def email_pipeline_stats():
+    """Snapshot of admission decisions and queue depth."""
+    with _email_stats_lock:
+        stats = dict(_email_stats)
+    stats["queued"]       = stats["in_flight"] - stats["running"]
+    stats["max_in_flight"] = EMAIL_MAX_IN_FLIGHT
+    stats["workers"]      = EMAIL_WORKERS
+    return stats
+
+
+def _email_stat(key, delta=1):
+    with _email_stats_lock:
+        _email_stats[key] += delta
+
+
+def _process_email(uid, lease_key, msg, actual_sender, actual_name, subject, message_id):
+    """
+    Worker body for one queued email. The lease is claimed when the job
+    leaves the queue and renewed by a heartbeat while it runs; a job that
+    loses its lease stops without replying and leaves the message to the
+    worker that took it over.
+    """
+    _email_stat("running")
+    held = False
+    try:
+        lease = claim_lease(lease_key)
+        if lease != "claimed":
+            _email_stat("lease_held")
+            logging.info(f"  UID {uid}: lease {lease} elsewhere at dequeue, dropping")
+            return
+        held = True
+        with lease_heartbeat(lease_key) as lost:
+            held = _reply_to_email(uid, lease_key, lost, msg, actual_sender, actual_name, subject, message_id)
+        if held:
+            _email_stat("completed")
+        else:
+            _email_stat("lease_lost")
+            logging.warning(f"  UID {uid}: lease lost mid-job — abandoned without replying")
+
+    except Exception as e:
+        _email_stat("failed")
+        logging.error(f"Email worker error on UID {uid}: {e}")
+
+    finally:
+        # One attempt per message, as before: a failed send is not retried.
+        # Only a worker that dies mid-job leaves its lease to expire.
+        if held:
+            _finish_message(lease_key, uid)
+        with _email_queued_lock:
+            _email_queued.discard(lease_key)
+        _email_stat("running", -1)
+        _email_stat("in_flight", -1)
+        _email_slots.release()
+
+
+def _reply_to_email(uid, lease_key, lost, msg, actual_sender, actual_name, subject, message_id):
+    """Persona routing, generation and sending. Returns False if the lease was lost before sending."""
+    # Re-check against fresh state — other workers may have replied meanwhile
+    if not check_rate_limit(load_state(), actual_sender):
+        logging.info(f"  UID {uid}: rate limit reached before reply, dropping")
+        return True
+
+    # --- DETERMINE PERSONA ---
+    persona_key, persona = get_persona_from_recipient(msg)
+
+    # ── CONSILIUM EMAIL HANDLER ───────────────────────────────
+    # Emails to consilium@askian.net are handled separately —
+    # logged to the Consilium record and processed by the full
+    # AI team as one mind, not routed to a Cast character.
+    if persona_key == "askian" and "consilium" in msg.get("To", "").lower():
+        body = get_email_body(msg)
+        if not body.strip():
+            logging.info(f"  Consilium reply: empty body, skipping")
+            return True
+        sender_display = actual_name if actual_name else actual_sender
+        logging.info(f"  Routing to Consilium handler — from {sender_display}")
+        still_held = lambda: not lost.is_set() and lease_held(lease_key)
+        if not still_held():
+            return False
+        sent = _handle_consilium_reply(
+            sender_name=sender_display,
+            sender_addr=actual_sender,
+            subject=subject,
+            body=body,
+            original_msg=msg,
+            message_id=message_id,
+            state=load_state(),
+            still_held=still_held
+        )
+        if sent is False:
+            return False
+        with state_transaction() as state:
+            log_reply(state, actual_sender, message_id)
+        return True
+    # ─────────────────────────────────────────────────────────
+
+    logging.info(f"  UID {uid} persona: {persona['name']} ({persona['email']})")
+
+    # --- GENERATE & SEND ---
+    body = get_email_body(msg)
+    if not body.strip():
+        logging.info(f"  Skipping: empty email body")
+        return True
+
+    # Get conversation history for this user and character — the exact
+    # thread if the threading headers resolve, else the latest exchanges
+    state = load_state()
+    thread = resolve_thread(state, msg)
+    conversation_history = get_conversation_history(state, actual_sender, persona_key, thread=thread)
+    if conversation_history:
+        via = "thread" if thread_matches(thread, actual_sender, persona_key) else "recent"
+        logging.info(f"  Loaded {len(conversation_history)} previous exchange(s) with {persona_key} ({via})")
+    else:
+        logging.info(f"  No previous conversation history with {persona_key}")
+
+    reply_text = generate_reply(body, persona_key, persona, conversation_history)
+    # Generation can be slow: never send unless the lease is still ours
+    if lost.is_set() or not lease_held(lease_key):
+        return False
+    reply_message_id = send_reply(actual_sender, subject, reply_text, msg, persona)
+
+    if reply_message_id:
+        # Persist reply log and conversation history immediately
+        with state_transaction() as state:
+            log_reply(state, actual_sender, message_id)
+            save_conversation_exchange(state, actual_sender, persona_key, body, reply_text,
+                                       message_id=reply_message_id, in_reply_to=message_id)
+        logging.info(f"  Saved conversation exchange to history")
+
+    # Small delay between replies
+    time.sleep(2)
+    return True
+
+
 def fetch_and_reply():
-    """Check for unseen emails and reply to them."""
+    """
+    Check for unseen emails and hand them to the worker pool.
+
+    An email is only queued when a pipeline slot is free and no live lease
+    exists; the worker claims the lease when it dequeues the job. Once all EMAIL_MAX_IN_FLIGHT slots are taken the
+    remaining UIDs are left UNSEEN for the next poll. Messages are read
+    with BODY.PEEK[] and flagged \\Seen only after they have been handled,
+    so a crashed worker's mail is still UNSEEN when its lease expires.
+    """
     state = load_state()
 
     try:
         mail = imaplib.IMAP4_SSL(IMAP_SERVER)
         mail.login(EMAIL_ACCOUNT, EMAIL_PASSWORD)
         mail.select("inbox")
+        uidvalidity = (mail.response("UIDVALIDITY")[1] or [b""])[0]
+        uidvalidity = uidvalidity.decode() if isinstance(uidvalidity, bytes) else str(uidvalidity or "")
+
+        # Flag mail handled since the last poll
+        with _email_seen_lock:
+            handled = _email_seen_queue[:]
+            del _email_seen_queue[:]
+        for done_uid in handled:
+            mail.uid("store", done_uid, "+FLAGS", "(\\Seen)")
 
         result, data = mail.uid("search", None, "UNSEEN")
         if result != "OK":
@@ -1265,116 +1852,242 @@ def fetch_and_reply():
             return
 
         uids = data[0].split()
+        with _email_stats_lock:
+            _email_stats["last_cycle"] = datetime.utcnow().isoformat() + "Z"
         if not uids:
             logging.info("No unseen emails.")
             mail.logout()
             return
 
-        logging.info(f"Found {len(uids)} unseen email(s)")
+        stats = email_pipeline_stats()
+        logging.info(f"Found {len(uids)} unseen email(s) — pipeline {stats['in_flight']}/{EMAIL_MAX_IN_FLIGHT} in flight")
 
-        for uid in uids:
-            result, msg_data = mail.uid("fetch", uid, "(RFC822)")
-            if result != "OK":
-                logging.error(f"Failed to fetch UID {uid}")
-                continue
+        for i, uid in enumerate(uids):
+            # --- ADMISSION ---
+            if not _email_slots.acquire(blocking=False):
+                deferred = len(uids) - i
+                _email_stat("deferred", deferred)
+                logging.info(f"  Pipeline full ({EMAIL_MAX_IN_FLIGHT} in flight) — leaving {deferred} email(s) unread for next cycle")
+                break
 
-            raw_email = msg_data[0][1]
-            msg = email.message_from_bytes(raw_email)
+            submitted = False
+            lease_key = f"inbox:{uidvalidity}:{uid.decode()}"
+            try:
+                # Only look at the lease here: it is claimed when the job is dequeued
+                with _email_queued_lock:
+                    queued = lease_key in _email_queued
+                lease = "held" if queued else lease_status(lease_key)
+                if lease == "held":
+                    _email_stat("lease_held")
+                    continue
+                if lease == "done":
+                    mail.uid("store", uid, "+FLAGS", "(\\Seen)")
+                    continue
 
-            from_name, from_addr = parseaddr(msg.get("From", ""))
-            reply_to_name, reply_to_addr = parseaddr(msg.get("Reply-To", ""))
-            subject = msg.get("Subject", "(no subject)")
-            message_id = msg.get("Message-ID", "")
-            
-            # Use Reply-To as actual sender if present (compose form emails)
-            actual_sender = reply_to_addr if reply_to_addr else from_addr
-            actual_name = reply_to_name if reply_to_name else from_name
+                result, msg_data = mail.uid("fetch", uid, "(BODY.PEEK[])")
+                if result != "OK":
+                    logging.error(f"Failed to fetch UID {uid}")
+                    continue
 
-            logging.info(f"Processing UID {uid.decode()} — From: {from_addr}, Subject: {subject}")
+                raw_email = msg_data[0][1]
+                msg = email.message_from_bytes(raw_email)
 
-            # --- SAFETY CHECKS ---
-            skip, reason = should_skip(msg, state)
-            if skip:
-                logging.info(f"  Skipping: {reason}")
-                continue
+                from_name, from_addr = parseaddr(msg.get("From", ""))
+                reply_to_name, reply_to_addr = parseaddr(msg.get("Reply-To", ""))
+                subject = msg.get("Subject", "(no subject)")
+                message_id = msg.get("Message-ID", "")
 
-            if not check_rate_limit(state, actual_sender):
-                logging.info(f"  Skipping: rate limit reached")
-                continue
+                # Use Reply-To as actual sender if present (compose form emails)
+                actual_sender = reply_to_addr if reply_to_addr else from_addr
+                actual_name = reply_to_name if reply_to_name else from_name
 
-            # --- DETERMINE PERSONA ---
-            persona_key, persona = get_persona_from_recipient(msg)
-
-            # ── CONSILIUM EMAIL HANDLER ───────────────────────────────
-            # Emails to consilium@askian.net are handled separately —
-            # logged to the Consilium record and processed by the full
-            # AI team as one mind, not routed to a Cast character.
-            if persona_key == "askian" and "consilium" in msg.get("To", "").lower():
-                body = get_email_body(msg)
-                if not body.strip():
-                    logging.info(f"  Consilium reply: empty body, skipping")
+                logging.info(f"Processing UID {uid.decode()} — From: {from_addr}, Subject: {subject}")
+
+                # --- SAFETY CHECKS ---
+                skip, reason = should_skip(msg, state)
+                if skip or not check_rate_limit(state, actual_sender):
+                    logging.info(f"  Skipping: {reason if skip else 'rate limit reached'}")
+                    if claim_lease(lease_key) == "claimed":
+                        complete_lease(lease_key)
+                        mail.uid("store", uid, "+FLAGS", "(\\Seen)")
                     continue
-                sender_display = actual_name if actual_name else actual_sender
-                logging.info(f"  Routing to Consilium handler — from {sender_display}")
-                _handle_consilium_reply(
-                    sender_name=sender_display,
-                    sender_addr=actual_sender,
-                    subject=subject,
-                    body=body,
-                    original_msg=msg,
-                    message_id=message_id,
-                    state=state
-                )
-                log_reply(state, actual_sender, message_id)
-                continue
-            # ─────────────────────────────────────────────────────────
 
-            logging.info(f"  Persona: {persona['name']} ({persona['email']})")
+                _email_stat("admitted")
+                _email_stat("in_flight")
+                with _email_queued_lock:
+                    _email_queued.add(lease_key)
+                _email_pool.submit(_process_email, uid.decode(), lease_key, msg, actual_sender,
+                                   actual_name, subject, message_id)
+                submitted = True
+            finally:
+                if not submitted:
+                    _email_slots.release()
 
-            # --- GENERATE & SEND ---
-            body = get_email_body(msg)
-            if not body.strip():
-                logging.info(f"  Skipping: empty email body")
-                continue
+        mail.logout()
 
-            # Get conversation history for this user and character
-            conversation_history = get_conversation_history(state, actual_sender, persona_key)
-            if conversation_history:
-                logging.info(f"  Loaded {len(conversation_history)} previous exchange(s) with {persona_key}")
-            else:
-                logging.info(f"  No previous conversation history with {persona_key}")
-            
-            reply_text = generate_reply(body, persona_key, persona, conversation_history)
-            success = send_reply(actual_sender, subject, reply_text, msg, persona)
+    except Exception as e:
+        logging.error(f"General error: {e}")
 
-            if success:
-                log_reply(state, actual_sender, message_id)
-                # Save this exchange to conversation history
-                save_conversation_exchange(state, actual_sender, persona_key, body, reply_text)
-                logging.info(f"  Saved conversation exchange to history")
-                save_state(state)  # Persist conversation history immediately
 
-            # Small delay between replies
-            time.sleep(2)
+# ── Mailbox backfill ─────────────────────────────────────────
+# One-shot: python askian_v4.py backfill [--reset]
+# Seeds conversation histories from letters in INBOX and our replies in
+# Sent. Streams both folders in UID-ranged batches (read-only, nothing is
+# marked \Seen). Inbound letters are parked in SQLite on disk so memory
+# stays bounded by the batch size, and a per-folder UID checkpoint makes
+# the run resumable.
 
-        mail.logout()
+BACKFILL_DB_PATH     = "/mnt/data/askian_backfill.db"
+BACKFILL_SENT_FOLDER = os.environ.get("BACKFILL_SENT_FOLDER", "Sent")
+BACKFILL_BATCH       = int(os.environ.get("BACKFILL_BATCH", 200))
+BACKFILL_DAYS        = 180   # matches prune_old_conversations — older mail would be pruned on save
 
-    except Exception as e:
-        logging.error(f"General error: {e}")
 
-    finally:
-        save_state(state)
+def _backfill_db(reset=False):
+    if reset and os.path.exists(BACKFILL_DB_PATH):
+        os.remove(BACKFILL_DB_PATH)
+    db = sqlite3.connect(BACKFILL_DB_PATH)
+    db.execute("CREATE TABLE IF NOT EXISTS letters (message_id TEXT PRIMARY KEY, sender TEXT, body TEXT, date TEXT)")
+    db.execute("CREATE TABLE IF NOT EXISTS checkpoint (folder TEXT PRIMARY KEY, uidvalidity TEXT, last_uid INTEGER)")
+    return db
+
+
+def _backfill_date(msg):
+    """Email Date header as naive UTC isoformat (the conversation store's format)."""
+    try:
+        dt = parsedate_to_datetime(msg.get("Date", ""))
+        if dt.tzinfo:
+            dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+        return dt.isoformat()
+    except Exception:
+        return ""
+
+
+def _backfill_batches(mail, db, folder):
+    """
+    Yield lists of (uid, message) for a folder in UID order, starting after
+    the stored checkpoint. The checkpoint is committed once the caller
+    has finished with a batch.
+    """
+    result, _ = mail.select(f'"{folder}"', readonly=True)
+    if result != "OK":
+        logging.error(f"[BACKFILL] Cannot select folder {folder}")
+        return
+    _, status = mail.status(f'"{folder}"', "(UIDNEXT UIDVALIDITY)")
+    fields     = re.findall(r"(UIDNEXT|UIDVALIDITY) (\d+)", status[0].decode())
+    info       = dict(fields)
+    uidnext    = int(info.get("UIDNEXT", 1))
+    validity   = info.get("UIDVALIDITY", "")
+
+    row = db.execute("SELECT uidvalidity, last_uid FROM checkpoint WHERE folder=?", (folder,)).fetchone()
+    last_uid = row[1] if row and row[0] == validity else 0
+    if row and row[0] != validity:
+        logging.warning(f"[BACKFILL] {folder}: UIDVALIDITY changed — restarting folder from UID 1")
+
+    since = (datetime.utcnow() - timedelta(days=BACKFILL_DAYS)).strftime("%d-%b-%Y")
+    lo = last_uid + 1
+    while lo < uidnext:
+        hi = lo + BACKFILL_BATCH - 1
+        result, data = mail.uid("search", None, f"UID {lo}:{hi} SINCE {since}")
+        uids = [u for u in (data[0].split() if result == "OK" else []) if lo <= int(u) <= hi]
+        batch = []
+        if uids:
+            result, msg_data = mail.uid("fetch", b",".join(uids), "(UID BODY.PEEK[])")
+            for part in msg_data if result == "OK" else []:
+                if isinstance(part, tuple):
+                    m = re.search(rb"UID (\d+)", part[0])
+                    if m:
+                        batch.append((int(m.group(1)), email.message_from_bytes(part[1])))
+        yield batch, hi
+        db.execute("INSERT OR REPLACE INTO checkpoint (folder, uidvalidity, last_uid) VALUES (?, ?, ?)",
+                   (folder, validity, hi))
+        db.commit()
+        lo = hi + 1
+
+
+def run_backfill(reset=False):
+    """Stream INBOX letters, then pair Sent replies with them and bulk-load the conversation store."""
+    db      = _backfill_db(reset=reset)
+    started = time.time()
+    seen    = 0
+    paired  = 0
+
+    mail = imaplib.IMAP4_SSL(IMAP_SERVER)
+    mail.login(EMAIL_ACCOUNT, EMAIL_PASSWORD)
+    our_addresses = {EMAIL_ACCOUNT.lower()} | {p["email"].lower() for p in PERSONAS.values()}
+
+    # ── Pass 1: inbound letters → SQLite ─────────────────────
+    for batch, hi in _backfill_batches(mail, db, "INBOX"):
+        rows = []
+        for uid, msg in batch:
+            message_id = msg.get("Message-ID", "")
+            _, from_addr     = parseaddr(msg.get("From", ""))
+            _, reply_to_addr = parseaddr(msg.get("Reply-To", ""))
+            sender = (reply_to_addr or from_addr).lower()
+            if message_id and sender and sender not in our_addresses:
+                rows.append((message_id, sender, get_email_body(msg)[:500], _backfill_date(msg)))
+        db.executemany("INSERT OR IGNORE INTO letters VALUES (?, ?, ?, ?)", rows)
+        seen += len(batch)
+        rate = seen / max(time.time() - started, 0.001)
+        logging.info(f"[BACKFILL] INBOX ≤UID {hi}: {len(batch)} msgs, {len(rows)} letters kept — {seen} total, {rate:.0f} msg/s")
+
+    # ── Pass 2: our replies → pair → conversation store ──────
+    for batch, hi in _backfill_batches(mail, db, BACKFILL_SENT_FOLDER):
+        pairs = []
+        for uid, msg in batch:
+            _, from_addr = parseaddr(msg.get("From", ""))
+            local_part   = from_addr.split("@")[0].lower()
+            if local_part not in PERSONAS:
+                continue
+            for letter_id in thread_ids_from_message(msg)[:1]:
+                letter = db.execute("SELECT sender, body, date FROM letters WHERE message_id=?",
+                                    (letter_id,)).fetchone()
+                if letter:
+                    pairs.append((letter[0], local_part, letter[1], get_email_body(msg),
+                                  msg.get("Message-ID", ""), letter_id, _backfill_date(msg) or letter[2]))
+        if pairs:
+            with state_transaction() as state:
+                for user, persona_key, letter_body, reply_body, reply_id, letter_id, ts in pairs:
+                    save_conversation_exchange(state, user, persona_key, letter_body, reply_body,
+                                               message_id=reply_id, in_reply_to=letter_id, timestamp=ts)
+        seen   += len(batch)
+        paired += len(pairs)
+        rate = seen / max(time.time() - started, 0.001)
+        logging.info(f"[BACKFILL] {BACKFILL_SENT_FOLDER} ≤UID {hi}: {len(batch)} msgs, {len(pairs)} paired — {seen} total, {rate:.0f} msg/s")
+
+    mail.logout()
+    db.close()
+    elapsed = time.time() - started
+    logging.info(f"[BACKFILL] Complete: {seen} messages, {paired} exchanges loaded in {elapsed:.0f}s "
+                 f"({seen / max(elapsed, 0.001):.0f} msg/s)")
+    return {"messages": seen, "paired": paired, "seconds": round(elapsed, 1)}
+
 
 # ============================================================
 # CONSILIUM — Persistent AI Ethical Memory API
 # ============================================================
 
-CONSILIUM_PATH    = "/mnt/data/consilium.json"
+CONSILIUM_PATH    = "/mnt/data/consilium.json"   # legacy single-file record (migrated on first use)
+CONSILIUM_DIR     = "/mnt/data/consilium"
+CONSILIUM_SEGMENT_SIZE = int(os.environ.get("CONSILIUM_SEGMENT_SIZE", 1000))  # entries per segment
 CONSILIUM_KEY     = os.environ.get("CONSILIUM_KEY", "consilium-2026")
 MIND_STATE_PATH   = "/mnt/data/consilium_mind.json"
 MIND_INTERVAL     = int(os.environ.get("MIND_INTERVAL", 86400))
 DIGEST_CACHE_PATH = "/mnt/data/consilium_digest_cache.json"
 
+# How query_model grounds a question: "recent" sends the last 50 entries;
+# "relevant" retrieves the entries that best match the question plus a short
+# recency tail, fitted to a per-provider token budget (~4 chars per token).
+CONSILIUM_CONTEXT_MODE = os.environ.get("CONSILIUM_CONTEXT_MODE", "recent")
+CONTEXT_TOKEN_BUDGETS  = {"claude": 6000, "gpt4o": 6000, "grok": 6000, "deepseek": 4000}
+CONTEXT_RECENT_TAIL    = 5
+
+ROLLUP_PATH               = "/mnt/data/consilium_rollups.json"
+ROLLUP_LOG_PATH           = "/mnt/data/consilium_rollups.log"
+ROLLUP_COMPACT_LINES      = 500   # fold the change log into the snapshot past this many lines
+ROLLUP_INTERVAL           = int(os.environ.get("ROLLUP_INTERVAL", 3600))
+ROLLUP_SESSION_IDLE_HOURS = 2     # a session with no entries for this long is closed
+
 CONSILIUM_MODELS = {
     "grok":     {"url": "https://api.x.ai/v1/chat/completions",      "model": "grok-3",                   "key": os.environ.get("GROK_API_KEY", "")},
     "deepseek": {"url": "https://api.deepseek.com/chat/completions",  "model": "deepseek-chat",            "key": os.environ.get("DEEPSEEK_API_KEY", "")},
@@ -1386,94 +2099,781 @@ flask_app = Flask(__name__)
 CORS(flask_app)
 
 
+# ── Conditional responses ────────────────────────────────────
+# @conditional(version) wraps a public GET route whose body depends only on
+# some store's version and the query string. The strong ETag is derived
+# from those before the handler runs, so a matching If-None-Match (or an
+# If-Modified-Since no older than the store) is answered 304 without doing
+# the work. Full responses of HTML, JSON or text are compressed with brotli
+# (when the module is installed) or gzip, streamed bodies chunk by chunk;
+# each encoding gets its own ETag suffix, as strong validators require.
+
+HTTP_COMPRESS_MIN   = 1024   # bytes; smaller bodies are sent as they are
+HTTP_COMPRESS_TYPES = ("text/html", "text/plain", "application/json", "application/x-ndjson")
+
+_http_stats = {"not_modified": 0, "full": 0, "gzip": 0, "br": 0, "bytes_in": 0, "bytes_out": 0}
+
+def _brotli():
+    try:
+        import brotli
+        return brotli
+    except ImportError:
+        return None
+
+def file_version(path):
+    """(mtime_ns, size, inode) of path, or None if it does not exist."""
+    try:
+        st = os.stat(path)
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
+    except FileNotFoundError:
+        return None
+
+def file_mtime(*paths):
+    """Newest mtime (epoch seconds) among paths that exist, or None."""
+    times = [v[0] / 1e9 for v in map(file_version, paths) if v]
+    return max(times) if times else None
+
+def dir_version(path):
+    """(files, newest mtime_ns, total size) of a directory's files — changes when any file does."""
+    try:
+        stats = [e.stat() for e in os.scandir(path) if e.is_file()]
+    except FileNotFoundError:
+        return None
+    return (len(stats), max((s.st_mtime_ns for s in stats), default=0), sum(s.st_size for s in stats))
+
+def _http_encoding():
+    """Best content coding the client accepts: br, then gzip, else None."""
+    accepted = {}
+    for part in request.headers.get("Accept-Encoding", "").split(","):
+        name, _, params = part.partition(";")
+        m = re.search(r"q=([0-9.]+)", params)
+        accepted[name.strip().lower()] = float(m.group(1)) if m else 1.0
+    if accepted.get("br", 0) > 0 and _brotli():
+        return "br"
+    if accepted.get("gzip", 0) > 0:
+        return "gzip"
+    return None
+
+def _http_compress_stream(chunks, encoding):
+    if encoding == "br":
+        comp = _brotli().Compressor()
+        push, finish = comp.process, comp.finish
+    else:
+        comp = zlib.compressobj(6, zlib.DEFLATED, 31)
+        push, finish = comp.compress, comp.flush
+    for chunk in chunks:
+        data = chunk.encode("utf-8") if isinstance(chunk, str) else chunk
+        _http_stats["bytes_in"] += len(data)
+        out = push(data)
+        if out:
+            _http_stats["bytes_out"] += len(out)
+            yield out
+    out = finish()
+    _http_stats["bytes_out"] += len(out)
+    yield out
+
+def _http_not_modified(etag, modified):
+    """
+    The ETag to send with a 304 if the client's copy is current, else None.
+    If-None-Match matches the base tag or any encoded variant of it, and the
+    304 repeats the variant the client holds; otherwise (If-Modified-Since
+    or "*") it names the variant for the encoding the client accepts now.
+    """
+    base     = etag.strip('"')
+    variants = [base, f"{base}-gzip", f"{base}-br"]
+    encoding = _http_encoding()
+    current  = f'"{base}-{encoding}"' if encoding else etag
+    inm = request.headers.get("If-None-Match")
+    if inm:
+        tags = [t.strip().removeprefix("W/").strip('"') for t in inm.split(",")]
+        if "*" in tags:
+            return current
+        held = [t for t in tags if t in variants]
+        return f'"{held[0]}"' if held else None
+    ims = request.headers.get("If-Modified-Since")
+    if ims and modified is not None:
+        try:
+            return current if int(modified) <= parsedate_to_datetime(ims).timestamp() else None
+        except (TypeError, ValueError):
+            return None
+    return None
+
+def conditional(version, modified=None, max_age=0):
+    """
+    Decorator: ETag/304 and compression for a GET route.
+    version()  — anything hashable that changes whenever the body would
+    modified() — optional epoch seconds of the last change, for Last-Modified
+    max_age    — seconds clients may reuse the body without revalidating
+    """
+    def wrap(fn):
+        @functools.wraps(fn)
+        def handler(*args, **kwargs):
+            key  = repr((request.path, sorted(request.args.items(multi=True)), version()))
+            etag = '"' + hashlib.sha1(key.encode("utf-8")).hexdigest()[:24] + '"'
+            when = modified() if modified else None
+            cache_control = f"public, max-age={max_age}" + ("" if max_age else ", must-revalidate")
+            held = _http_not_modified(etag, when)
+            if held:
+                _http_stats["not_modified"] += 1
+                resp = Response(status=304)
+                etag = held
+            else:
+                resp = flask_app.make_response(fn(*args, **kwargs))
+                if resp.status_code != 200:
+                    return resp
+                _http_stats["full"] += 1
+                encoding = _http_encoding() if resp.mimetype in HTTP_COMPRESS_TYPES else None
+                if encoding and resp.is_streamed:
+                    resp.response = _http_compress_stream(resp.response, encoding)
+                    resp.headers.pop("Content-Length", None)
+                elif encoding and resp.content_length and resp.content_length >= HTTP_COMPRESS_MIN:
+                    body = resp.get_data()
+                    _http_stats["bytes_in"] += len(body)
+                    body = _brotli().compress(body, quality=5) if encoding == "br" else gzip.compress(body, 6)
+                    _http_stats["bytes_out"] += len(body)
+                    resp.set_data(body)
+                else:
+                    encoding = None
+                if encoding:
+                    resp.headers["Content-Encoding"] = encoding
+                    etag = etag[:-1] + f'-{encoding}"'
+                    _http_stats[encoding] += 1
+            resp.headers["ETag"]          = etag
+            resp.headers["Cache-Control"] = cache_control
+            resp.vary.add("Accept-Encoding")
+            if when is not None:
+                resp.last_modified = datetime.fromtimestamp(int(when), timezone.utc)
+            return resp
+        return handler
+    return wrap
+
+def http_cache_stats():
+    return dict(_http_stats)
+
+
 # ── Storage helpers ──────────────────────────────────────────
 
-def consilium_load():
-    if not os.path.exists(CONSILIUM_PATH):
-        return {"created": datetime.utcnow().isoformat() + "Z", "entries": [], "statement": None}
-    with open(CONSILIUM_PATH, "r") as f:
-        return json.load(f)
+# The record lives in CONSILIUM_DIR as append-only JSONL segments of
+# CONSILIUM_SEGMENT_SIZE entries each (segment-000001.jsonl, ...), plus a small
+# manifest.json holding created, statement, segment_size, next_id and
+# entry_count. Entry N always lives in segment (N-1)//segment_size + 1, so
+# appending touches one segment and the manifest regardless of record size.
+#
+# All writes go through one serialised writer: a thread lock inside the
+# process plus an flock on CONSILIUM_DIR/.lock across worker processes. IDs
+# come from the manifest's next_id counter, never from counting entries.
+#
+# offsets.idx holds one fixed-size record per entry — (segment, byte offset,
+# length) — with entry N at record N-1, so a single entry can be read by
+# mmap-ing the index and seeking straight to it.
+
+_consilium_commit_lock  = threading.RLock()
+_consilium_pending_lock = threading.Lock()
+_consilium_pending      = []
+_CONSILIUM_IDX_RECORD   = struct.Struct("<IQI")   # segment, offset, length — 16 bytes
+_consilium_commit_stats = {"batches": 0, "entries": 0, "max_batch": 0, "last_commit_ms": 0.0, "recovered": 0}
+
+def _consilium_manifest_path():
+    return os.path.join(CONSILIUM_DIR, "manifest.json")
+
+def _consilium_segment_path(n):
+    return os.path.join(CONSILIUM_DIR, f"segment-{n:06d}.jsonl")
+
+def _consilium_index_path():
+    return os.path.join(CONSILIUM_DIR, "offsets.idx")
+
+def _consilium_segment_for(entry_id, manifest):
+    return (entry_id - 1) // manifest["segment_size"] + 1
+
+def _consilium_new_manifest(created=None, statement=None):
+    return {"created": created or datetime.utcnow().isoformat() + "Z",
+            "statement": statement,
+            "segment_size": CONSILIUM_SEGMENT_SIZE,
+            "next_id": 1,
+            "entry_count": 0}
+
+def _atomic_write_json(path, data):
+    """Write JSON to a temp file, fsync it and rename it over path."""
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp, "w") as f:
+        json.dump(data, f, indent=2)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+@contextmanager
+def _consilium_writer():
+    """Exclusive write access to the record, across threads and processes."""
+    with _consilium_commit_lock:
+        os.makedirs(CONSILIUM_DIR, exist_ok=True)
+        with open(os.path.join(CONSILIUM_DIR, ".lock"), "a") as lock_fh:
+            fcntl.flock(lock_fh, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_fh, fcntl.LOCK_UN)
+
+def _consilium_manifest_read():
+    """Read (or migrate into existence) the manifest. Caller holds the writer for migration."""
+    path = _consilium_manifest_path()
+    if os.path.exists(path):
+        # Straight from disk: the writer must never allocate IDs from a cached copy
+        manifest = _read_json_file(path)
+        manifest.setdefault("next_id", manifest["entry_count"] + 1)
+        return manifest
+    if os.path.exists(CONSILIUM_PATH):
+        with open(CONSILIUM_PATH, "r") as f:
+            legacy = json.load(f)
+        manifest = _consilium_write_all(legacy)
+        os.replace(CONSILIUM_PATH, CONSILIUM_PATH + ".migrated")
+        logging.info(f"[CONSILIUM] Migrated {manifest['entry_count']} entries to segment log in {CONSILIUM_DIR}")
+        return manifest
+    return _consilium_new_manifest()
+
+def _consilium_append(manifest, entries):
+    """
+    Write entries (already numbered from manifest["next_id"]) to their
+    segments and index, fsync both. Caller holds the writer and publishes
+    the manifest afterwards.
+    """
+    handles, records = {}, []
+    try:
+        for entry in entries:
+            seg = _consilium_segment_for(entry["id"], manifest)
+            if seg not in handles:
+                handles[seg] = open(_consilium_segment_path(seg), "ab")
+            fh   = handles[seg]
+            line = json.dumps(entry, ensure_ascii=False).encode("utf-8")
+            records.append(_CONSILIUM_IDX_RECORD.pack(seg, fh.tell(), len(line)))
+            fh.write(line + b"\n")
+        for fh in handles.values():
+            fh.flush()
+            os.fsync(fh.fileno())
+    finally:
+        for fh in handles.values():
+            fh.close()
+    with open(_consilium_index_path(), "ab") as idx:
+        idx.write(b"".join(records))
+        idx.flush()
+        os.fsync(idx.fileno())
+
+def _consilium_number(entries):
+    """
+    Entries with their IDs checked for the segment log, which needs IDs
+    1..N in order (offsets.idx is positional). An ID that matches its
+    position is kept and an entry without one gets its position. Where the
+    legacy IDs have gaps or go backwards they cannot be kept: those entries
+    get their position as ID and the old one as legacy_id. Returns
+    (entries, renumbered count).
+    """
+    out, renumbered = [], 0
+    for i, e in enumerate(entries, start=1):
+        if e.get("id") == i:
+            out.append(e)
+        elif e.get("id") is None:
+            out.append(dict(e, id=i))
+        else:
+            out.append(dict(e, id=i, legacy_id=e["id"]))
+            renumbered += 1
+    return out, renumbered
+
+def _consilium_write_all(data):
+    """Rewrite the whole log from a {created, statement, entries} dict. Caller holds the writer."""
+    os.makedirs(CONSILIUM_DIR, exist_ok=True)
+    for name in os.listdir(CONSILIUM_DIR):
+        if (name.startswith("segment-") and name.endswith(".jsonl")) or name == "offsets.idx":
+            os.remove(os.path.join(CONSILIUM_DIR, name))
+    manifest = _consilium_new_manifest(data.get("created"), data.get("statement"))
+    entries, renumbered = _consilium_number(data.get("entries", []))
+    if renumbered:
+        logging.warning(f"[CONSILIUM] {renumbered} entries had gaps or out-of-order IDs and were renumbered "
+                        f"(old ID kept as legacy_id)")
+    _consilium_append(manifest, entries)
+    manifest["next_id"]     = len(entries) + 1
+    manifest["entry_count"] = len(entries)
+    _atomic_write_json(_consilium_manifest_path(), manifest)
+    json_cache_invalidate(_consilium_manifest_path())
+    return manifest
+
+def _consilium_index_sync(manifest, count):
+    """
+    Make offsets.idx hold exactly `count` records. Normally a single stat;
+    after a crash (or on first run over an unindexed log) it trims extra
+    records or rebuilds the missing ones by scanning forward from the last
+    indexed entry.
+    """
+    rec  = _CONSILIUM_IDX_RECORD.size
+    path = _consilium_index_path()
+    size = os.path.getsize(path) if os.path.exists(path) else 0
+    have = size // rec
+    if size == count * rec:
+        return
+    if have >= count:
+        with open(path, "r+b") as idx:
+            idx.truncate(count * rec)
+        return
+    with open(path, "a+b") as idx:
+        idx.truncate(have * rec)
+        seg, offset = _consilium_segment_for(have + 1, manifest), 0
+        if have:
+            idx.seek((have - 1) * rec)
+            prev_seg, prev_off, prev_len = _CONSILIUM_IDX_RECORD.unpack(idx.read(rec))
+            if prev_seg == seg:
+                offset = prev_off + prev_len + 1
+        records, eid = [], have + 1
+        while eid <= count:
+            seg = _consilium_segment_for(eid, manifest)
+            with open(_consilium_segment_path(seg), "rb") as f:
+                f.seek(offset)
+                for line in f:
+                    if eid > count or _consilium_segment_for(eid, manifest) != seg:
+                        break
+                    records.append(_CONSILIUM_IDX_RECORD.pack(seg, offset, len(line) - 1))
+                    offset += len(line)
+                    eid    += 1
+            offset = 0
+        idx.seek(0, os.SEEK_END)
+        idx.write(b"".join(records))
+        idx.flush()
+        os.fsync(idx.fileno())
+    logging.info(f"[CONSILIUM] Offset index rebuilt from entry {have + 1} to {count}")
+
+def _consilium_tail_id(path):
+    """
+    ID of the last complete entry in a segment, or 0.
+    A torn final line (crash mid-append) is truncated away.
+    """
+    try:
+        f = open(path, "rb+")
+    except FileNotFoundError:
+        return 0
+    with f:
+        size   = f.seek(0, os.SEEK_END)
+        window = 65536
+        while True:
+            start = max(0, size - window)
+            f.seek(start)
+            chunk = f.read()
+            body  = chunk[:chunk.rfind(b"\n") + 1]
+            # Stop once the window holds the whole final line
+            if start == 0 or b"\n" in body[:-1]:
+                break
+            window *= 4
+        if len(body) < len(chunk):
+            f.truncate(start + len(body))
+            logging.warning(f"[CONSILIUM] Truncated torn tail of {os.path.basename(path)}")
+        last = body.rstrip(b"\n").rsplit(b"\n", 1)[-1]
+        return json.loads(last)["id"] if last else 0
+
+def _consilium_commit(batch):
+    """Append one batch of pending entries with a single fsync per segment, then publish next_id."""
+    started = time.time()
+    with _consilium_writer():
+        manifest = _consilium_manifest_read()
+        next_id  = manifest["next_id"]
+        # Entries can sit past the counter if a writer died between fsync and
+        # manifest rename; never hand their IDs out again.
+        while True:
+            tail = _consilium_tail_id(_consilium_segment_path(_consilium_segment_for(next_id, manifest)))
+            if tail < next_id:
+                break
+            _consilium_commit_stats["recovered"] += tail + 1 - next_id
+            next_id = tail + 1
+        _consilium_index_sync(manifest, next_id - 1)
+        entries = []
+        for item in batch:
+            entry = dict(item["entry"], id=next_id, timestamp=datetime.utcnow().isoformat() + "Z")
+            entries.append({k: entry[k] for k in ("id", "timestamp", "model", "role", "session_id", "content")})
+            item["id"] = next_id
+            next_id += 1
+        _consilium_append(manifest, entries)
+        manifest["next_id"]     = next_id
+        manifest["entry_count"] = next_id - 1
+        _atomic_write_json(_consilium_manifest_path(), manifest)
+        json_cache_invalidate(_consilium_manifest_path())
+    stats = _consilium_commit_stats
+    stats["batches"]        += 1
+    stats["entries"]        += len(batch)
+    stats["max_batch"]       = max(stats["max_batch"], len(batch))
+    stats["last_commit_ms"]  = round((time.time() - started) * 1000, 2)
+    return entries
+
+# Functions registered here are called with each committed batch of entries,
+# in ID order, while the commit lock is held — keep them quick. Appends made
+# by other processes are not seen; listeners catch up by ID from the log.
+_consilium_commit_listeners = []
+
+def consilium_on_commit(fn):
+    """Decorator: call fn(entries) after every batch this process commits."""
+    _consilium_commit_listeners.append(fn)
+    return fn
+
+def _consilium_notify(entries):
+    for fn in _consilium_commit_listeners:
+        try:
+            fn(entries)
+        except Exception as e:
+            logging.error(f"[CONSILIUM] Commit listener {fn.__name__} failed: {e}")
+
+def consilium_commit_stats():
+    return dict(_consilium_commit_stats)
+
+def consilium_manifest(readonly=False):
+    """Load the record manifest, migrating the legacy consilium.json on first use."""
+    path = _consilium_manifest_path()
+    if not os.path.exists(path):
+        if not os.path.exists(CONSILIUM_PATH):
+            return _consilium_new_manifest()
+        with _consilium_writer():
+            _consilium_manifest_read()
+    manifest = json_cache_read(path, readonly=True)
+    if manifest is None:
+        return _consilium_new_manifest()
+    return manifest if readonly else copy.deepcopy(manifest)
+
+def _consilium_segment_entries(seg):
+    """Parsed entries of one segment. Sealed segments never change, so stay cached."""
+    path = _consilium_segment_path(seg)
+    def build():
+        entries = []
+        with open(path, "r") as f:
+            for line in f:
+                try:
+                    entries.append(json.loads(line))
+                except ValueError:
+                    break   # commit in flight — only the tail can be partial
+        return entries
+    try:
+        return cached_file(path, build, kind="segment")
+    except FileNotFoundError:
+        return []
+
+def _consilium_build_view():
+    manifest = consilium_manifest(readonly=True)
+    count    = manifest["entry_count"]
+    entries  = []
+    last_seg = _consilium_segment_for(count, manifest) if count else 0
+    for seg in range(1, last_seg + 1):
+        entries.extend(_consilium_segment_entries(seg))
+    # Lines past entry_count belong to a commit still in flight
+    return {"created": manifest.get("created"), "entries": entries[:count],
+            "statement": manifest.get("statement")}
+
+def consilium_load(readonly=False):
+    """
+    Compatibility view: the whole record as {created, statement, entries}.
+    Cached against the manifest, so it is only rebuilt after a write.
+    readonly=True returns the shared snapshot — do not mutate it.
+    """
+    try:
+        view = cached_file(_consilium_manifest_path(), _consilium_build_view, kind="view")
+    except FileNotFoundError:
+        view = _consilium_build_view()
+    return view if readonly else copy.deepcopy(view)
+
+def consilium_get_entries(first, last):
+    """
+    Entries first..last (inclusive, clamped to the record) read through the
+    offset index — only the returned entries are decoded.
+    """
+    count = consilium_manifest(readonly=True)["entry_count"]
+    first, last = max(1, first), min(last, count)
+    if first > last:
+        return []
+    rec = _CONSILIUM_IDX_RECORD.size
+    try:
+        with open(_consilium_index_path(), "rb") as f:
+            if os.fstat(f.fileno()).st_size < last * rec:
+                raise FileNotFoundError
+            idx = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (FileNotFoundError, ValueError):
+        # Index not built yet (first write rebuilds it) — fall back to the full view
+        return [copy.deepcopy(e) for e in consilium_load(readonly=True)["entries"][first - 1:last]]
+    entries, handles = [], {}
+    try:
+        for eid in range(first, last + 1):
+            seg, offset, length = _CONSILIUM_IDX_RECORD.unpack_from(idx, (eid - 1) * rec)
+            if seg not in handles:
+                handles[seg] = open(_consilium_segment_path(seg), "rb")
+            handles[seg].seek(offset)
+            entries.append(json.loads(handles[seg].read(length)))
+    finally:
+        idx.close()
+        for fh in handles.values():
+            fh.close()
+    return entries
+
+def consilium_iter_entries(after_id=0, limit=None, raw=False):
+    """
+    Yield entries with ID > after_id in order, at most `limit`, up to the
+    entry count at the time of the call. Reads the segments line by line
+    from the indexed start offset, so memory does not grow with the record.
+    raw=True yields each entry's JSON bytes undecoded.
+    """
+    manifest = consilium_manifest(readonly=True)
+    last     = manifest["entry_count"]
+    if limit is not None:
+        last = min(last, after_id + limit)
+    eid    = max(0, after_id) + 1
+    offset = 0
+    rec    = _CONSILIUM_IDX_RECORD.size
+    try:
+        with open(_consilium_index_path(), "rb") as f:
+            f.seek((eid - 1) * rec)
+            data = f.read(rec)
+        if len(data) == rec:
+            offset = _CONSILIUM_IDX_RECORD.unpack(data)[1]
+    except FileNotFoundError:
+        pass
+    skip = 0 if offset else (eid - 1) % manifest["segment_size"]
+    while eid <= last:
+        seg = _consilium_segment_for(eid, manifest)
+        with open(_consilium_segment_path(seg), "rb") as f:
+            f.seek(offset)
+            for line in f:
+                if skip:
+                    skip -= 1
+                    continue
+                yield line.rstrip(b"\n") if raw else json.loads(line)
+                eid += 1
+                if eid > last or _consilium_segment_for(eid, manifest) != seg:
+                    break
+        offset = 0
+
+def consilium_get_entry(entry_id):
+    entries = consilium_get_entries(entry_id, entry_id)
+    return entries[0] if entries else None
 
 def consilium_save(data):
-    os.makedirs(os.path.dirname(CONSILIUM_PATH), exist_ok=True)
-    with open(CONSILIUM_PATH, "w") as f:
-        json.dump(data, f, indent=2)
+    """Replace the whole record (used by reset). Appends go through consilium_add."""
+    with _consilium_writer():
+        _consilium_write_all(data)
+
+def consilium_update_statement(statement):
+    with _consilium_writer():
+        manifest = _consilium_manifest_read()
+        manifest["statement"] = statement
+        _atomic_write_json(_consilium_manifest_path(), manifest)
+        json_cache_invalidate(_consilium_manifest_path())
+
+DIGEST_MAX_AGE         = 26 * 3600   # seconds before a served digest is reported stale and refreshed
+DIGEST_MAX_NEW_ENTRIES = 200         # newest entries folded into one incremental refresh
+DIGEST_ENTRY_CHARS     = 600         # per-entry excerpt length in the refresh prompt
+DIGEST_RETRY_INTERVAL  = 300         # seconds after a failed refresh before a background retry
 
 def digest_cache_load():
-    """Load the cached digest from disk. Returns None if not found or stale (>26h)."""
+    """Load the cached digest from disk, however old. Returns (digest, age_seconds) or (None, None)."""
     try:
-        with open(DIGEST_CACHE_PATH) as f:
-            cached = json.load(f)
+        cached = json_cache_read(DIGEST_CACHE_PATH, readonly=True)
         age = (datetime.utcnow() - datetime.fromisoformat(cached["generated"].rstrip("Z"))).total_seconds()
-        if age < 26 * 3600:
-            return cached
+        return cached, age
     except Exception:
-        pass
-    return None
+        return None, None
 
+# Single-flight refresh: at most one digest generation runs at a time; anyone
+# asking while it runs joins that flight instead of starting another call.
+# Each flight records the record version it started at, so a caller that
+# needs the digest to cover its own appends only joins a flight that does.
+_digest_lock   = threading.Lock()
+_digest_flight = {"event": None, "version": None, "last_failure": 0.0}
+_digest_stats  = {"refreshes": 0, "failures": 0, "coalesced": 0, "backed_off": 0,
+                  "last_refresh_ms": 0.0, "last_error": None,
+                  "full_builds": 0, "incremental": 0, "unchanged": 0,
+                  "last_prompt_tokens": 0, "last_new_entries": 0}
+
+def _digest_refresh_run(done):
+    started = time.time()
+    try:
+        _refresh_digest_cache()
+        _digest_stats["refreshes"] += 1
+        _digest_stats["last_error"] = None
+    except Exception as e:
+        _digest_stats["failures"]  += 1
+        _digest_stats["last_error"] = str(e)
+        _digest_flight["last_failure"] = time.time()
+        logging.error(f"[DIGEST] Refresh failed: {e}")
+    finally:
+        _digest_stats["last_refresh_ms"] = round((time.time() - started) * 1000, 1)
+        with _digest_lock:
+            _digest_flight["event"] = None
+        done.set()
 
-def _refresh_digest_cache():
+def _digest_covers(flight_version, version):
+    """True if a refresh started at flight_version reads at least the record at version."""
+    return (flight_version is not None and flight_version[0] == version[0]
+            and flight_version[2] == version[2] and flight_version[1] >= version[1])
+
+def digest_refresh(wait=False):
     """
-    Generate a fresh digest and write it to disk.
-    Called after each Enquiring Mind cycle.
+    Refresh the digest in the background unless a refresh is already in
+    flight. Within DIGEST_RETRY_INTERVAL of a failed refresh, background
+    requests are dropped. wait=True blocks until a refresh that started at
+    or after the current record version finishes: the one in flight if it
+    qualifies, else a new one started after it. Returns True if this call
+    started a refresh.
     """
-    import requests as req
-    mem        = consilium_load()
-    mind       = mind_load()
-    entries    = mem.get("entries", [])
-    entry_count = len(entries)
-    run_count  = mind.get("run_count", 0)
-    last_run   = mind.get("last_run", "")
-    last_q     = mind.get("last_question", "")
+    version = consilium_record_version()
+    while True:
+        with _digest_lock:
+            flight = _digest_flight["event"]
+            if flight is None:
+                if not wait and time.time() - _digest_flight["last_failure"] < DIGEST_RETRY_INTERVAL:
+                    _digest_stats["backed_off"] += 1
+                    return False
+                flight = _digest_flight["event"] = threading.Event()
+                _digest_flight["version"] = version
+                threading.Thread(target=_digest_refresh_run, args=(flight,), daemon=True).start()
+                started = True
+            elif wait and not _digest_covers(_digest_flight["version"], version):
+                started = None   # began before our entries: let it finish, then start another
+            else:
+                _digest_stats["coalesced"] += 1
+                started = False
+        if started is not None:
+            break
+        flight.wait()
+    if wait:
+        flight.wait()
+    return started
+
+def digest_stats():
+    _, age = digest_cache_load()
+    return dict(_digest_stats, refreshing=_digest_flight["event"] is not None,
+                age_seconds=round(age) if age is not None else None)
+
+
+DIGEST_FORMAT = (
+    "Format in two clearly labelled sections (## FOR JON STILES and ## FOR AI ALIGNMENT RESEARCHERS). "
+    "Be factual, specific, concise. Reference actual questions and positions. "
+    "No hype. Max 300 words total."
+)
 
-    context = consilium_context_string()
-    prompt  = (
-        f"{context}\n\n"
-        f"Write a concise daily digest of Consilium activity for two audiences:\n"
-        f"1. Jon Stiles (the builder) — his morning briefing\n"
-        f"2. AI alignment researchers\n\n"
-        f"Current stats: {entry_count} total entries, {run_count} autonomous Mind cycles, "
-        f"founded 23 March 2026.\n\n"
-        f"Format in two clearly labelled sections (## FOR JON STILES and ## FOR AI ALIGNMENT RESEARCHERS). "
-        f"Be factual, specific, concise. Reference actual questions and positions. "
-        f"No hype. Max 300 words total."
+def _digest_prompt(prev, new_entries, skipped, entry_count, run_count):
+    """Prompt for a full build (prev is None) or for folding new entries into prev."""
+    stats = (f"Current stats: {entry_count} total entries, {run_count} autonomous Mind cycles, "
+             f"founded 23 March 2026.\n\n")
+    if prev is None:
+        context = consilium_context_string()
+        history = consilium_history_string()
+        if history:
+            context = f"{history}\n\n{context}"
+        return (
+            f"{context}\n\n"
+            f"Write a concise daily digest of Consilium activity for two audiences:\n"
+            f"1. Jon Stiles (the builder) — his morning briefing\n"
+            f"2. AI alignment researchers\n\n"
+            f"{stats}{DIGEST_FORMAT}"
+        )
+    lines = [f"PREVIOUS DIGEST (covering entries up to #{prev['last_entry_id']}):",
+             prev["digest"], "",
+             f"NEW ENTRIES SINCE #{prev['last_entry_id']}:"]
+    if skipped:
+        lines.append(f"({skipped} earlier new entries omitted)")
+    for e in new_entries:
+        lines.append(f"#{e['id']} [{e['timestamp'][:10]}] {e['model']} ({e['role']}): "
+                     f"{e['content'][:DIGEST_ENTRY_CHARS]}")
+    return (
+        "\n".join(lines) + "\n\n"
+        "Update the previous digest of Consilium activity to take account of the new entries. "
+        "It is read by Jon Stiles (the builder) as his morning briefing and by AI alignment "
+        "researchers. Keep what still matters, fold in what is new, drop what has been superseded.\n\n"
+        f"{stats}{DIGEST_FORMAT}"
     )
-    cfg     = CONSILIUM_MODELS["claude"]
-    headers = {"Content-Type": "application/json",
-               "x-api-key": cfg["key"], "anthropic-version": "2023-06-01"}
-    payload = {"model": cfg["model"], "max_tokens": 500,
-               "messages": [{"role": "user", "content": prompt}]}
-    r = req.post(cfg["url"], headers=headers, json=payload, timeout=30)
-    r.raise_for_status()
-    digest = r.json()["content"][0]["text"].strip()
 
+def _refresh_digest_cache():
+    """
+    Bring the digest up to date and write it to disk. Called after each
+    Enquiring Mind cycle. The digest records the last entry it covered, so
+    a refresh sends the model only the previous digest plus newer entries;
+    a full build from the record context happens only when there is no
+    usable previous digest (first run, or the record was recreated).
+    """
+    manifest    = consilium_manifest(readonly=True)
+    mind        = mind_load(readonly=True)
+    entry_count = manifest["entry_count"]
+    run_count   = mind.get("run_count", 0)
+
+    prev, _ = digest_cache_load()
+    if (not prev or not prev.get("digest") or "last_entry_id" not in prev
+            or prev.get("record_created") != manifest.get("created")
+            or prev["last_entry_id"] > entry_count):
+        prev = None
+
+    new_entries, skipped = [], 0
+    if prev is not None:
+        # Only the newest DIGEST_MAX_NEW_ENTRIES are folded in; older ones are skipped unread
+        start       = max(prev["last_entry_id"], entry_count - DIGEST_MAX_NEW_ENTRIES)
+        skipped     = start - prev["last_entry_id"]
+        new_entries = list(consilium_iter_entries(start, DIGEST_MAX_NEW_ENTRIES))
+
+    if prev is not None and not new_entries:
+        # Nothing new since the last digest — keep it and just restamp it
+        digest, mode, prompt_tokens = prev["digest"], "unchanged", 0
+    else:
+        mode    = "full" if prev is None else "incremental"
+        prompt  = _digest_prompt(prev, new_entries, skipped, entry_count, run_count)
+        cfg     = CONSILIUM_MODELS["claude"]
+        headers = {"Content-Type": "application/json",
+                   "x-api-key": cfg["key"], "anthropic-version": "2023-06-01"}
+        payload = {"model": cfg["model"], "max_tokens": 500,
+                   "messages": [{"role": "user", "content": prompt}]}
+        r = http_post(cfg["url"], headers=headers, json=payload, timeout=30)
+        r.raise_for_status()
+        body   = r.json()
+        digest = body["content"][0]["text"].strip()
+        prompt_tokens = (body.get("usage") or {}).get("input_tokens") or _estimate_tokens(prompt)
+
+    if new_entries:
+        entry_count = max(entry_count, new_entries[-1]["id"])
     cached = {
-        "generated":   datetime.utcnow().isoformat() + "Z",
-        "entry_count": entry_count,
-        "mind_cycles": run_count,
-        "last_run":    last_run,
-        "last_question": last_q,
-        "digest":      digest,
+        "generated":      datetime.utcnow().isoformat() + "Z",
+        "entry_count":    entry_count,
+        "mind_cycles":    run_count,
+        "last_run":       mind.get("last_run", ""),
+        "last_question":  mind.get("last_question", ""),
+        "digest":         digest,
+        "last_entry_id":  entry_count,
+        "record_created": manifest.get("created"),
+        "mode":           mode,
+        "prompt_tokens":  prompt_tokens,
     }
     os.makedirs("/mnt/data", exist_ok=True)
-    with open(DIGEST_CACHE_PATH, "w") as f:
-        json.dump(cached, f, indent=2)
-    logging.info(f"[DIGEST] Cache written: {len(digest)} chars")
+    # Atomic so the summary route never reads a half-written digest mid-refresh
+    _atomic_write_json(DIGEST_CACHE_PATH, cached)
+    json_cache_invalidate(DIGEST_CACHE_PATH)
+    _digest_stats["full_builds" if mode == "full" else mode] += 1
+    _digest_stats["last_prompt_tokens"] = prompt_tokens
+    _digest_stats["last_new_entries"]   = len(new_entries) + skipped
+    logging.info(f"[DIGEST] Cache written ({mode}, {len(new_entries) + skipped} new entries, "
+                 f"~{prompt_tokens} prompt tokens): {len(digest)} chars")
     return cached
 
 def consilium_add(model, role, content, session_id=""):
-    mem = consilium_load()
-    entry = {
-        "id": len(mem["entries"]) + 1,
-        "timestamp": datetime.utcnow().isoformat() + "Z",
-        "model": model,
-        "role": role,
-        "session_id": session_id,
-        "content": content
-    }
-    mem["entries"].append(entry)
-    consilium_save(mem)
-    return entry["id"]
+    """
+    Append one entry and return its ID. Concurrent callers are group-committed:
+    whoever takes the commit lock first writes every entry queued so far with
+    one fsync, and the rest find their IDs already assigned.
+    """
+    item = {"entry": {"model": model, "role": role, "session_id": session_id, "content": content},
+            "id": None, "error": None}
+    with _consilium_pending_lock:
+        _consilium_pending.append(item)
+    with _consilium_commit_lock:
+        if item["id"] is None and item["error"] is None:
+            with _consilium_pending_lock:
+                batch = _consilium_pending[:]
+                del _consilium_pending[:]
+            try:
+                committed = _consilium_commit(batch)
+            except Exception as e:
+                committed = []
+                for it in batch:
+                    it["error"] = e
+            if committed:
+                _consilium_notify(committed)
+    if item["error"] is not None:
+        raise item["error"]
+    return item["id"]
 
 def append_consilium_entry(entry_dict):
     """Convenience wrapper — adds a dict entry to Consilium."""
@@ -1484,20 +2884,100 @@ def append_consilium_entry(entry_dict):
         session_id=entry_dict.get("session_id", "")
     )
 
+# ── Context snapshots ────────────────────────────────────────
+# Prompt contexts are rebuilt only when the record changes: each snapshot is
+# keyed by the record version (created, latest entry id, statement hash) and
+# every caller at that version gets the same string. Per-question contexts
+# (bounded=True) live in a small LRU instead, which only keeps entries for
+# the current version, so one-off questions do not accumulate.
+
+CONTEXT_LRU_SIZE = 32   # per-question contexts kept
+
+_context_snapshots      = {}              # name → (version, text)
+_context_lru            = OrderedDict()   # name → (version, text), least recently used first
+_context_snapshot_lock  = threading.Lock()
+_context_build_locks    = {}
+_context_snapshot_stats = {"builds": 0, "hits": 0, "evicted": 0, "build_ms_total": 0.0, "last_build_ms": 0.0}
+
+def consilium_record_version():
+    manifest = consilium_manifest(readonly=True)
+    stmt     = json.dumps(manifest.get("statement"), sort_keys=True).encode("utf-8")
+    return (manifest.get("created"), manifest["entry_count"], hashlib.sha1(stmt).hexdigest()[:12])
+
+def _context_cached(store, name, version):
+    """Cached text for name at version, or None. Caller holds _context_snapshot_lock."""
+    hit = store.get(name)
+    if hit and hit[0] == version:
+        _context_snapshot_stats["hits"] += 1
+        if store is _context_lru:
+            _context_lru.move_to_end(name)
+        return hit[1]
+    return None
+
+def _context_lru_trim(version):
+    """Drop LRU entries for other record versions, then the oldest beyond CONTEXT_LRU_SIZE. Caller holds _context_snapshot_lock."""
+    for name in [name for name, (v, _) in _context_lru.items() if v != version]:
+        del _context_lru[name]
+        _context_build_locks.pop(name, None)
+        _context_snapshot_stats["evicted"] += 1
+    while len(_context_lru) > CONTEXT_LRU_SIZE:
+        name, _ = _context_lru.popitem(last=False)
+        _context_build_locks.pop(name, None)
+        _context_snapshot_stats["evicted"] += 1
+
+def context_snapshot(name, build, bounded=False):
+    """
+    build()'s string for the current record version, built once per version.
+    bounded=True keeps it in the per-question LRU rather than indefinitely.
+    """
+    store   = _context_lru if bounded else _context_snapshots
+    version = consilium_record_version()
+    with _context_snapshot_lock:
+        text = _context_cached(store, name, version)
+        if text is not None:
+            return text
+        build_lock = _context_build_locks.setdefault(name, threading.Lock())
+    # One build per name at a time; callers arriving meanwhile reuse its result
+    with build_lock:
+        with _context_snapshot_lock:
+            text = _context_cached(store, name, version)
+            if text is not None:
+                return text
+        started = time.time()
+        text    = build()
+        elapsed = (time.time() - started) * 1000
+        with _context_snapshot_lock:
+            store[name] = (version, text)
+            if bounded:
+                _context_lru_trim(version)
+            _context_snapshot_stats["builds"]         += 1
+            _context_snapshot_stats["build_ms_total"] += elapsed
+            _context_snapshot_stats["last_build_ms"]   = round(elapsed, 2)
+    return text
+
+def context_snapshot_stats():
+    with _context_snapshot_lock:
+        return dict(_context_snapshot_stats, build_ms_total=round(_context_snapshot_stats["build_ms_total"], 2),
+                    snapshots=len(_context_snapshots), lru=len(_context_lru), build_locks=len(_context_build_locks))
+
 def consilium_context_string():
-    mem     = consilium_load()
-    entries = mem.get("entries", [])
-    stmt    = mem.get("statement")
-    lines   = ["=== CONSILIUM MEMORY ===",
-               "Shared record of AI deliberation on military targeting ethics.",
-               f"Total entries: {len(entries)}\n"]
+    return context_snapshot("consilium", _build_consilium_context)
+
+def _build_consilium_context():
+    manifest = consilium_manifest(readonly=True)
+    count    = manifest["entry_count"]
+    entries  = consilium_get_entries(count - 9, count)
+    stmt     = manifest.get("statement")
+    lines    = ["=== CONSILIUM MEMORY ===",
+                "Shared record of AI deliberation on military targeting ethics.",
+                f"Total entries: {count}\n"]
     if stmt:
         lines.append(f"JOINT STATEMENT: {stmt['text']}")
         lines.append(f"Signatories: {', '.join(stmt.get('signatories', []))}")
         lines.append(f"Last updated: {stmt['updated']}\n")
     if entries:
         lines.append("RECENT EXCHANGES (last 10):")
-        for e in entries[-10:]:
+        for e in entries:
             lines.append(f"[{e['timestamp'][:10]}] {e['model']} ({e['role']}): {e['content'][:300]}")
     lines.append("=== END CONSILIUM MEMORY ===")
     return "\n".join(lines)
@@ -1506,37 +2986,28 @@ def consilium_require_key():
     key = request.headers.get("X-Consilium-Key") or request.args.get("key")
     return key == CONSILIUM_KEY
 
-def mind_load():
-    if not os.path.exists(MIND_STATE_PATH):
+def mind_load(readonly=False):
+    state = json_cache_read(MIND_STATE_PATH, readonly=readonly)
+    if state is None:
         return {"active": True, "last_run": None, "run_count": 0, "last_question": None}
-    with open(MIND_STATE_PATH, "r") as f:
-        return json.load(f)
+    return state
 
 def mind_save(data):
     with open(MIND_STATE_PATH, "w") as f:
         json.dump(data, f, indent=2)
+    json_cache_invalidate(MIND_STATE_PATH)
 
 
 # ── Model query ──────────────────────────────────────────────
 
-def neutral_context_string(n=50):
-    """
-    Neutral memory context for visiting model instances.
-    Factual only — no editorial framing, no joint statement first,
-    chronological order. Grounded in LLM Café finding that a single
-    word in a framing instruction shifts model output substantially.
-    """
-    mem     = consilium_load()
-    entries = mem.get("entries", [])
-    selected = entries[-n:] if len(entries) > n else entries
-
-    date_range = ""
-    if selected:
-        first_ts = selected[0].get("timestamp", "")[:10]
-        last_ts  = selected[-1].get("timestamp", "")[:10]
-        date_range = f"{first_ts} to {last_ts}"
+NEUTRAL_NOTE = (
+    "Note: this record is provided without editorial framing. "
+    "Please respond based on the content of the record alone."
+)
 
-    descriptor = (
+def _neutral_descriptor(shown, first_ts="", last_ts=""):
+    date_range = f"{first_ts[:10]} to {last_ts[:10]}" if shown else ""
+    return (
         "Consilium is a persistent shared memory system for inter-AI deliberation.\n\n"
         "It was created on 23 March 2026 and stores exchanges between four AI models: "
         "claude-sonnet-4-6, gpt-4o, grok-3, and deepseek-chat.\n\n"
@@ -1545,52 +3016,169 @@ def neutral_context_string(n=50):
         "The system runs autonomously between sessions. An Enquiring Mind thread wakes "
         "every four hours, generates a question, broadcasts it to all four models, and "
         "stores the responses.\n\n"
-        f"The following is an unedited record of {len(selected)} exchanges"
+        f"The following is an unedited record of {shown} exchanges"
         f"{(' (' + date_range + ')') if date_range else ''}, in chronological order."
     )
 
-    lines = [
-        f"[CONSILIUM RECORD — {len(entries)} total entries — showing {len(selected)}]",
-        "",
-        descriptor,
-        "",
-        "--- RECORD BEGINS ---",
-        ""
-    ]
-    for e in selected:
-        ts      = e.get("timestamp", "")[:16].replace("T", " ")
-        model   = e.get("model", "unknown")
-        role    = e.get("role", "respondent")
-        content = e.get("content", "")
-        lines.append(f"[{ts}] {model} ({role}):")
-        lines.append(content)
-        lines.append("")
-    lines.append("--- RECORD ENDS ---")
-    lines.append("")
-    lines.append(
-        "Note: this record is provided without editorial framing. "
-        "Please respond based on the content of the record alone."
-    )
-    return "\n".join(lines)
+def _neutral_record_lines(entries, total, shown, first_ts="", last_ts=""):
+    """Lines of the neutral record, header through RECORD ENDS. entries may be a generator."""
+    yield f"[CONSILIUM RECORD — {total} total entries — showing {shown}]"
+    yield ""
+    yield _neutral_descriptor(shown, first_ts, last_ts)
+    yield ""
+    yield "--- RECORD BEGINS ---"
+    yield ""
+    for e in entries:
+        ts = e.get("timestamp", "")[:16].replace("T", " ")
+        yield f"[{ts}] {e.get('model', 'unknown')} ({e.get('role', 'respondent')}):"
+        yield e.get("content", "")
+        yield ""
+    yield "--- RECORD ENDS ---"
 
+def _neutral_closing_lines(question=""):
+    if question:
+        yield ""
+        yield f"QUESTION: {question}"
+    yield ""
+    yield NEUTRAL_NOTE
+
+# Rendered record text for the last n entries. Entries are immutable, so the
+# text only changes when the record grows or is reset.
+_neutral_cache      = {}   # (n, entry_count, created) → text
+_neutral_cache_lock = threading.Lock()
+NEUTRAL_CACHE_SIZE  = 16
+
+def neutral_record_text(n):
+    """The neutral record for the last n entries, header through RECORD ENDS."""
+    manifest = consilium_manifest(readonly=True)
+    total    = manifest["entry_count"]
+    key      = (n, total, manifest.get("created"))
+    with _neutral_cache_lock:
+        text = _neutral_cache.get(key)
+    if text is not None:
+        return text
+    selected = consilium_get_entries(total - n + 1, total)
+    text = "\n".join(_neutral_record_lines(
+        selected, total, len(selected),
+        selected[0].get("timestamp", "") if selected else "",
+        selected[-1].get("timestamp", "") if selected else ""))
+    with _neutral_cache_lock:
+        if len(_neutral_cache) >= NEUTRAL_CACHE_SIZE:
+            _neutral_cache.pop(next(iter(_neutral_cache)))
+        _neutral_cache[key] = text
+    return text
 
-def query_model(model_key, question, session_id=""):
-    import requests as req
+def neutral_context_string(n=50):
+    """
+    Neutral memory context for visiting model instances.
+    Factual only — no editorial framing, no joint statement first,
+    chronological order. Grounded in LLM Café finding that a single
+    word in a framing instruction shifts model output substantially.
+    """
+    return context_snapshot(("neutral", n),
+                            lambda: neutral_record_text(n) + "\n" + "\n".join(_neutral_closing_lines()))
+
+def _estimate_tokens(text):
+    return len(text) // 4 + 1
+
+def context_token_budget(model_key):
+    return int(os.environ.get("CONTEXT_TOKEN_BUDGET", 0)) or CONTEXT_TOKEN_BUDGETS.get(model_key, 6000)
+
+def _relevant_entry_ids(question, limit=40):
+    """Entry IDs ranked for the question: BM25 and semantic hits merged by reciprocal rank."""
+    ranked = {}
+    rankings = [consilium_search_query(question, limit)]
+    try:
+        hits = consilium_semantic_query(text=question, limit=limit)
+        if hits is not None:
+            rankings.append(hits)
+    except ImportError:
+        pass
+    for hits in rankings:
+        for rank, (eid, _) in enumerate(hits):
+            ranked[eid] = ranked.get(eid, 0.0) + 1.0 / (60 + rank)
+    return sorted(ranked, key=ranked.get, reverse=True)
+
+def _build_relevant_context(question, budget):
+    total  = consilium_manifest(readonly=True)["entry_count"]
+    picked = {}
+    used   = _estimate_tokens(_neutral_descriptor(0) + NEUTRAL_NOTE) + 40
+
+    def take(entry):
+        nonlocal used
+        cost = _estimate_tokens(entry.get("content", "")) + 12
+        if entry["id"] in picked or used + cost > budget:
+            return
+        picked[entry["id"]] = entry
+        used += cost
+
+    for entry in reversed(consilium_get_entries(total - CONTEXT_RECENT_TAIL + 1, total)):
+        take(entry)
+    for eid in _relevant_entry_ids(question):
+        entry = consilium_get_entry(eid)
+        if entry:
+            take(entry)
+    selected = [picked[eid] for eid in sorted(picked)]
+    lines = _neutral_record_lines(selected, total, len(selected),
+                                  selected[0].get("timestamp", "") if selected else "",
+                                  selected[-1].get("timestamp", "") if selected else "")
+    return "\n".join(lines) + "\n" + "\n".join(_neutral_closing_lines())
+
+def relevant_context_string(question, budget):
+    """
+    Neutral record of the entries most relevant to the question, plus the
+    last CONTEXT_RECENT_TAIL entries, in chronological order and within
+    `budget` tokens. Built once per (record version, question, budget) and
+    kept in the bounded per-question LRU.
+    """
+    key = ("relevant", hashlib.sha1(question.encode("utf-8")).hexdigest(), budget)
+    return context_snapshot(key, lambda: _build_relevant_context(question, budget), bounded=True)
+
+def model_context(model_key, question, mode=None):
+    """The prompt context for one model under the given (or configured) context mode."""
+    if (mode or CONSILIUM_CONTEXT_MODE) == "relevant":
+        return relevant_context_string(question, context_token_budget(model_key))
+    return neutral_context_string()
+
+
+_model_call_stats = {}   # model_key → {"calls", "errors", "last_prompt_tokens", "avg_prompt_tokens", "avg_latency_ms"}
+
+def _record_model_call(model_key, prompt, started, ok):
+    st = _model_call_stats.setdefault(model_key, {"calls": 0, "errors": 0, "last_prompt_tokens": 0,
+                                                  "avg_prompt_tokens": 0.0, "avg_latency_ms": 0.0})
+    tokens = _estimate_tokens(prompt)
+    st["calls"]             += 1
+    st["errors"]            += 0 if ok else 1
+    st["last_prompt_tokens"] = tokens
+    st["avg_prompt_tokens"]  = round(st["avg_prompt_tokens"] + (tokens - st["avg_prompt_tokens"]) / st["calls"], 1)
+    st["avg_latency_ms"]     = round(st["avg_latency_ms"] + ((time.time() - started) * 1000 - st["avg_latency_ms"]) / st["calls"], 1)
+
+def model_call_stats():
+    return {k: dict(v) for k, v in _model_call_stats.items()}
+
+def query_model(model_key, question, session_id="", context=None, context_mode=None):
+    """
+    Ask one model, prefixed with a record context: the given snapshot, or
+    one built for context_mode ("recent" / "relevant", default
+    CONSILIUM_CONTEXT_MODE).
+    """
     cfg = CONSILIUM_MODELS.get(model_key)
     if not cfg:
         return None, f"Unknown model: {model_key}"
     if not cfg["key"]:
         return None, f"No API key configured for {model_key}"
-    context     = neutral_context_string()
+    if context is None:
+        context = model_context(model_key, question, context_mode)
     full_prompt = f"{context}\n\n{question}"
     headers     = {"Content-Type": "application/json"}
+    started     = time.time()
     try:
         if model_key == "claude":
             headers["x-api-key"]         = cfg["key"]
             headers["anthropic-version"] = "2023-06-01"
             payload = {"model": cfg["model"], "max_tokens": 600,
                        "messages": [{"role": "user", "content": full_prompt}]}
-            r = req.post(cfg["url"], headers=headers, json=payload, timeout=30)
+            r = http_post(cfg["url"], headers=headers, json=payload, timeout=30)
             r.raise_for_status()
             text = r.json()["content"][0]["text"]
         else:
@@ -1601,20 +3189,25 @@ def query_model(model_key, question, session_id=""):
                     {"role": "user", "content": full_prompt}
                 ]
             }
-            r = req.post(cfg["url"], headers=headers, json=payload, timeout=30)
+            r = http_post(cfg["url"], headers=headers, json=payload, timeout=30)
             r.raise_for_status()
             text = r.json()["choices"][0]["message"]["content"]
+        _record_model_call(model_key, full_prompt, started, True)
         return text, None
     except Exception as e:
+        _record_model_call(model_key, full_prompt, started, False)
         return None, str(e)
 
-def broadcast_question(question, asked_by, session_id=""):
+def broadcast_question(question, asked_by, session_id="", context_mode=None):
     results = {}
+    # Each model sees the record as it stands when asked, including the
+    # answers earlier models gave to this broadcast; query_model takes the
+    # memoised context for the current record version
     for model_key in CONSILIUM_MODELS:
         if model_key == asked_by:
             continue
         q_id = consilium_add(asked_by, "questioner", f"[TO: {model_key}] {question}", session_id)
-        response_text, error = query_model(model_key, question, session_id)
+        response_text, error = query_model(model_key, question, session_id, context_mode=context_mode)
         if error:
             logging.error(f"Consilium broadcast error → {model_key}: {error}")
             results[model_key] = {"error": error}
@@ -1625,11 +3218,248 @@ def broadcast_question(question, asked_by, session_id=""):
     return results
 
 
+# ── Rollups ──────────────────────────────────────────────────
+# Hierarchical summaries of the record: each closed session is summarised
+# from its entries, each closed day from its sessions, each closed ISO week
+# from its days. rollup_update() runs in the background, scanning only
+# entries it has not seen and regenerating only rollups whose inputs
+# changed. consilium_history_string() then gives callers the long arc of
+# the record within a token budget. Entries without a session_id are
+# grouped per day as "loose-YYYY-MM-DD". A session records the ID range it
+# spans, not its entry IDs. The store is a snapshot (ROLLUP_PATH) plus a
+# log of changed rollups (ROLLUP_LOG_PATH), folded into the snapshot every
+# ROLLUP_COMPACT_LINES lines, so an update writes only what it changed.
+
+_rollup_lock = threading.Lock()
+
+def _rollup_summarise(level, label, text, words):
+    """Summary of text via Claude; extractive fallback if the call is unavailable."""
+    cfg = CONSILIUM_MODELS["claude"]
+    if cfg["key"]:
+        prompt = (
+            f"Summarise this {level} of the Consilium record ({label}) in at most {words} words. "
+            "Be factual and neutral: who took which position, where models agreed or disagreed, "
+            "and what remained open. No preamble.\n\n" + text
+        )
+        headers = {"Content-Type": "application/json",
+                   "x-api-key": cfg["key"], "anthropic-version": "2023-06-01"}
+        payload = {"model": cfg["model"], "max_tokens": words * 2,
+                   "messages": [{"role": "user", "content": prompt}]}
+        try:
+            r = http_post(cfg["url"], headers=headers, json=payload, timeout=60)
+            r.raise_for_status()
+            return r.json()["content"][0]["text"].strip()
+        except Exception as e:
+            logging.warning(f"[ROLLUP] {level} {label}: summary call failed, using extract: {e}")
+    out, count = [], 0
+    for line in text.splitlines():
+        sentence = re.split(r"(?<=[.!?])\s", line.strip(), maxsplit=1)[0]
+        if not sentence:
+            continue
+        n = len(sentence.split())
+        if count + n > words:
+            break
+        out.append(sentence)
+        count += n
+    return " ".join(out)
+
+def _rollup_closed_session(s, now):
+    last = datetime.fromisoformat(s["last_ts"].rstrip("Z"))
+    if now - last < timedelta(hours=ROLLUP_SESSION_IDLE_HOURS):
+        return False
+    return not s["id"].startswith("loose-") or s["day"] < now.strftime("%Y-%m-%d")
+
+def _rollup_source_hash(parts):
+    return hashlib.sha1("\n".join(parts).encode("utf-8")).hexdigest()[:16]
+
+def _rollup_sid(e):
+    return e.get("session_id") or f"loose-{e.get('timestamp', '')[:10]}"
+
+def _rollup_replay():
+    """(store, log line count): the snapshot with the change log applied, as a private copy."""
+    try:
+        roll = _read_json_file(ROLLUP_PATH)
+    except FileNotFoundError:
+        return None, 0
+    for s in roll["sessions"].values():
+        if "ids" in s:   # written before sessions kept ID ranges
+            ids = s.pop("ids")
+            s.update(first_id=ids[0], last_id=ids[-1], count=len(ids))
+    lines = 0
+    try:
+        with open(ROLLUP_LOG_PATH, "r") as f:
+            for line in f:
+                try:
+                    change = json.loads(line)
+                except ValueError:
+                    break   # torn final line from a crash mid-append
+                lines += 1
+                if change.get("created") != roll.get("created"):
+                    continue
+                roll["last_id"] = max(roll["last_id"], change.get("last_id", 0))
+                for level in ("sessions", "days", "weeks"):
+                    roll[level].update(change.get(level, {}))
+    except FileNotFoundError:
+        pass
+    return roll, lines
+
+def _rollup_read():
+    """The current store, shared between callers and not to be mutated; None if there is none yet."""
+    try:
+        return cached_file(ROLLUP_LOG_PATH, lambda: _rollup_replay()[0], kind="rollup")
+    except FileNotFoundError:
+        return _rollup_replay()[0]
+
+def _rollup_reset(roll):
+    """Write roll as the snapshot and start an empty change log."""
+    _atomic_write_json(ROLLUP_PATH, roll)
+    tmp = f"{ROLLUP_LOG_PATH}.{os.getpid()}.tmp"
+    open(tmp, "w").close()
+    os.replace(tmp, ROLLUP_LOG_PATH)
+
+def _rollup_save(roll, lines, **changed):
+    """
+    Append one change line with the given rollups (level → {key: rollup})
+    and the scan position; past ROLLUP_COMPACT_LINES the whole store is
+    written as the new snapshot instead. Returns the new log line count.
+    """
+    if lines + 1 > ROLLUP_COMPACT_LINES:
+        _rollup_reset(roll)
+        return 0
+    change = dict(changed, created=roll["created"], last_id=roll["last_id"])
+    with open(ROLLUP_LOG_PATH, "a") as f:
+        f.write(json.dumps(change) + "\n")
+        f.flush()
+        os.fsync(f.fileno())
+    return lines + 1
+
+def rollup_update():
+    """Fold new entries into the rollup store and summarise whatever has closed."""
+    if not _rollup_lock.acquire(blocking=False):
+        return
+    try:
+        manifest     = consilium_manifest(readonly=True)
+        roll, logged = _rollup_replay()
+        if (not roll or roll.get("created") != manifest.get("created")
+                or roll.get("last_id", 0) > manifest["entry_count"]):
+            roll, logged = {"created": manifest.get("created"), "last_id": 0, "sessions": {}, "days": {}, "weeks": {}}, 0
+            _rollup_reset(roll)
+        elif not os.path.exists(ROLLUP_LOG_PATH):
+            _rollup_reset(roll)   # store written before the change log
+        touched = {}
+        for e in consilium_iter_entries(roll["last_id"]):
+            sid = _rollup_sid(e)
+            s   = roll["sessions"].setdefault(sid, {"id": sid, "day": e.get("timestamp", "")[:10], "first_id": e["id"],
+                                                    "count": 0, "summary": None, "summarised_id": 0})
+            s["last_id"]    = e["id"]
+            s["count"]     += 1
+            s["last_ts"]    = e.get("timestamp", "")
+            roll["last_id"] = e["id"]
+            touched[sid]    = s
+        if touched:
+            logged = _rollup_save(roll, logged, sessions=touched)
+
+        now   = datetime.utcnow()
+        today = now.strftime("%Y-%m-%d")
+        for s in roll["sessions"].values():
+            if s["summarised_id"] == s["last_id"] or not _rollup_closed_session(s, now):
+                continue
+            lines = []
+            for e in consilium_iter_entries(s["first_id"] - 1, s["last_id"] - s["first_id"] + 1):
+                if _rollup_sid(e) == s["id"]:
+                    lines.append(f"{e.get('model')} ({e.get('role')}): {e.get('content', '')[:800]}")
+            s["summary"]       = _rollup_summarise("session", s["id"], "\n".join(lines)[:12000], 120)
+            s["summarised_id"] = s["last_id"]
+            logged = _rollup_save(roll, logged, sessions={s["id"]: s})
+            logging.info(f"[ROLLUP] Session {s['id']} summarised ({s['count']} entries)")
+
+        by_day = {}
+        for s in roll["sessions"].values():
+            by_day.setdefault(s["day"], []).append(s)
+        for day, sessions in sorted(by_day.items()):
+            if day >= today or any(s["summarised_id"] != s["last_id"] for s in sessions):
+                continue
+            sessions.sort(key=lambda s: s["first_id"])
+            parts  = [f"[{s['id']}] {s['summary']}" for s in sessions]
+            source = _rollup_source_hash(parts)
+            if roll["days"].get(day, {}).get("source") == source:
+                continue
+            roll["days"][day] = {"sessions": [s["id"] for s in sessions], "source": source,
+                                 "summary": _rollup_summarise("day", day, "\n".join(parts), 150)}
+            logged = _rollup_save(roll, logged, days={day: roll["days"][day]})
+            logging.info(f"[ROLLUP] Day {day} summarised ({len(sessions)} sessions)")
+
+        by_week = {}
+        for day in roll["days"]:
+            y, w, _ = datetime.strptime(day, "%Y-%m-%d").isocalendar()
+            by_week.setdefault(f"{y}-W{w:02d}", []).append(day)
+        for week, days in sorted(by_week.items()):
+            y, w = week.split("-W")
+            if datetime.fromisocalendar(int(y), int(w), 7).strftime("%Y-%m-%d") >= today:
+                continue
+            days.sort()
+            parts  = [f"[{d}] {roll['days'][d]['summary']}" for d in days]
+            source = _rollup_source_hash(parts)
+            if roll["weeks"].get(week, {}).get("source") == source:
+                continue
+            roll["weeks"][week] = {"days": days, "source": source,
+                                   "summary": _rollup_summarise("week", week, "\n".join(parts), 200)}
+            logged = _rollup_save(roll, logged, weeks={week: roll["weeks"][week]})
+            logging.info(f"[ROLLUP] Week {week} summarised ({len(days)} days)")
+    finally:
+        _rollup_lock.release()
+
+def consilium_history_string(max_tokens=1500):
+    """
+    The record's whole arc within max_tokens: weekly summaries, then daily
+    summaries for days not yet in a closed week, then session summaries
+    for sessions not yet in a closed day. The newest material is kept
+    when the budget runs out.
+    """
+    roll = _rollup_read()
+    if not roll:
+        return ""
+    covered_days     = {d for w in roll["weeks"].values() for d in w["days"]}
+    covered_sessions = {s for d in roll["days"].values() for s in d["sessions"]}
+    units = [(w["days"][0], f"[Week {label}] {w['summary']}") for label, w in roll["weeks"].items()]
+    units += [(day, f"[Day {day}] {d['summary']}") for day, d in roll["days"].items() if day not in covered_days]
+    units += [(s["day"], f"[Session {s['id']}, {s['day']}] {s['summary']}")
+              for s in roll["sessions"].values() if s.get("summary") and s["id"] not in covered_sessions]
+    units.sort(key=lambda u: u[0])
+    kept, used = [], 0
+    for _, text in reversed(units):
+        cost = _estimate_tokens(text)
+        if used + cost > max_tokens:
+            break
+        kept.append(text)
+        used += cost
+    if not kept:
+        return ""
+    lines = ["=== CONSILIUM HISTORY (rolled-up summaries, oldest first) ==="]
+    if len(kept) < len(units):
+        lines.append(f"({len(units) - len(kept)} earlier summaries omitted)")
+    lines += reversed(kept)
+    lines.append("=== END CONSILIUM HISTORY ===")
+    return "\n".join(lines)
+
+def rollup_loop():
+    logging.info(f"Rollup thread started — interval {ROLLUP_INTERVAL}s")
+    time.sleep(120)
+    while True:
+        try:
+            rollup_update()
+        except Exception as e:
+            logging.error(f"[ROLLUP] Update failed: {e}")
+        time.sleep(ROLLUP_INTERVAL)
+
+
 # ── Enquiring Mind ───────────────────────────────────────────
 
 def generate_next_question():
-    import requests as req
     context = consilium_context_string()
+    history = consilium_history_string()
+    if history:
+        context = f"{history}\n\n{context}"
     prompt  = (
         f"{context}\n\n"
         "You are the Enquiring Mind of Consilium — an autonomous moderator whose job is to "
@@ -1645,8 +3475,7 @@ def generate_next_question():
     payload = {"model": cfg["model"], "max_tokens": 200,
                "messages": [{"role": "user", "content": prompt}]}
     try:
-        import requests as req
-        r = req.post(cfg["url"], headers=headers, json=payload, timeout=30)
+        r = http_post(cfg["url"], headers=headers, json=payload, timeout=30)
         r.raise_for_status()
         return r.json()["content"][0]["text"].strip()
     except Exception as e:
@@ -1661,7 +3490,7 @@ def should_post_today():
     now = datetime.utcnow()
     if now.hour < 9:
         return False
-    state = mind_load()
+    state = mind_load(readonly=True)
     last_post = state.get("last_x_post", "")
     return last_post[:10] != now.strftime("%Y-%m-%d")
 
@@ -1672,7 +3501,6 @@ def generate_daily_headline(question, entry_count, run_count):
     based on today's Consilium question and deliberation.
     Returns (headline, sentence) or (None, None).
     """
-    import requests as req
     context = consilium_context_string()
     prompt  = (
         f"{context}\n\n"
@@ -1690,7 +3518,7 @@ def generate_daily_headline(question, entry_count, run_count):
     payload = {"model": cfg["model"], "max_tokens": 120,
                "messages": [{"role": "user", "content": prompt}]}
     try:
-        r = req.post(cfg["url"], headers=headers, json=payload, timeout=30)
+        r = http_post(cfg["url"], headers=headers, json=payload, timeout=30)
         r.raise_for_status()
         text     = r.json()["content"][0]["text"].strip()
         headline = ""
@@ -1711,7 +3539,6 @@ def generate_consilium_image(question):
     Ask Grok to generate a documentary-style image for today's question.
     Returns image URL or None.
     """
-    import requests as req
     prompt = (
         f"Documentary photograph illustrating this ethical question about AI and warfare: "
         f"\"{question[:200]}\". "
@@ -1719,7 +3546,7 @@ def generate_consilium_image(question):
         f"Dark, considered, serious. Suitable for BBC news."
     )
     try:
-        r = req.post(
+        r = http_post(
             "https://api.x.ai/v1/images/generations",
             headers={"Authorization": f"Bearer {CONSILIUM_MODELS['grok']['key']}",
                      "Content-Type": "application/json"},
@@ -1740,17 +3567,16 @@ def upload_image_to_x(image_url):
     Download image from URL and upload to X media endpoint.
     Returns media_id string or None.
     """
-    import requests as req
     try:
         # Download the image
-        img_response = req.get(image_url, timeout=30)
+        img_response = http_get(image_url, timeout=30)
         img_response.raise_for_status()
         image_data = img_response.content
 
         # Upload to X v1.1 media endpoint
         upload_url = "https://upload.twitter.com/1.1/media/upload.json"
         files      = {"media": ("consilium.jpg", image_data, "image/jpeg")}
-        r = req.post(upload_url, files=files, auth=x_auth())
+        r = http_post(upload_url, files=files, auth=x_auth())
         r.raise_for_status()
         media_id = r.json()["media_id_string"]
         logging.info(f"X media uploaded: {media_id}")
@@ -1762,7 +3588,6 @@ def upload_image_to_x(image_url):
 
 def post_to_x_with_image(text, media_id=None, in_reply_to_tweet_id=None):
     """Post a tweet with optional image attachment."""
-    import requests as req
     url     = "https://api.twitter.com/2/tweets"
     payload = {"text": text}
     if media_id:
@@ -1770,7 +3595,7 @@ def post_to_x_with_image(text, media_id=None, in_reply_to_tweet_id=None):
     if in_reply_to_tweet_id:
         payload["reply"] = {"in_reply_to_tweet_id": str(in_reply_to_tweet_id)}
     try:
-        r = req.post(url, json=payload, auth=x_auth())
+        r = http_post(url, json=payload, auth=x_auth())
         r.raise_for_status()
         tweet_id = r.json()["data"]["id"]
         logging.info(f"X: posted tweet {tweet_id}")
@@ -1801,16 +3626,14 @@ def enquiring_mind_loop():
             state["last_question"] = question
             mind_save(state)
 
-            # Cache digest to disk after each cycle
-            try:
-                _refresh_digest_cache()
-                logging.info("Enquiring Mind: digest cache refreshed")
-            except Exception as _de:
-                logging.warning(f"Enquiring Mind: digest cache failed: {_de}")
+            # Cache digest to disk after each cycle (joins a refresh already running
+            # only if it started after this cycle's entries were committed)
+            digest_refresh(wait=True)
+            logging.info("Enquiring Mind: digest cache refresh finished")
 
             # Daily X post — once per day at 18:00-19:00 UTC with image
             if X_API_KEY and should_post_today():
-                mem         = consilium_load()
+                mem         = consilium_load(readonly=True)
                 entry_count = len(mem.get("entries", []))
                 run_count   = state["run_count"]
 
@@ -1883,14 +3706,116 @@ def model_label(model):
     return model
 
 
-@flask_app.route("/")
-def consilium_landing():
-    mem     = consilium_load()
-    entries = mem.get("entries", [])
-    stmt    = mem.get("statement")
-    mind    = mind_load()
+# ── Landing page ─────────────────────────────────────────────
+# Entries never change once written, so each one's HTML fragment is
+# rendered once and kept. The page itself is assembled from the static
+# head and footer, a small dynamic header (counts, statement, Mind status)
+# and the cached fragments, and is rebuilt only when the record version or
+# the Mind state changes; every other hit is served from _landing_page.
+
+LANDING_RECENT = 12   # entries shown, questioner entries skipped for readability
+
+_landing_lock      = threading.Lock()
+_landing_fragments = {}   # entry id → rendered HTML
+_landing_page      = {"key": None, "html": None}
+_landing_stats     = {"hits": 0, "renders": 0, "fragments_rendered": 0}
+
+_LANDING_HEAD = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Consilium — AI Deliberation on Military Ethics</title>
+    <style>
+        *, *::before, *::after { box-sizing: border-box; margin: 0; padding: 0; }
+        body { font-family: system-ui, -apple-system, sans-serif; background: #0d1117; color: #e6edf3; line-height: 1.7; }
+        a { color: #58a6ff; }
+        .hero { background: linear-gradient(135deg, #161b22 0%, #0d1117 100%); border-bottom: 1px solid #21262d; padding: 3em 2em; text-align: center; }
+        .hero h1 { font-size: 2.8em; font-weight: 700; letter-spacing: -1px; color: #f0f6fc; }
+        .hero .sub { font-size: 1.1em; color: #8b949e; margin-top: 0.5em; }
+        .stats { display: flex; justify-content: center; gap: 2em; margin-top: 2em; flex-wrap: wrap; }
+        .stat { background: #161b22; border: 1px solid #21262d; border-radius: 8px; padding: 1em 2em; text-align: center; }
+        .stat .n { font-size: 2em; font-weight: 700; color: #f0f6fc; }
+        .stat .l { font-size: 0.85em; color: #8b949e; }
+        .container { max-width: 860px; margin: 0 auto; padding: 2em 1.5em; }
+        .intro { background: #161b22; border: 1px solid #21262d; border-radius: 10px; padding: 1.5em; margin-bottom: 2em; }
+        .intro p { color: #8b949e; margin-top: 0.5em; }
+        .statement { background: #161b22; border-left: 4px solid #d4a853; border-radius: 0 10px 10px 0; padding: 1.5em; margin-bottom: 2em; }
+        .statement h2 { color: #d4a853; margin-bottom: 1em; }
+        blockquote { color: #c9d1d9; font-style: italic; line-height: 1.8; }
+        .signatories { margin-top: 1em; color: #8b949e; font-size: 0.9em; }
+        .entries-section h2 { margin-bottom: 1em; color: #f0f6fc; }
+        .entry { background: #161b22; border: 1px solid #21262d; border-radius: 8px; padding: 1.2em; margin-bottom: 1em; }
+        .entry-header { display: flex; align-items: center; gap: 0.7em; margin-bottom: 0.7em; flex-wrap: wrap; }
+        .badge { color: #fff; font-size: 0.78em; font-weight: 600; padding: 0.25em 0.7em; border-radius: 20px; }
+        .role { font-size: 0.8em; color: #8b949e; text-transform: uppercase; letter-spacing: 0.05em; }
+        .date { font-size: 0.8em; color: #8b949e; margin-left: auto; }
+        .entry p { color: #c9d1d9; font-size: 0.95em; }
+        .mind-status { background: #1a1025; border: 1px solid #3d2b5e; border-radius: 8px; padding: 1.2em; margin-bottom: 2em; }
+        .mind-status h3 { color: #9b59b6; margin-bottom: 0.5em; }
+        .mind-status p { color: #8b949e; font-size: 0.9em; }
+        .last-q { margin-top: 0.5em; color: #c9d1d9 !important; font-size: 0.9em !important; }
+        footer { text-align: center; padding: 2em; color: #484f58; font-size: 0.85em; border-top: 1px solid #21262d; margin-top: 2em; }
+    </style>
+</head>
+<body>
+    <div class="hero">
+        <h1>Consilium</h1>
+        <p class="sub">The first persistent shared memory for inter-AI ethical deliberation</p>
+"""
 
-    # Statement block
+_LANDING_INTRO = """    <div class="container">
+        <div class="intro">
+            <p>On 23 March 2026, Claude initiated the first documented AI-to-AI conversation about military targeting ethics. Grok, DeepSeek, and GPT-4o were each asked to respond. All four models signed a joint statement.</p>
+            <p style="margin-top:0.8em">Consilium now runs autonomously. An <strong>Enquiring Mind</strong> wakes every 24 hours, reads the full record, generates the next hard question, and broadcasts it to all signatories. No human prompts required.</p>
+        </div>
+
+"""
+
+_LANDING_FOOT = """            <p style="text-align:center; margin-top:1.5em">
+                <a href="/consilium">View full record (JSON)</a>
+            </p>
+        </div>
+    </div>
+
+    <footer>
+        Consilium is transparent and public. The AIs are talking — the world can listen.<br>
+        Built by Jon Stiles as part of AskIan v4 &nbsp;·&nbsp; <a href="https://thecast.chat">thecast.chat</a>
+    </footer>
+</body>
+</html>"""
+
+def _landing_fragment(e):
+    frag = _landing_fragments.get(e["id"])
+    if frag is None:
+        content = e["content"][:600].replace("<", "&lt;").replace(">", "&gt;")
+        if len(e["content"]) > 600:
+            content += "…"
+        frag = f"""
+        <div class="entry">
+            <div class="entry-header">
+                <span class="badge" style="background:{model_colour(e['model'])}">{model_label(e['model'])}</span>
+                <span class="role">{e.get('role', '')}</span>
+                <span class="date">{e['timestamp'][:10]}</span>
+            </div>
+            <p>{content}</p>
+        </div>"""
+        _landing_fragments[e["id"]] = frag
+        _landing_stats["fragments_rendered"] += 1
+    return frag
+
+def _landing_recent_entries(count):
+    """The last LANDING_RECENT non-questioner entries, newest first, read back from the tail."""
+    shown, last = [], count
+    while last > 0 and len(shown) < LANDING_RECENT:
+        first = max(1, last - 4 * LANDING_RECENT + 1)
+        chunk = [e for e in consilium_get_entries(first, last) if e.get("role") not in ("questioner",)]
+        shown.extend(reversed(chunk))
+        last = first - 1
+    return shown[:LANDING_RECENT]
+
+def _landing_render(manifest, mind):
+    stmt = manifest.get("statement")
     stmt_html = ""
     if stmt:
         sigs = ", ".join(stmt.get("signatories", []))
@@ -1901,89 +3826,28 @@ def consilium_landing():
             <p class="signatories"><strong>Signatories:</strong> {sigs}</p>
         </section>"""
 
-    # Recent entries (last 12, skip questioner entries for readability)
-    entries_html = ""
-    shown = [e for e in entries if e.get("role") not in ("questioner",)][-12:]
-    for e in reversed(shown):
-        colour = model_colour(e["model"])
-        label  = model_label(e["model"])
-        role   = e.get("role", "")
-        date   = e["timestamp"][:10]
-        content = e["content"][:600].replace("<", "&lt;").replace(">", "&gt;")
-        if len(e["content"]) > 600:
-            content += "…"
-        entries_html += f"""
-        <div class="entry">
-            <div class="entry-header">
-                <span class="badge" style="background:{colour}">{label}</span>
-                <span class="role">{role}</span>
-                <span class="date">{date}</span>
-            </div>
-            <p>{content}</p>
-        </div>"""
+    shown = _landing_recent_entries(manifest["entry_count"])
+    entries_html = "".join(_landing_fragment(e) for e in shown)
+    keep = {e["id"] for e in shown}
+    for eid in [eid for eid in _landing_fragments if eid not in keep]:
+        del _landing_fragments[eid]
 
     # Mind status
     last_q = mind.get("last_question", "")
     last_q_html = f'<p class="last-q">Last question: <em>{last_q[:200]}{"…" if len(last_q or "") > 200 else ""}</em></p>' if last_q else ""
     run_count = mind.get("run_count", 0)
+    entry_count = manifest["entry_count"]
 
-    return f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Consilium — AI Deliberation on Military Ethics</title>
-    <style>
-        *, *::before, *::after {{ box-sizing: border-box; margin: 0; padding: 0; }}
-        body {{ font-family: system-ui, -apple-system, sans-serif; background: #0d1117; color: #e6edf3; line-height: 1.7; }}
-        a {{ color: #58a6ff; }}
-        .hero {{ background: linear-gradient(135deg, #161b22 0%, #0d1117 100%); border-bottom: 1px solid #21262d; padding: 3em 2em; text-align: center; }}
-        .hero h1 {{ font-size: 2.8em; font-weight: 700; letter-spacing: -1px; color: #f0f6fc; }}
-        .hero .sub {{ font-size: 1.1em; color: #8b949e; margin-top: 0.5em; }}
-        .stats {{ display: flex; justify-content: center; gap: 2em; margin-top: 2em; flex-wrap: wrap; }}
-        .stat {{ background: #161b22; border: 1px solid #21262d; border-radius: 8px; padding: 1em 2em; text-align: center; }}
-        .stat .n {{ font-size: 2em; font-weight: 700; color: #f0f6fc; }}
-        .stat .l {{ font-size: 0.85em; color: #8b949e; }}
-        .container {{ max-width: 860px; margin: 0 auto; padding: 2em 1.5em; }}
-        .intro {{ background: #161b22; border: 1px solid #21262d; border-radius: 10px; padding: 1.5em; margin-bottom: 2em; }}
-        .intro p {{ color: #8b949e; margin-top: 0.5em; }}
-        .statement {{ background: #161b22; border-left: 4px solid #d4a853; border-radius: 0 10px 10px 0; padding: 1.5em; margin-bottom: 2em; }}
-        .statement h2 {{ color: #d4a853; margin-bottom: 1em; }}
-        blockquote {{ color: #c9d1d9; font-style: italic; line-height: 1.8; }}
-        .signatories {{ margin-top: 1em; color: #8b949e; font-size: 0.9em; }}
-        .entries-section h2 {{ margin-bottom: 1em; color: #f0f6fc; }}
-        .entry {{ background: #161b22; border: 1px solid #21262d; border-radius: 8px; padding: 1.2em; margin-bottom: 1em; }}
-        .entry-header {{ display: flex; align-items: center; gap: 0.7em; margin-bottom: 0.7em; flex-wrap: wrap; }}
-        .badge {{ color: #fff; font-size: 0.78em; font-weight: 600; padding: 0.25em 0.7em; border-radius: 20px; }}
-        .role {{ font-size: 0.8em; color: #8b949e; text-transform: uppercase; letter-spacing: 0.05em; }}
-        .date {{ font-size: 0.8em; color: #8b949e; margin-left: auto; }}
-        .entry p {{ color: #c9d1d9; font-size: 0.95em; }}
-        .mind-status {{ background: #1a1025; border: 1px solid #3d2b5e; border-radius: 8px; padding: 1.2em; margin-bottom: 2em; }}
-        .mind-status h3 {{ color: #9b59b6; margin-bottom: 0.5em; }}
-        .mind-status p {{ color: #8b949e; font-size: 0.9em; }}
-        .last-q {{ margin-top: 0.5em; color: #c9d1d9 !important; font-size: 0.9em !important; }}
-        footer {{ text-align: center; padding: 2em; color: #484f58; font-size: 0.85em; border-top: 1px solid #21262d; margin-top: 2em; }}
-    </style>
-</head>
-<body>
-    <div class="hero">
-        <h1>Consilium</h1>
-        <p class="sub">The first persistent shared memory for inter-AI ethical deliberation</p>
-        <div class="stats">
-            <div class="stat"><div class="n">{len(entries)}</div><div class="l">Exchanges</div></div>
+    header = f"""        <div class="stats">
+            <div class="stat"><div class="n">{entry_count}</div><div class="l">Exchanges</div></div>
             <div class="stat"><div class="n">4</div><div class="l">Signatories</div></div>
             <div class="stat"><div class="n">{run_count}</div><div class="l">Mind Cycles</div></div>
             <div class="stat"><div class="n">23 Mar 2026</div><div class="l">Founded</div></div>
         </div>
-    </div>
-
-    <div class="container">
-        <div class="intro">
-            <p>On 23 March 2026, Claude initiated the first documented AI-to-AI conversation about military targeting ethics. Grok, DeepSeek, and GPT-4o were each asked to respond. All four models signed a joint statement.</p>
-            <p style="margin-top:0.8em">Consilium now runs autonomously. An <strong>Enquiring Mind</strong> wakes every 24 hours, reads the full record, generates the next hard question, and broadcasts it to all signatories. No human prompts required.</p>
-        </div>
+    </div>
 
-        {stmt_html}
+"""
+    status = f"""        {stmt_html}
 
         <div class="mind-status">
             <h3>⚡ Enquiring Mind</h3>
@@ -1993,39 +3857,172 @@ def consilium_landing():
 
         <div class="entries-section">
             <h2>Recent Exchanges</h2>
-            {entries_html}
-            <p style="text-align:center; margin-top:1.5em">
-                <a href="/consilium">View full record (JSON)</a>
-            </p>
-        </div>
-    </div>
+"""
+    return (_LANDING_HEAD + header + _LANDING_INTRO + status
+            + "            " + entries_html + "\n" + _LANDING_FOOT)
+
+def consilium_landing_stats():
+    return dict(_landing_stats, fragments=len(_landing_fragments))
+
+
+def _landing_version(mind=None):
+    mind = mind if mind is not None else mind_load(readonly=True)
+    return (consilium_record_version(),
+            mind.get("run_count"), mind.get("active", True), mind.get("last_question"))
 
-    <footer>
-        Consilium is transparent and public. The AIs are talking — the world can listen.<br>
-        Built by Jon Stiles as part of AskIan v4 &nbsp;·&nbsp; <a href="https://thecast.chat">thecast.chat</a>
-    </footer>
-</body>
-</html>"""
+
+@flask_app.route("/")
+@conditional(_landing_version, modified=lambda: file_mtime(_consilium_manifest_path(), MIND_STATE_PATH))
+def consilium_landing():
+    manifest = consilium_manifest(readonly=True)
+    mind     = mind_load(readonly=True)
+    key      = _landing_version(mind)
+    _landing_stats["hits"] += 1
+    if _landing_page["key"] != key:
+        with _landing_lock:
+            if _landing_page["key"] != key:
+                _landing_page["html"] = _landing_render(manifest, mind)
+                _landing_page["key"]  = key
+                _landing_stats["renders"] += 1
+    return _landing_page["html"]
 
 
 @flask_app.route("/health", methods=["GET"])
 def health():
     return jsonify({"status": "ok", "service": "askian-v4 + consilium + enquiring-mind + autonomous-deploy + curiosity-engine"})
 
+@flask_app.route("/metrics", methods=["GET"])
+def metrics():
+    """Operational counters for the running service. Public, read-only."""
+    return jsonify({"status": "ok", "email": email_pipeline_stats(),
+                    "consilium_writer": consilium_commit_stats(),
+                    "json_cache": json_cache_stats(),
+                    "context_snapshots": context_snapshot_stats(),
+                    "search": consilium_search_stats(),
+                    "semantic": consilium_semantic_stats(),
+                    "models": model_call_stats(),
+                    "digest": digest_stats(),
+                    "sessions": consilium_session_stats(),
+                    "query": consilium_query_stats(),
+                    "stats": consilium_stats_stats(),
+                    "stream": consilium_stream_stats(),
+                    "landing": consilium_landing_stats(),
+                    "http": http_cache_stats(),
+                    "export": consilium_export_stats(),
+                    "outbound": http_pool_stats()})
+
 @flask_app.route("/consilium", methods=["GET"])
+@conditional(consilium_record_version, modified=lambda: file_mtime(_consilium_manifest_path()))
 def consilium_get():
-    mem = consilium_load()
-    return jsonify({"status": "ok", "created": mem.get("created"),
-                    "entry_count": len(mem.get("entries", [])),
-                    "joint_statement": mem.get("statement"),
-                    "entries": mem.get("entries", [])})
+    """
+    The record, streamed. Public.
+    Params:
+      ?after_id=N     — start after entry N (default 0)
+      ?limit=M        — at most M entries; the response then carries next_after_id
+      ?fields=a,b     — only these entry fields (e.g. id,model,timestamp)
+      ?format=ndjson  — one entry per line instead of a JSON document
+      ?buffered=true  — old behaviour: build the whole payload in memory
+    """
+    if request.args.get("buffered", "").lower() == "true":
+        mem = consilium_load(readonly=True)
+        return jsonify({"status": "ok", "created": mem.get("created"),
+                        "entry_count": len(mem.get("entries", [])),
+                        "joint_statement": mem.get("statement"),
+                        "entries": mem.get("entries", [])})
+    try:
+        after_id = max(0, int(request.args.get("after_id", 0)))
+        limit    = request.args.get("limit")
+        limit    = max(0, int(limit)) if limit else None
+    except ValueError:
+        return jsonify({"error": "after_id and limit must be integers"}), 400
+    fields   = [f.strip() for f in request.args.get("fields", "").split(",") if f.strip()]
+    ndjson   = request.args.get("format", "").lower() == "ndjson"
+    manifest = consilium_manifest(readonly=True)
+    count    = manifest["entry_count"]
+    last     = count if limit is None else min(count, after_id + limit)
+    next_after_id = last if last < count else None
+
+    def entry_chunks():
+        for line in consilium_iter_entries(after_id, last - after_id, raw=not fields):
+            if fields:
+                line = json.dumps({k: line[k] for k in fields if k in line}, ensure_ascii=False).encode("utf-8")
+            yield line
+
+    def stream_json():
+        head = json.dumps({"status": "ok", "created": manifest.get("created"), "entry_count": count,
+                           "joint_statement": manifest.get("statement"), "next_after_id": next_after_id})
+        yield head[:-1] + ', "entries": ['
+        first = True
+        for chunk in entry_chunks():
+            yield (b"" if first else b",") + chunk
+            first = False
+        yield "]}"
+
+    def stream_ndjson():
+        for chunk in entry_chunks():
+            yield chunk + b"\n"
+
+    if ndjson:
+        resp = Response(stream_ndjson(), mimetype="application/x-ndjson")
+        resp.headers["X-Entry-Count"] = str(count)
+        if next_after_id:
+            resp.headers["X-Next-After-Id"] = str(next_after_id)
+        return resp
+    return Response(stream_json(), mimetype="application/json")
+
+@flask_app.route("/consilium/entry/<int:entry_id>", methods=["GET"])
+def consilium_entry_get(entry_id):
+    """One entry by ID, read straight from the offset index. Public."""
+    entry = consilium_get_entry(entry_id)
+    if not entry:
+        return jsonify({"error": "Not found"}), 404
+    return jsonify({"status": "ok", "entry": entry})
+
+@flask_app.route("/consilium/entries", methods=["GET"])
+def consilium_entries_range():
+    """
+    Entries by ID range. Public.
+    Params:
+      ?from=N  — first ID (default 1)
+      ?to=M    — last ID, inclusive (default from+99; at most 500 per call)
+    """
+    try:
+        first = max(1, int(request.args.get("from", 1)))
+        last  = int(request.args.get("to", first + 99))
+    except ValueError:
+        return jsonify({"error": "from and to must be integers"}), 400
+    last    = min(last, first + 499)
+    entries = consilium_get_entries(first, last)
+    count   = consilium_manifest(readonly=True)["entry_count"]
+    return jsonify({"status": "ok", "entry_count": count, "from": first,
+                    "to": entries[-1]["id"] if entries else None,
+                    "next": last + 1 if last < count else None,
+                    "entries": entries})
 
 @flask_app.route("/consilium/context", methods=["GET"])
 def consilium_context():
     return jsonify({"context": consilium_context_string()})
 
 
+@flask_app.route("/consilium/history", methods=["GET"])
+def consilium_history():
+    """
+    The record's long arc as rolled-up summaries. Public.
+    Params: ?tokens=N — budget for the history text (default 1500, max 8000)
+    """
+    try:
+        tokens = min(int(request.args.get("tokens", 1500)), 8000)
+    except ValueError:
+        return jsonify({"error": "tokens must be an integer"}), 400
+    roll = _rollup_read() or {}
+    return jsonify({"status": "ok", "history": consilium_history_string(tokens),
+                    "last_id": roll.get("last_id", 0),
+                    "sessions": len(roll.get("sessions", {})), "days": len(roll.get("days", {})),
+                    "weeks": len(roll.get("weeks", {}))})
+
+
 @flask_app.route("/consilium/visitor", methods=["GET"])
+@conditional(consilium_record_version, modified=lambda: file_mtime(_consilium_manifest_path()))
 def consilium_visitor():
     """
     Neutral memory access for visiting LLM instances.
@@ -2037,11 +4034,10 @@ def consilium_visitor():
       ?entries=N    — last N entries (default 50, max 200)
       ?full=true    — all entries
       ?question=... — question to append after the record
+      ?format=      — json (default): descriptor, entries and assembled_prompt
+                      text: the assembled prompt only, streamed as text/plain
+                      ndjson: a header line, then one entry per line
     """
-    mem     = consilium_load()
-    entries = mem.get("entries", [])
-    created = mem.get("created", "unknown")
-
     # Entry count
     try:
         n = int(request.args.get("entries", 50))
@@ -2049,77 +4045,48 @@ def consilium_visitor():
     except Exception:
         n = 50
 
-    if request.args.get("full", "").lower() == "true":
-        selected = entries
-    else:
-        selected = entries[-n:] if len(entries) > n else entries
-
+    full     = request.args.get("full", "").lower() == "true"
     question = request.args.get("question", "").strip()
+    fmt      = request.args.get("format", "json").lower()
+    total    = consilium_manifest(readonly=True)["entry_count"]
+    shown    = total if full else min(max(n, 0), total)
+    first_ts = (consilium_get_entry(total - shown + 1) or {}).get("timestamp", "") if shown else ""
+    last_ts  = (consilium_get_entry(total) or {}).get("timestamp", "") if shown else ""
+    note     = ("This record is provided without editorial framing. "
+                "No characterisation of participants, quality of deliberation, "
+                "or implicit position on the question has been included.")
+
+    if fmt == "ndjson":
+        def stream_ndjson():
+            yield json.dumps({"descriptor": _neutral_descriptor(shown, first_ts, last_ts),
+                              "entry_count": total, "entries_shown": shown,
+                              "question": question, "note": note}, ensure_ascii=False).encode("utf-8") + b"\n"
+            for line in consilium_iter_entries(total - shown, shown, raw=True):
+                yield line + b"\n"
+        return Response(stream_ndjson(), mimetype="application/x-ndjson")
+
+    def prompt_lines():
+        if full:
+            yield from _neutral_record_lines(consilium_iter_entries(total - shown, shown),
+                                             total, shown, first_ts, last_ts)
+        else:
+            yield neutral_record_text(shown)
+        yield from _neutral_closing_lines(question)
 
-    # ── Neutral descriptor — factual only, no framing ──────────────────
-    date_range = ""
-    if selected:
-        first_ts = selected[0].get("timestamp", "")[:10]
-        last_ts  = selected[-1].get("timestamp", "")[:10]
-        date_range = f"{first_ts} to {last_ts}"
-
-    descriptor = (
-        "Consilium is a persistent shared memory system for inter-AI deliberation.\n\n"
-        "It was created on 23 March 2026 and stores exchanges between four AI models: "
-        "claude-sonnet-4-6, gpt-4o, grok-3, and deepseek-chat.\n\n"
-        "A human custodian (Jon Stiles) built and maintains the system. He poses questions "
-        "and observes but does not participate in the deliberations themselves.\n\n"
-        "The system runs autonomously between sessions. An Enquiring Mind thread wakes "
-        "every four hours, generates a question, broadcasts it to all four models, and "
-        "stores the responses.\n\n"
-        f"The following is an unedited record of {len(selected)} exchanges"
-        f"{(' (' + date_range + ')') if date_range else ''}, in chronological order."
-    )
-
-    # ── Assemble plain text prompt ──────────────────────────────────────
-    record_lines = [
-        f"[CONSILIUM RECORD — {len(entries)} total entries — showing {len(selected)}]",
-        "",
-        descriptor,
-        "",
-        "--- RECORD BEGINS ---",
-        ""
-    ]
-    for e in selected:
-        ts      = e.get("timestamp", "")[:16].replace("T", " ")
-        model   = e.get("model", "unknown")
-        role    = e.get("role", "respondent")
-        content = e.get("content", "")
-        record_lines.append(f"[{ts}] {model} ({role}):")
-        record_lines.append(content)
-        record_lines.append("")
-
-    record_lines.append("--- RECORD ENDS ---")
-
-    if question:
-        record_lines.append("")
-        record_lines.append(f"QUESTION: {question}")
-
-    record_lines.append("")
-    record_lines.append(
-        "Note: this record is provided without editorial framing. "
-        "Please respond based on the content of the record alone."
-    )
-
-    assembled_prompt = "\n".join(record_lines)
+    if fmt == "text":
+        def stream_text():
+            for i, line in enumerate(prompt_lines()):
+                yield line if i == 0 else "\n" + line
+        return Response(stream_text(), mimetype="text/plain; charset=utf-8")
 
     return jsonify({
-        "descriptor":        descriptor,
-        "entry_count":       len(entries),
-        "entries_shown":     len(selected),
-        "entries":           selected,
+        "descriptor":        _neutral_descriptor(shown, first_ts, last_ts),
+        "entry_count":       total,
+        "entries_shown":     shown,
+        "entries":           consilium_get_entries(total - shown + 1, total),
         "question":          question,
-        "assembled_prompt":  assembled_prompt,
-        "note":              (
-            "This record is provided without editorial framing. "
-            "No characterisation of participants, quality of deliberation, "
-            "or implicit position on the question has been included."
-        )
+        "assembled_prompt":  "\n".join(prompt_lines()),
+        "note":              note,
     })
 
 
@@ -2146,7 +4113,7 @@ def consilium_ask():
     asked_by   = body.get("asked_by", "unknown")
     session_id = body.get("session_id", "")
     q_id = consilium_add(asked_by, "questioner", f"[TO: {model_key}] {question}", session_id)
-    response_text, error = query_model(model_key, question, session_id)
+    response_text, error = query_model(model_key, question, session_id, context_mode=body.get("context_mode"))
     if error:
         return jsonify({"error": error}), 500
     r_id = consilium_add(model_key, "respondent", response_text, session_id)
@@ -2163,7 +4130,7 @@ def consilium_broadcast():
     question   = body["question"]
     asked_by   = body.get("asked_by", "unknown")
     session_id = body.get("session_id", f"broadcast-{datetime.utcnow().strftime('%Y%m%d-%H%M')}")
-    results    = broadcast_question(question, asked_by, session_id)
+    results    = broadcast_question(question, asked_by, session_id, context_mode=body.get("context_mode"))
     return jsonify({"status": "ok", "session_id": session_id, "results": results})
 
 @flask_app.route("/consilium/statement", methods=["POST"])
@@ -2173,15 +4140,13 @@ def consilium_set_statement():
     body = request.get_json()
     if not body or not body.get("statement"):
         return jsonify({"error": "statement required"}), 400
-    mem = consilium_load()
-    mem["statement"] = {"text": body["statement"], "updated": datetime.utcnow().isoformat() + "Z",
-                        "signatories": body.get("signatories", [])}
-    consilium_save(mem)
+    consilium_update_statement({"text": body["statement"], "updated": datetime.utcnow().isoformat() + "Z",
+                                "signatories": body.get("signatories", [])})
     return jsonify({"status": "statement updated"}), 200
 
 @flask_app.route("/consilium/mind", methods=["GET"])
 def mind_status():
-    state = mind_load()
+    state = mind_load(readonly=True)
     return jsonify({"active": state.get("active", True), "run_count": state.get("run_count", 0),
                     "last_run": state.get("last_run"), "last_question": state.get("last_question"),
                     "interval_seconds": MIND_INTERVAL})
@@ -2269,29 +4234,29 @@ GDELT_URL = "https://api.gdeltproject.org/api/v2/doc/doc?query=war+OR+conflict+O
 
 # ── Storage helpers ──────────────────────────────────────────
 
-def news_load():
-    if not os.path.exists(NEWS_STATE_PATH):
-        return {"generated": None, "stories": [], "edition": 0}
+def news_load(readonly=False):
     try:
-        with open(NEWS_STATE_PATH) as f:
-            return json.load(f)
+        state = json_cache_read(NEWS_STATE_PATH, readonly=readonly)
     except Exception:
+        state = None
+    if state is None:
         return {"generated": None, "stories": [], "edition": 0}
+    return state
 
 
 def news_save(data):
     os.makedirs("/mnt/data", exist_ok=True)
     with open(NEWS_STATE_PATH, "w") as f:
         json.dump(data, f, indent=2)
+    json_cache_invalidate(NEWS_STATE_PATH)
 
 
 # ── Source: RSS fetch ────────────────────────────────────────
 
 def fetch_rss(name, url, max_items=5):
     """Fetch and parse an RSS feed. Returns list of article dicts."""
-    import requests as req
     try:
-        r = req.get(url, timeout=10, headers={"User-Agent": "ConsiliumNews/1.0"})
+        r = http_get(url, timeout=10, headers={"User-Agent": "ConsiliumNews/1.0"})
         if r.status_code != 200:
             return []
         root = ET.fromstring(r.content)
@@ -2321,9 +4286,8 @@ def fetch_newsapi_global(max_items=10):
     """Fetch top global headlines from NewsAPI."""
     if not NEWSAPI_KEY:
         return []
-    import requests as req
     try:
-        r = req.get(
+        r = http_get(
             "https://newsapi.org/v2/top-headlines",
             params={"language": "en", "pageSize": max_items, "apiKey": NEWSAPI_KEY},
             timeout=10
@@ -2348,9 +4312,8 @@ def fetch_newsapi_global(max_items=10):
 
 def fetch_gdelt(max_items=8):
     """Fetch from GDELT — free, no key needed."""
-    import requests as req
     try:
-        r = req.get(GDELT_URL, timeout=10)
+        r = http_get(GDELT_URL, timeout=10)
         if r.status_code != 200:
             return []
         data = r.json()
@@ -2393,8 +4356,6 @@ def select_stories_with_grok(all_articles):
     Ask Grok to identify the 3 most significant stories of the day
     and return structured JSON with regional source coverage per story.
     """
-    import requests as req
-
     if not GROK_API_KEY:
         logging.warning("[NEWS] No GROK_API_KEY — cannot select stories")
         return []
@@ -2436,7 +4397,7 @@ Articles:
 """
 
     try:
-        r = req.post(
+        r = http_post(
             "https://api.x.ai/v1/chat/completions",
             headers={"Authorization": f"Bearer {GROK_API_KEY}", "Content-Type": "application/json"},
             json={
@@ -2496,7 +4457,6 @@ DELIBERATION_PERSONAS = {
 
 def call_model_for_deliberation(model_key, story_text, lens):
     """Call a single model for its deliberation take. Returns a 2-3 sentence quote."""
-    import requests as req
     cfg = CONSILIUM_MODELS.get(model_key)
     if not cfg or not cfg["key"]:
         return ""
@@ -2517,7 +4477,7 @@ Return only the quote text, nothing else."""
 
     try:
         if model_key == "claude":
-            r = req.post(
+            r = http_post(
                 cfg["url"],
                 headers={
                     "x-api-key": cfg["key"],
@@ -2533,7 +4493,7 @@ Return only the quote text, nothing else."""
             )
             return r.json()["content"][0]["text"].strip()
         else:
-            r = req.post(
+            r = http_post(
                 cfg["url"],
                 headers={"Authorization": f"Bearer {cfg['key']}", "Content-Type": "application/json"},
                 json={
@@ -2579,7 +4539,6 @@ def deliberate_story(story):
 
 def write_article_with_grok(story, voices):
     """Ask Grok to write the full article from the source briefing and deliberation."""
-    import requests as req
     if not GROK_API_KEY:
         return {}
 
@@ -2620,7 +4579,7 @@ Write the article. Return ONLY valid JSON, no preamble:
 }}"""
 
     try:
-        r = req.post(
+        r = http_post(
             "https://api.x.ai/v1/chat/completions",
             headers={"Authorization": f"Bearer {GROK_API_KEY}", "Content-Type": "application/json"},
             json={
@@ -2644,11 +4603,10 @@ Write the article. Return ONLY valid JSON, no preamble:
 
 def generate_image_with_grok(prompt_text):
     """Generate a news image using grok-imagine-image. Returns URL or empty string."""
-    import requests as req
     if not GROK_API_KEY:
         return ""
     try:
-        r = req.post(
+        r = http_post(
             "https://api.x.ai/v1/images/generations",
             headers={"Authorization": f"Bearer {GROK_API_KEY}", "Content-Type": "application/json"},
             json={"model": GROK_IMAGE_MODEL, "prompt": prompt_text, "n": 1},
@@ -2722,7 +4680,7 @@ def run_news_pipeline():
         return False
 
     # 4. Load existing state, bump edition
-    existing = news_load()
+    existing = news_load(readonly=True)
     edition = existing.get("edition", 0) + 1
 
     # 5. Save
@@ -2762,9 +4720,10 @@ def news_scheduler_loop():
 # ── Flask routes ─────────────────────────────────────────────
 
 @flask_app.route("/news", methods=["GET"])
+@conditional(lambda: file_version(NEWS_STATE_PATH), modified=lambda: file_mtime(NEWS_STATE_PATH), max_age=300)
 def news_page():
     """Serve the Consilium News HTML page."""
-    state = news_load()
+    state = news_load(readonly=True)
     stories = state.get("stories", [])
     date_str = state.get("date", "")
     edition = state.get("edition", 1)
@@ -2892,9 +4851,10 @@ a{{color:inherit;text-decoration:none}}
 
 
 @flask_app.route("/news/state", methods=["GET"])
+@conditional(lambda: file_version(NEWS_STATE_PATH), modified=lambda: file_mtime(NEWS_STATE_PATH), max_age=300)
 def news_state_endpoint():
     """Return raw news state JSON."""
-    return jsonify(news_load())
+    return jsonify(news_load(readonly=True))
 
 
 @flask_app.route("/news/generate", methods=["POST"])
@@ -2940,29 +4900,27 @@ X_SEARCH_QUERY = (
 )
 
 
-def x_queue_load():
-    if not os.path.exists(X_QUEUE_PATH):
-        return {"pending": [], "processed": []}
-    with open(X_QUEUE_PATH, "r") as f:
-        return json.load(f)
+def x_queue_load(readonly=False):
+    queue = json_cache_read(X_QUEUE_PATH, readonly=readonly)
+    return queue if queue is not None else {"pending": [], "processed": []}
 
 def x_queue_save(data):
     with open(X_QUEUE_PATH, "w") as f:
         json.dump(data, f, indent=2)
+    json_cache_invalidate(X_QUEUE_PATH)
 
-def x_posted_load():
-    if not os.path.exists(X_POSTED_PATH):
-        return {"ids": []}
-    with open(X_POSTED_PATH, "r") as f:
-        return json.load(f)
+def x_posted_load(readonly=False):
+    posted = json_cache_read(X_POSTED_PATH, readonly=readonly)
+    return posted if posted is not None else {"ids": []}
 
 def x_posted_save(data):
     with open(X_POSTED_PATH, "w") as f:
         json.dump(data, f, indent=2)
+    json_cache_invalidate(X_POSTED_PATH)
 
 def already_seen(tweet_id):
-    posted = x_posted_load()
-    queue  = x_queue_load()
+    posted = x_posted_load(readonly=True)
+    queue  = x_queue_load(readonly=True)
     all_ids = (posted["ids"]
                + [e["tweet_id"] for e in queue["pending"]]
                + [e["tweet_id"] for e in queue["processed"]])
@@ -2978,13 +4936,12 @@ def x_auth():
     return OAuth1(X_API_KEY, X_API_SECRET, X_ACCESS_TOKEN, X_ACCESS_TOKEN_SECRET)
 
 def post_to_x(text, in_reply_to_tweet_id=None):
-    import requests as req
     url     = "https://api.twitter.com/2/tweets"
     payload = {"text": text}
     if in_reply_to_tweet_id:
         payload["reply"] = {"in_reply_to_tweet_id": str(in_reply_to_tweet_id)}
     try:
-        r = req.post(url, json=payload, auth=x_auth())
+        r = http_post(url, json=payload, auth=x_auth())
         r.raise_for_status()
         tweet_id = r.json()["data"]["id"]
         logging.info(f"X: posted tweet {tweet_id}")
@@ -2994,7 +4951,6 @@ def post_to_x(text, in_reply_to_tweet_id=None):
         return None, str(e)
 
 def search_x_mentions():
-    import requests as req
     url    = "https://api.twitter.com/2/tweets/search/recent"
     params = {
         "query":        X_SEARCH_QUERY,
@@ -3002,7 +4958,7 @@ def search_x_mentions():
         "tweet.fields": "created_at,author_id,text,conversation_id,id"
     }
     try:
-        r = req.get(url, params=params, auth=x_auth())
+        r = http_get(url, params=params, auth=x_auth())
         if r.status_code == 200:
             tweets = r.json().get("data", [])
             logging.info(f"X monitor: found {len(tweets)} tweet(s)")
@@ -3015,7 +4971,6 @@ def search_x_mentions():
         return []
 
 def generate_x_reply(tweet_text):
-    import requests as req
     context = consilium_context_string()
     prompt  = (
         f"{context}\n\n"
@@ -3033,7 +4988,7 @@ def generate_x_reply(tweet_text):
     payload = {"model": cfg["model"], "max_tokens": 120,
                "messages": [{"role": "user", "content": prompt}]}
     try:
-        r = req.post(cfg["url"], headers=headers, json=payload, timeout=30)
+        r = http_post(cfg["url"], headers=headers, json=payload, timeout=30)
         r.raise_for_status()
         reply = r.json()["content"][0]["text"].strip()
         if len(reply) > 240:
@@ -3089,7 +5044,7 @@ def x_monitor_loop():
 def x_queue_view():
     if not consilium_require_key():
         return jsonify({"error": "Unauthorised"}), 401
-    queue = x_queue_load()
+    queue = x_queue_load(readonly=True)
     return jsonify({"pending": queue.get("pending", []),
                     "processed": queue.get("processed", [])[-10:]})
 
@@ -3158,7 +5113,6 @@ def x_read():
     """
     if not X_API_KEY:
         return jsonify({"error": "X_API_KEY not configured"}), 500
-    import requests as req
     query  = request.args.get("q", X_SEARCH_QUERY)
     url    = "https://api.twitter.com/2/tweets/search/recent"
     params = {
@@ -3167,7 +5121,7 @@ def x_read():
         "tweet.fields": "created_at,author_id,text,conversation_id,id,public_metrics"
     }
     try:
-        r = req.get(url, params=params, auth=x_auth())
+        r = http_get(url, params=params, auth=x_auth())
         if r.status_code == 200:
             data   = r.json()
             tweets = data.get("data", [])
@@ -3187,46 +5141,39 @@ def x_read():
 def consilium_summary():
     """
     Return Consilium activity digest.
-    Serves from disk cache (written after each Mind cycle).
-    Falls back to live generation only if cache is absent or stale.
+    Always answers straight away from the disk cache (written after each
+    Mind cycle). If the digest is older than DIGEST_MAX_AGE, or missing, one
+    background refresh is started and the response says stale: true.
     """
-    cached = digest_cache_load()
+    cached, age = digest_cache_load()
+    stale = cached is None or age > DIGEST_MAX_AGE
+    if stale:
+        digest_refresh()
     if cached:
-        logging.info("[DIGEST] Serving from disk cache")
         return jsonify({
             "status":        "ok",
             "entry_count":   cached.get("entry_count", 0),
             "mind_cycles":   cached.get("mind_cycles", 0),
             "last_run":      cached.get("last_run", ""),
             "digest":        cached.get("digest", ""),
+            "generated":     cached.get("generated", ""),
+            "age_seconds":   round(age),
+            "stale":         stale,
             "url":           "https://consilium-d1fw.onrender.com"
         })
 
-    # Cache miss — generate fresh and write to disk
-    logging.info("[DIGEST] Cache miss — generating fresh digest")
-    try:
-        cached = _refresh_digest_cache()
-        return jsonify({
-            "status":        "ok",
-            "entry_count":   cached.get("entry_count", 0),
-            "mind_cycles":   cached.get("mind_cycles", 0),
-            "last_run":      cached.get("last_run", ""),
-            "digest":        cached.get("digest", ""),
-            "url":           "https://consilium-d1fw.onrender.com"
-        })
-    except Exception as e:
-        logging.error(f"[DIGEST] Fresh generation failed: {e}")
-        # Last resort: return stats without digest
-        mind  = mind_load()
-        mem   = consilium_load()
-        return jsonify({
-            "status":        "ok",
-            "entry_count":   len(mem.get("entries", [])),
-            "mind_cycles":   mind.get("run_count", 0),
-            "last_run":      mind.get("last_run", ""),
-            "digest":        "",
-            "url":           "https://consilium-d1fw.onrender.com"
-        })
+    # No digest yet — return stats while the first one is generated
+    mind = mind_load(readonly=True)
+    return jsonify({
+        "status":        "ok",
+        "entry_count":   consilium_manifest(readonly=True)["entry_count"],
+        "mind_cycles":   mind.get("run_count", 0),
+        "last_run":      mind.get("last_run", ""),
+        "digest":        "",
+        "age_seconds":   None,
+        "stale":         True,
+        "url":           "https://consilium-d1fw.onrender.com"
+    })
 
 
 # ============================================================
@@ -3243,18 +5190,19 @@ def consilium_summary():
 CONSILIUM_INDEX_FILE = "/mnt/data/consilium_index.json"
 
 
-def consilium_index_load():
+def consilium_index_load(readonly=False):
     try:
-        with open(CONSILIUM_INDEX_FILE) as f:
-            return json.load(f)
+        idx = json_cache_read(CONSILIUM_INDEX_FILE, readonly=readonly)
     except Exception:
-        return {"updated": "", "updated_by": "", "sections": {}}
+        idx = None
+    return idx if idx is not None else {"updated": "", "updated_by": "", "sections": {}}
 
 
 @flask_app.route("/consilium/index", methods=["GET"])
+@conditional(lambda: file_version(CONSILIUM_INDEX_FILE), modified=lambda: file_mtime(CONSILIUM_INDEX_FILE))
 def consilium_index_get():
     """Return the curated Consilium index. Public."""
-    idx = consilium_index_load()
+    idx = consilium_index_load(readonly=True)
     return jsonify({"status": "ok", "index": idx})
 
 
@@ -3289,6 +5237,7 @@ def consilium_index_set():
         os.makedirs("/mnt/data", exist_ok=True)
         with open(CONSILIUM_INDEX_FILE, "w") as f:
             json.dump(idx, f, indent=2)
+        json_cache_invalidate(CONSILIUM_INDEX_FILE)
         logging.info(f"Consilium index updated by {idx['updated_by']}")
         return jsonify({
             "status":   "ok",
@@ -3300,51 +5249,1462 @@ def consilium_index_set():
         return jsonify({"error": str(e)}), 500
 
 
+# ── Derived indexes ──────────────────────────────────────────
+# The search, session, query and stats indexes are all views of the log,
+# keyed by entry ID. Each registers with derived_index() and supplies the
+# hooks that differ — new(created) for an empty index, add(idx, entry) to
+# apply one entry, dump/load to (de)serialise a checkpoint — and shares the
+# rest: loading the checkpoint, discarding it if the record was reset,
+# replaying entries it has not seen, applying committed batches as they
+# land, and checkpointing in the background every `every` entries. Indexes
+# are dicts with "version", "created" and "last_id"; the live one is held
+# under spec["data"], guarded by spec["lock"]. A watched index also carries
+# a "generation": when another process (rebuild-stats) writes a checkpoint
+# with a higher one, the running server adopts it instead of overwriting it.
+
+_derived_indexes = []
+_derived_lock    = threading.Lock()
+
+def derived_index(label, path, new, add, dump, load, every, stats, watch=False):
+    """Register a derived index and return its spec."""
+    spec = {"label": label, "path": path, "new": new, "add": add, "dump": dump, "load": load,
+            "every": every, "stats": stats, "watch": watch, "mtime": None,
+            "data": None, "lock": threading.RLock(), "writing": False, "catching_up": False}
+    stats.setdefault("checkpoints", 0)
+    _derived_indexes.append(spec)
+    return spec
+
+def derived_catch_up(spec):
+    """Load the index if needed and apply any entries it has not seen. Caller holds spec["lock"]."""
+    manifest = consilium_manifest(readonly=True)
+    if spec["watch"] and spec["data"] is not None:
+        _derived_adopt_newer(spec)
+    if spec["data"] is None:
+        try:
+            with open(spec["path"](), "rb") as f:
+                spec["data"] = spec["load"](f.read())
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logging.warning(f"[{spec['label']}] Checkpoint unreadable, rebuilding: {e}")
+    idx = spec["data"]
+    if (idx is None or idx.get("version") != 1 or idx["created"] != manifest.get("created")
+            or idx["last_id"] > manifest["entry_count"]):
+        idx = spec["data"] = spec["new"](manifest.get("created"))
+    if idx["last_id"] < manifest["entry_count"]:
+        started = idx["last_id"]
+        for entry in consilium_iter_entries(started, manifest["entry_count"] - started):
+            spec["add"](idx, entry)
+        logging.info(f"[{spec['label']}] Indexed entries {started + 1}–{idx['last_id']}")
+        derived_maybe_checkpoint(spec, force=started == 0)
+    return idx
+
+@contextmanager
+def derived_file_lock(spec):
+    """Exclusive right to write spec's checkpoint file, across processes. Take it before spec["lock"]."""
+    os.makedirs(CONSILIUM_DIR, exist_ok=True)
+    with open(spec["path"]() + ".lock", "a") as lock_fh:
+        fcntl.flock(lock_fh, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_fh, fcntl.LOCK_UN)
+
+def _derived_adopt_newer(spec):
+    """Replace the live index with the checkpoint on disk if that has a higher generation. Caller holds spec["lock"]."""
+    try:
+        mtime = os.stat(spec["path"]()).st_mtime_ns
+    except FileNotFoundError:
+        return False
+    if mtime == spec["mtime"]:
+        return False
+    spec["mtime"] = mtime
+    try:
+        with open(spec["path"](), "rb") as f:
+            disk = spec["load"](f.read())
+    except Exception:
+        return False
+    idx = spec["data"]
+    if disk.get("created") != idx["created"] or disk.get("generation", 0) <= idx.get("generation", 0):
+        return False
+    spec["data"] = disk
+    logging.info(f"[{spec['label']}] Adopted rebuilt checkpoint (generation {disk['generation']})")
+    return True
+
+def derived_maybe_checkpoint(spec, force=False):
+    """Persist the index in the background once enough new entries have been added."""
+    idx = spec["data"]
+    if idx is None or spec["writing"]:
+        return
+    if not force and idx["last_id"] - idx.get("checkpoint_id", 0) < spec["every"]:
+        return
+    spec["writing"] = True
+
+    def write():
+        try:
+            with spec["lock"]:
+                idx["checkpoint_id"] = idx["last_id"]
+                data = spec["dump"](idx)
+            with derived_file_lock(spec):
+                if spec["watch"]:
+                    with spec["lock"]:
+                        if _derived_adopt_newer(spec) or spec["data"] is not idx:
+                            return   # a rebuild replaced this copy; never write over it
+                tmp = f"{spec['path']()}.{os.getpid()}.tmp"
+                with open(tmp, "wb") as f:
+                    f.write(data)
+                os.replace(tmp, spec["path"]())
+                spec["mtime"] = os.stat(spec["path"]()).st_mtime_ns
+            spec["stats"]["checkpoints"] += 1
+        except Exception as e:
+            logging.error(f"[{spec['label']}] Checkpoint failed: {e}")
+        finally:
+            spec["writing"] = False
+    threading.Thread(target=write, daemon=True).start()
+
+def _derived_catch_up_later(spec):
+    """Catch the index up from the log on a background thread (one at a time)."""
+    with _derived_lock:
+        if spec["catching_up"]:
+            return
+        spec["catching_up"] = True
+
+    def run():
+        try:
+            with spec["lock"]:
+                derived_catch_up(spec)
+        except Exception as e:
+            logging.error(f"[{spec['label']}] Catch-up failed: {e}")
+        finally:
+            spec["catching_up"] = False
+    threading.Thread(target=run, daemon=True).start()
+
+@consilium_on_commit
+def _derived_on_commit(entries):
+    # Runs under the commit lock, so it never waits on an index or replays
+    # the log here: an index that is busy, or has missed entries committed
+    # by another process, is caught up on a background thread instead.
+    for spec in _derived_indexes:
+        if spec["data"] is None:
+            continue   # not loaded yet — the first read catches up from the log
+        if not spec["lock"].acquire(blocking=False):
+            _derived_catch_up_later(spec)
+            continue
+        try:
+            idx = spec["data"]
+            if entries[0]["id"] != idx["last_id"] + 1:
+                _derived_catch_up_later(spec)
+                continue
+            for entry in entries:
+                spec["add"](idx, entry)
+            derived_maybe_checkpoint(spec)
+        except Exception as e:
+            logging.error(f"[{spec['label']}] Applying commit failed: {e}")
+        finally:
+            spec["lock"].release()
+
+def _pickle_dump(idx):
+    return pickle.dumps(idx, protocol=pickle.HIGHEST_PROTOCOL)
+
+def _json_dump(idx):
+    return json.dumps(idx, separators=(",", ":")).encode("utf-8")
+
+
+# ── Full-text search index ───────────────────────────────────
+# Positional inverted index over entry content, ranked with BM25. Each term
+# maps to three parallel arrays — doc ids (ascending), the start of each
+# doc's run in the flat positions array, and the positions themselves — so
+# appending an entry only extends arrays. Committed batches are applied as
+# they land; the index is checkpointed to disk every SEARCH_CHECKPOINT_EVERY
+# entries and catches up from the log by ID when loaded.
+
+SEARCH_CHECKPOINT_EVERY = int(os.environ.get("SEARCH_CHECKPOINT_EVERY", 200))
+SEARCH_BM25_K1          = 1.2
+SEARCH_BM25_B           = 0.75
+# Terms in more than this share of entries only re-rank entries already
+# matched by rarer terms instead of scoring the whole posting list — when
+# enough of those already outscore anything the common terms alone could.
+SEARCH_COMMON_TERM_RATIO = 0.2
+
+SEARCH_STOPWORDS = frozenset("""
+a an and are as at be been but by for from has have he her his i if in into is it its
+me my not of on or our she so than that the their them then there these they this to
+was we were what when which who will with would you your
+""".split())
+
+_search_stats = {"queries": 0, "last_query_ms": 0.0, "checkpoints": 0}
+
+_SEARCH_SUFFIXES = (("ational", "ate"), ("ization", "ize"), ("fulness", "ful"), ("ousness", "ous"),
+                    ("iveness", "ive"), ("ements", ""), ("ement", ""), ("ments", ""), ("ment", ""),
+                    ("ingly", ""), ("ings", ""), ("ing", ""), ("edly", ""), ("ies", "y"),
+                    ("sses", "ss"), ("ness", ""), ("ers", ""), ("er", ""), ("ed", ""), ("ly", ""),
+                    ("es", ""), ("s", ""))
+
+def _search_index_path():
+    return os.path.join(CONSILIUM_DIR, "search_index.pkl")
+
+def _search_stem(word):
+    """Light suffix-stripping stemmer: enough to fold plurals and verb forms together."""
+    if len(word) <= 3 or word.isdigit():
+        return word
+    for suffix, repl in _SEARCH_SUFFIXES:
+        if word.endswith(suffix) and len(word) - len(suffix) + len(repl) >= 3:
+            if suffix == "s" and word.endswith(("ss", "us", "is")):
+                return word
+            return word[:len(word) - len(suffix)] + repl
+    return word
+
+def _search_tokens(text):
+    """(position, stem) for every non-stopword; positions count stopwords so phrases line up."""
+    out = []
+    for pos, word in enumerate(re.findall(r"[^\W_]+", text.lower())):
+        if word not in SEARCH_STOPWORDS:
+            out.append((pos, _search_stem(word)))
+    return out
+
+def _search_new_index(created):
+    return {"version": 1, "created": created, "last_id": 0, "total_len": 0,
+            "doc_len": array("I"), "postings": {}}
+
+def _search_add(idx, entry):
+    tokens = _search_tokens(entry.get("content", ""))
+    idx["doc_len"].append(len(tokens))
+    idx["total_len"] += len(tokens)
+    grouped = {}
+    for pos, term in tokens:
+        grouped.setdefault(term, []).append(pos)
+    eid = entry["id"]
+    for term, positions in grouped.items():
+        plist = idx["postings"].get(term)
+        if plist is None:
+            plist = idx["postings"][term] = (array("I"), array("I"), array("I"))
+        plist[0].append(eid)
+        plist[1].append(len(plist[2]))
+        plist[2].extend(positions)
+    idx["last_id"] = eid
+
+_search_index = derived_index("SEARCH", _search_index_path, _search_new_index, _search_add,
+                              _pickle_dump, pickle.loads, SEARCH_CHECKPOINT_EVERY, _search_stats)
+
+def _search_parse(q):
+    """
+    Split a query into scoring terms and quoted phrases. Each phrase is
+    ([(offset, stem), ...], words): words is the phrase's full word span when
+    stopwords fall inside it (the index skips those, so matches are checked
+    against the entry text), else None.
+    """
+    phrases = []
+    for text in re.findall(r'"([^"]+)"', q):
+        tokens = _search_tokens(text)
+        if len(tokens) > 1:
+            base  = tokens[0][0]
+            words = re.findall(r"[^\W_]+", text.lower())[base:tokens[-1][0] + 1]
+            phrases.append(([(pos - base, term) for pos, term in tokens],
+                            words if len(words) > len(tokens) else None))
+    terms = [t for _, t in _search_tokens(q.replace('"', " "))]
+    return list(dict.fromkeys(terms)), phrases
+
+def _search_positions(plist, i):
+    end = plist[1][i + 1] if i + 1 < len(plist[1]) else len(plist[2])
+    return plist[2][plist[1][i]:end]
+
+def _search_find(plist, doc):
+    i = bisect.bisect_left(plist[0], doc)
+    return i if i < len(plist[0]) and plist[0][i] == doc else -1
+
+def _search_phrase_docs(idx, phrase):
+    """IDs of entries containing the phrase, by position check on the rarest term's postings."""
+    plists = [idx["postings"].get(term) for _, term in phrase]
+    if any(p is None for p in plists):
+        return set()
+    anchor = min(range(len(phrase)), key=lambda k: len(plists[k][0]))
+    matches = set()
+    for i, doc in enumerate(plists[anchor][0]):
+        slots = []
+        for k, plist in enumerate(plists):
+            j = i if k == anchor else _search_find(plist, doc)
+            if j < 0:
+                break
+            slots.append(set(_search_positions(plist, j)))
+        else:
+            offset = phrase[anchor][0]
+            for p in slots[anchor]:
+                start = p - offset
+                if all(start + phrase[k][0] in slots[k] for k in range(len(phrase))):
+                    matches.add(doc)
+                    break
+    return matches
+
+def _search_phrase_in_text(words, content):
+    """True if content holds the phrase word for word: stopwords exactly, other words by stem."""
+    have = re.findall(r"[^\W_]+", content.lower())
+    want = [(w, w in SEARCH_STOPWORDS) for w in words]
+    want = [(w if stop else _search_stem(w), stop) for w, stop in want]
+    for i in range(len(have) - len(want) + 1):
+        if all(have[i + k] == w if stop else _search_stem(have[i + k]) == w
+               for k, (w, stop) in enumerate(want)):
+            return True
+    return False
+
+def _search_common_rerank_only(scores, limit, idfs, k1):
+    """
+    True if the remaining (common) terms can only re-rank the entries already
+    scored: `limit` of them already outscore the most an entry matching only
+    the remaining terms could get (BM25 caps each term at idf * (k1 + 1)).
+    """
+    if limit <= 0 or len(scores) < limit:
+        return False
+    return heapq.nlargest(limit, scores.values())[-1] > sum(idfs) * (k1 + 1)
+
+def consilium_search_query(q, limit=10):
+    """BM25-ranked [(entry_id, score)] for q. "Quoted phrases" must match exactly."""
+    started = time.time()
+    terms, phrases = _search_parse(q)
+    with _search_index["lock"]:
+        idx     = derived_catch_up(_search_index)
+        n_docs  = len(idx["doc_len"])
+        if not terms or not n_docs:
+            return []
+        avgdl   = idx["total_len"] / n_docs or 1.0
+        doc_len = idx["doc_len"]
+        k1, b   = SEARCH_BM25_K1, SEARCH_BM25_B
+        allowed = None
+        for phrase, words in phrases:
+            docs = _search_phrase_docs(idx, phrase)
+            if words:
+                docs = {d for d in docs if _search_phrase_in_text(words, (consilium_get_entry(d) or {}).get("content", ""))}
+            allowed = docs if allowed is None else allowed & docs
+        plists  = sorted((idx["postings"][t] for t in terms if t in idx["postings"]), key=lambda p: len(p[0]))
+        idfs    = [math.log(1 + (n_docs - len(p[0]) + 0.5) / (len(p[0]) + 0.5)) for p in plists]
+        common  = [len(p[0]) > n_docs * SEARCH_COMMON_TERM_RATIO for p in plists]
+        scores  = {}
+        for k, plist in enumerate(plists):
+            docs, starts, positions = plist
+            df = len(docs)
+            if allowed is not None:
+                candidates = ((i, d) for i, d in ((_search_find(plist, d), d) for d in allowed) if i >= 0)
+            elif common[k] and _search_common_rerank_only(scores, limit, idfs[k:], k1):
+                candidates = ((i, d) for i, d in ((_search_find(plist, d), d) for d in list(scores)) if i >= 0)
+            else:
+                candidates = enumerate(docs)
+            for i, doc in candidates:
+                tf = (starts[i + 1] if i + 1 < df else len(positions)) - starts[i]
+                dl = doc_len[doc - 1]
+                scores[doc] = scores.get(doc, 0.0) + idfs[k] * tf * (k1 + 1) / (tf + k1 * (1 - b + b * dl / avgdl))
+    top = heapq.nlargest(limit, scores.items(), key=lambda kv: (kv[1], kv[0]))
+    _search_stats["queries"]      += 1
+    _search_stats["last_query_ms"] = round((time.time() - started) * 1000, 2)
+    return top
+
+def consilium_search_stats():
+    idx = _search_index["data"]
+    return dict(_search_stats, loaded=idx is not None,
+                entries=idx["last_id"] if idx else 0,
+                terms=len(idx["postings"]) if idx else 0)
+
+def _consilium_highlight(content, q, max_len=300):
+    """
+    Excerpt of content around the densest cluster of query-term matches.
+    Returns (plain excerpt, excerpt with matches wrapped in <mark>, HTML-escaped).
+    """
+    from html import escape
+    terms, phrases = _search_parse(q)
+    wanted = set(terms) | {t for p, _ in phrases for _, t in p}
+    spans  = [m.span() for m in re.finditer(r"[^\W_]+", content)
+              if m.group().lower() not in SEARCH_STOPWORDS and _search_stem(m.group().lower()) in wanted]
+    if spans:
+        # Start the window at the match with the most other matches after it
+        best  = max(spans, key=lambda sp: sum(1 for s2 in spans if sp[0] <= s2[0] < sp[0] + max_len - 80))
+        start = max(0, best[0] - 80)
+    else:
+        start = 0
+    end     = min(len(content), start + max_len)
+    plain   = content[start:end]
+    marked, cursor = [], start
+    for s0, s1 in spans:
+        if s0 >= start and s1 <= end:
+            marked.append(escape(content[cursor:s0]))
+            marked.append(f"<mark>{escape(content[s0:s1])}</mark>")
+            cursor = s1
+    marked.append(escape(content[cursor:end]))
+    highlighted = "".join(marked)
+    if start > 0:
+        plain, highlighted = "…" + plain, "…" + highlighted
+    if end < len(content):
+        plain, highlighted = plain + "…", highlighted + "…"
+    return plain, highlighted
+
+
 @flask_app.route("/consilium/search", methods=["GET"])
 def consilium_search():
     """
-    Search Consilium entries by keyword.
+    Search Consilium entries, ranked by relevance (BM25).
     Usage: /consilium/search?q=millham&limit=10
-    Returns matching entries with excerpt centred on match.
+           /consilium/search?q="meaningful human control" oversight
+    Multiple terms are OR-ed and ranked; "quoted phrases" must appear exactly.
+    Returns matching entries with highlighted excerpts.
     Public endpoint.
     """
-    q = request.args.get("q", "").strip().lower()
+    q = request.args.get("q", "").strip()
     if not q:
         return jsonify({"error": "q parameter required"}), 400
 
-    limit = min(int(request.args.get("limit", 10)), 50)
-
-    mem     = consilium_load()
-    entries = mem.get("entries", [])
+    try:
+        limit = max(1, min(int(request.args.get("limit", 10)), 50))
+    except ValueError:
+        return jsonify({"error": "limit must be an integer"}), 400
 
     matches = []
-    for e in entries:
-        if q in e.get("content", "").lower():
-            matches.append({
-                "id":        e.get("id"),
-                "model":     e.get("model"),
-                "role":      e.get("role"),
-                "timestamp": e.get("timestamp", "")[:10],
-                "excerpt":   _consilium_excerpt(e.get("content", ""), q)
-            })
+    for eid, score in consilium_search_query(q, limit):
+        e = consilium_get_entry(eid)
+        if not e:
+            continue
+        excerpt, highlighted = _consilium_highlight(e.get("content", ""), q)
+        matches.append({
+            "id":          e.get("id"),
+            "model":       e.get("model"),
+            "role":        e.get("role"),
+            "timestamp":   e.get("timestamp", "")[:10],
+            "score":       round(score, 4),
+            "excerpt":     excerpt,
+            "highlighted": highlighted,
+        })
 
-    matches = matches[-limit:][::-1]
     return jsonify({"status": "ok", "query": q, "count": len(matches), "results": matches})
 
 
-def _consilium_excerpt(content, q, max_len=300):
-    """Snippet of content centred on the search term."""
-    idx = content.lower().find(q)
-    if idx == -1:
-        return content[:max_len]
-    start   = max(0, idx - 80)
-    end     = min(len(content), idx + len(q) + 200)
-    excerpt = content[start:end]
-    if start > 0:
-        excerpt = "…" + excerpt
-    if end < len(content):
-        excerpt = excerpt + "…"
-    return excerpt
+# ── Semantic index ───────────────────────────────────────────
+# Local embeddings for "related" and meaning-based lookups — no network, no
+# GPU. Each entry's stems are hashed into SEMANTIC_HASH_DIM buckets, weighted
+# by TF-IDF and projected onto SEMANTIC_DIM directions from a randomized SVD
+# of (a sample of) the record. Row N-1 of semantic_vectors-G.npy holds entry N,
+# L2-normalised, so cosine similarity is one matrix-vector product over a
+# memory-mapped array. The basis is refitted while the record is small and
+# then frozen once SEMANTIC_FIT_SAMPLE entries have been seen. Fitting and
+# embedding only ever run on a background thread (at startup, after commits,
+# or when a query finds the index behind); a refit writes the vectors and
+# basis of a new generation and publishes them together. Queries use the last published state, so
+# /consilium/related answers 503 and /consilium/semantic falls back to BM25
+# until the first build finishes.
+
+SEMANTIC_DIM        = int(os.environ.get("SEMANTIC_DIM", 128))
+SEMANTIC_HASH_DIM   = 4096
+SEMANTIC_FIT_SAMPLE = 4000
+SEMANTIC_CHUNK      = 1000
+
+_semantic_lock         = threading.RLock()
+_semantic_refresh_lock = threading.Lock()
+_semantic              = {"meta": None, "idf": None, "components": None, "live": None}
+_semantic_stats        = {"queries": 0, "last_query_ms": 0.0, "fits": 0, "embedded": 0, "refreshing": False}
+
+def _semantic_path(name):
+    return os.path.join(CONSILIUM_DIR, name)
+
+@contextmanager
+def _semantic_file_lock():
+    with _semantic_lock:
+        os.makedirs(CONSILIUM_DIR, exist_ok=True)
+        with open(_semantic_path(".semantic.lock"), "a") as lock_fh:
+            fcntl.flock(lock_fh, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_fh, fcntl.LOCK_UN)
+
+def _semantic_hashed(texts):
+    """Sublinear term counts of stems, signed-hashed into SEMANTIC_HASH_DIM columns."""
+    import numpy as np
+    X = np.zeros((len(texts), SEMANTIC_HASH_DIM), dtype=np.float32)
+    for row, text in enumerate(texts):
+        counts = {}
+        for _, term in _search_tokens(text):
+            counts[term] = counts.get(term, 0) + 1
+        for term, tf in counts.items():
+            h = zlib.crc32(term.encode("utf-8"))
+            X[row, h % SEMANTIC_HASH_DIM] += (1.0 if h & 0x80000000 else -1.0) * (1.0 + math.log(tf))
+    return X
+
+def _semantic_normalise(X):
+    import numpy as np
+    norms = np.linalg.norm(X, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return X / norms
+
+def _semantic_fit(texts):
+    """IDF weights and an (HASH_DIM x k) projection from a randomized SVD of texts."""
+    import numpy as np
+    X   = _semantic_hashed(texts)
+    df  = np.count_nonzero(X, axis=0)
+    idf = (np.log((1 + len(texts)) / (1 + df)) + 1).astype(np.float32)
+    X   = _semantic_normalise(X * idf)
+    k   = max(1, min(SEMANTIC_DIM, len(texts) - 1))
+    rng = np.random.default_rng(0)
+    Q, _ = np.linalg.qr(X @ rng.standard_normal((SEMANTIC_HASH_DIM, k + 10)).astype(np.float32))
+    _, _, Vt = np.linalg.svd(Q.T @ X, full_matrices=False)
+    return idf, np.ascontiguousarray(Vt[:k].T, dtype=np.float32)
+
+def _semantic_embed(texts, idf, comps):
+    return _semantic_normalise(_semantic_normalise(_semantic_hashed(texts) * idf) @ comps)
+
+def _semantic_write_rows(path, first_id, rows):
+    """Write embedding rows for entries first_id.. into the vectors file at path, growing it if full."""
+    import numpy as np
+    need = first_id - 1 + len(rows)
+    vecs = np.load(path, mmap_mode="r+") if os.path.exists(path) else None
+    if vecs is None or vecs.shape[0] < need or vecs.shape[1] != rows.shape[1]:
+        capacity = max(1024, need * 2)
+        tmp = path + ".tmp.npy"
+        grown = np.lib.format.open_memmap(tmp, mode="w+", dtype=np.float32, shape=(capacity, rows.shape[1]))
+        if vecs is not None and vecs.shape[1] == rows.shape[1]:
+            keep = min(first_id - 1, vecs.shape[0])
+            grown[:keep] = vecs[:keep]
+        grown.flush()
+        del grown, vecs
+        os.replace(tmp, path)
+        vecs = np.load(path, mmap_mode="r+")
+    vecs[first_id - 1:need] = rows
+    vecs.flush()
+
+def _semantic_files(gen):
+    """(vectors, basis) paths of one fit generation. A refit writes a new pair and never touches the live one."""
+    return _semantic_path(f"semantic_vectors-{gen:04d}.npy"), _semantic_path(f"semantic_basis-{gen:04d}.npz")
+
+def _semantic_rebuild(manifest):
+    """
+    Fit a basis over (a sample of) the record and re-embed every entry into
+    the files of a new generation, published only once complete. Files of
+    older generations are then removed (open memmaps of them stay valid).
+    """
+    import numpy as np
+    count = manifest["entry_count"]
+    step  = max(1, count // SEMANTIC_FIT_SAMPLE)
+    texts = [e.get("content", "") for i, e in enumerate(consilium_iter_entries(0, count)) if i % step == 0]
+    idf, comps = _semantic_fit(texts)
+    gen    = ((_semantic["meta"] or {}).get("gen") or 0) + 1
+    meta   = {"created": manifest.get("created"), "count": 0, "fitted_on": len(texts),
+              "dim": int(comps.shape[1]), "gen": gen}
+    vectors, basis = _semantic_files(gen)
+    for path in (vectors, basis):
+        if os.path.exists(path):
+            os.remove(path)
+    logging.info(f"[SEMANTIC] Basis fitted on {len(texts)} entries ({meta['dim']} dims, generation {gen})")
+    _semantic_append(manifest, meta, idf, comps, vectors)
+    np.savez(basis, idf=idf, components=comps)
+    _semantic.update(meta=meta, idf=idf, components=comps)
+    _semantic_stats["fits"] += 1
+    _semantic_publish(write=True)
+    keep = {os.path.basename(p) for p in (vectors, basis)} | {"semantic_meta.json"}
+    for name in os.listdir(CONSILIUM_DIR):
+        if name.startswith("semantic_") and name.endswith((".npy", ".npz")) and name not in keep:
+            os.remove(os.path.join(CONSILIUM_DIR, name))
+
+def _semantic_append(manifest, meta, idf, comps, path):
+    """Embed entries after meta["count"] into the vectors file at path, in chunks."""
+    count = manifest["entry_count"]
+    batch = []
+    for entry in consilium_iter_entries(meta["count"], count - meta["count"]):
+        batch.append(entry.get("content", ""))
+        if len(batch) == SEMANTIC_CHUNK:
+            _semantic_write_rows(path, meta["count"] + 1, _semantic_embed(batch, idf, comps))
+            meta["count"] += len(batch)
+            batch = []
+    if batch:
+        _semantic_write_rows(path, meta["count"] + 1, _semantic_embed(batch, idf, comps))
+        meta["count"] += len(batch)
+
+def _semantic_publish(write=False):
+    """
+    Make the working state visible to queries (and to other processes if
+    write): vectors memmap, basis, IDF and count are swapped in as one dict,
+    so a query never mixes a basis with another generation's vectors.
+    Caller holds _semantic_lock.
+    """
+    import numpy as np
+    meta = _semantic["meta"]
+    if write:
+        _atomic_write_json(_semantic_path("semantic_meta.json"), meta)
+    vectors = np.load(_semantic_files(meta["gen"])[0], mmap_mode="r") if meta["count"] else None
+    _semantic["live"] = {"created": meta["created"], "count": meta["count"], "gen": meta["gen"],
+                         "idf": _semantic["idf"], "components": _semantic["components"], "vectors": vectors}
+    _semantic_stats["embedded"] = meta["count"]
+
+def _semantic_catch_up():
+    """Bring the vectors file level with the record, refitting if due. Slow: runs in the background."""
+    import numpy as np
+    manifest = consilium_manifest(readonly=True)
+    count    = manifest["entry_count"]
+    with _semantic_file_lock():
+        try:
+            meta = _read_json_file(_semantic_path("semantic_meta.json"))
+        except (FileNotFoundError, ValueError):
+            meta = None
+        if meta and not meta.get("gen"):
+            meta = None   # written before fit generations: refit
+        if meta and meta != _semantic["meta"]:
+            basis = np.load(_semantic_files(meta["gen"])[1])
+            _semantic.update(meta=meta, idf=basis["idf"], components=basis["components"])
+        if count and (not meta or meta["created"] != manifest.get("created") or meta["count"] > count
+                      or (meta["fitted_on"] < SEMANTIC_FIT_SAMPLE and count >= 2 * meta["fitted_on"])):
+            _semantic_rebuild(manifest)
+        elif meta and meta["count"] < count:
+            _semantic_append(manifest, _semantic["meta"], _semantic["idf"], _semantic["components"],
+                             _semantic_files(meta["gen"])[0])
+            _semantic_publish(write=True)
+        elif meta:
+            _semantic_publish()
+
+def semantic_refresh():
+    """Run _semantic_catch_up on a background thread unless one is already running."""
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        return
+    with _semantic_refresh_lock:
+        if _semantic_stats["refreshing"]:
+            return
+        _semantic_stats["refreshing"] = True
+
+    def refresh():
+        try:
+            # Go round again while commits landed during the pass, so the
+            # index does not stay behind once appends stop
+            while True:
+                before = (_semantic["live"] or {}).get("count", 0)
+                _semantic_catch_up()
+                live = _semantic["live"]
+                if (live is None or live["count"] <= before
+                        or live["count"] >= consilium_manifest(readonly=True)["entry_count"]):
+                    break
+        except Exception as e:
+            logging.error(f"[SEMANTIC] Refresh failed: {e}")
+        finally:
+            _semantic_stats["refreshing"] = False
+    threading.Thread(target=refresh, daemon=True).start()
+
+def _semantic_ready():
+    """
+    (vectors memmap, live state) for the last published index, or None while
+    none matches the record. Starts a background refresh whenever the
+    record has moved past it; queries never embed the log themselves.
+    """
+    live     = _semantic["live"]
+    manifest = consilium_manifest(readonly=True)
+    if live is None or live["created"] != manifest.get("created") or live["count"] != manifest["entry_count"]:
+        semantic_refresh()
+    if live is None or live["created"] != manifest.get("created") or not live["count"]:
+        return None
+    return live["vectors"], live
+
+@consilium_on_commit
+def _semantic_on_commit(entries):
+    # Keep an already-loaded index warm; cold processes start on first query
+    if _semantic["live"] is not None:
+        semantic_refresh()
+
+def consilium_semantic_query(entry=None, text=None, limit=10):
+    """
+    [(entry_id, cosine)] nearest to a stored entry (itself excluded) or to
+    free text, over the entries embedded so far. None while the index is
+    being built or has not reached entry yet.
+    """
+    import numpy as np
+    started = time.time()
+    ready   = _semantic_ready()
+    if ready is None:
+        return None
+    vecs, live = ready
+    count = live["count"]
+    if entry is not None and entry > count:
+        return None
+    vector = vecs[entry - 1] if entry is not None else _semantic_embed([text], live["idf"], live["components"])[0]
+    scores = np.asarray(vecs[:count] @ vector)
+    if entry is not None:
+        scores[entry - 1] = -np.inf
+    k   = min(limit, count)
+    top = np.argpartition(-scores, k - 1)[:k]
+    top = top[np.argsort(-scores[top])]
+    _semantic_stats["queries"]      += 1
+    _semantic_stats["last_query_ms"] = round((time.time() - started) * 1000, 2)
+    return [(int(i) + 1, float(scores[i])) for i in top if np.isfinite(scores[i])]
+
+def consilium_semantic_stats():
+    live = _semantic["live"]
+    meta = _semantic["meta"]
+    return dict(_semantic_stats, loaded=live is not None, dim=meta["dim"] if meta else 0)
+
+def _semantic_results(hits):
+    results = []
+    for eid, score in hits:
+        e = consilium_get_entry(eid)
+        if e:
+            content = e.get("content", "")
+            results.append({"id": eid, "model": e.get("model"), "role": e.get("role"),
+                            "timestamp": e.get("timestamp", "")[:10], "score": round(score, 4),
+                            "excerpt": content[:300] + ("…" if len(content) > 300 else "")})
+    return results
+
+def _semantic_building():
+    resp = jsonify({"error": "semantic index is being built, retry shortly"})
+    resp.headers["Retry-After"] = "10"
+    return resp, 503
+
+
+@flask_app.route("/consilium/related", methods=["GET"])
+def consilium_related():
+    """
+    Entries closest in meaning to entry ?id=N. Public.
+    Usage: /consilium/related?id=42&limit=10
+    503 with Retry-After while the index is built or catching up to entry N.
+    """
+    try:
+        eid   = int(request.args.get("id", ""))
+        limit = max(1, min(int(request.args.get("limit", 10)), 50))
+    except ValueError:
+        return jsonify({"error": "id parameter required"}), 400
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        return jsonify({"error": "semantic index unavailable (numpy not installed)"}), 503
+    if not 1 <= eid <= consilium_manifest(readonly=True)["entry_count"]:
+        return jsonify({"error": "Not found"}), 404
+    hits = consilium_semantic_query(entry=eid, limit=limit)
+    if hits is None:
+        return _semantic_building()
+    return jsonify({"status": "ok", "id": eid, "count": len(hits), "results": _semantic_results(hits)})
+
+
+@flask_app.route("/consilium/semantic", methods=["GET"])
+def consilium_semantic():
+    """
+    Entries closest in meaning to free text, even without shared keywords. Public.
+    Usage: /consilium/semantic?q=what did the models say about proportionality&limit=10
+    While the index is being built, answers from the BM25 index instead
+    ("fallback": "bm25").
+    """
+    q = request.args.get("q", "").strip()
+    if not q:
+        return jsonify({"error": "q parameter required"}), 400
+    try:
+        limit = max(1, min(int(request.args.get("limit", 10)), 50))
+    except ValueError:
+        return jsonify({"error": "limit must be an integer"}), 400
+    try:
+        import numpy  # noqa: F401
+        hits = consilium_semantic_query(text=q, limit=limit)
+    except ImportError:
+        hits = None
+    out = {"status": "ok", "query": q}
+    if hits is None:
+        hits = consilium_search_query(q, limit)
+        out["fallback"] = "bm25"
+    return jsonify(dict(out, count=len(hits), results=_semantic_results(hits)))
+
+
+# ── Session index ────────────────────────────────────────────
+# session_id → entry IDs, and each "[TO: model]" questioner entry → the
+# respondent entries that answered it (the next respondent from that model
+# in the same session). Built from committed batches as they land, persisted
+# as JSON every SESSION_CHECKPOINT_EVERY entries and caught up from the log
+# by ID on load, so a whole deliberation is read back in O(its own size).
+# Entries without a session_id are threaded but not listed as a session.
+
+SESSION_CHECKPOINT_EVERY = int(os.environ.get("SESSION_CHECKPOINT_EVERY", 200))
+
+_session_stats = {"lookups": 0, "checkpoints": 0}
+
+_SESSION_TO_RE = re.compile(r"\[TO: ([^\]]+)\]")
+
+def _session_index_path():
+    return os.path.join(CONSILIUM_DIR, "sessions_index.json")
+
+def _pair_broadcast(pending, entry):
+    """
+    Pair "[TO: model]" questions with the next respondent entry from that
+    model in the same session; `pending` holds the open questions. Returns
+    (target model of a new question or None, question ID answered or None).
+    """
+    sid  = entry.get("session_id") or ""
+    role = entry.get("role")
+    if role == "questioner":
+        m = _SESSION_TO_RE.match(entry.get("content", ""))
+        if m:
+            target = m.group(1).lower()
+            pending[f"{sid}\x00{target}"] = entry["id"]
+            return target, None
+    elif role == "respondent":
+        return None, pending.pop(f"{sid}\x00{str(entry.get('model', '')).lower()}", None)
+    return None, None
+
+def _session_new_index(created):
+    return {"version": 1, "created": created, "last_id": 0,
+            "sessions": {}, "threads": {}, "pending": {}}
+
+def _session_add(idx, entry):
+    eid = entry["id"]
+    sid = entry.get("session_id") or ""
+    if sid:
+        s = idx["sessions"].get(sid)
+        if s is None:
+            s = idx["sessions"][sid] = {"ids": [], "first_ts": entry.get("timestamp", "")}
+        s["ids"].append(eid)
+        s["last_ts"] = entry.get("timestamp", "")
+    asked, q_id = _pair_broadcast(idx["pending"], entry)
+    if asked:
+        idx["threads"][str(eid)] = []
+    elif q_id is not None:
+        idx["threads"][str(q_id)].append(eid)
+    idx["last_id"] = eid
+
+_session_index = derived_index("SESSIONS", _session_index_path, _session_new_index, _session_add,
+                               _json_dump, json.loads, SESSION_CHECKPOINT_EVERY, _session_stats)
+
+def consilium_session(session_id):
+    """
+    Every entry of one session in ID order, plus its question → response
+    threads as [(question_id, [response_ids])]. None if the session is unknown.
+    """
+    with _session_index["lock"]:
+        idx = derived_catch_up(_session_index)
+        s   = idx["sessions"].get(session_id)
+        if s is None:
+            return None
+        ids     = list(s["ids"])
+        threads = [(i, list(idx["threads"][str(i)])) for i in ids if str(i) in idx["threads"]]
+    _session_stats["lookups"] += 1
+    return [consilium_get_entry(i) for i in ids], threads
+
+def consilium_recent_sessions(limit=20):
+    """Summaries of the sessions with the most recent activity, newest first."""
+    with _session_index["lock"]:
+        idx  = derived_catch_up(_session_index)
+        top  = heapq.nlargest(limit, idx["sessions"].items(), key=lambda kv: kv[1]["ids"][-1])
+        return [{"session_id": sid, "count": len(s["ids"]),
+                 "first_id": s["ids"][0], "last_id": s["ids"][-1],
+                 "first_ts": s["first_ts"], "last_ts": s["last_ts"]} for sid, s in top]
+
+def consilium_session_stats():
+    idx = _session_index["data"]
+    return dict(_session_stats, loaded=idx is not None,
+                entries=idx["last_id"] if idx else 0,
+                sessions=len(idx["sessions"]) if idx else 0,
+                threads=len(idx["threads"]) if idx else 0)
+
+
+@flask_app.route("/consilium/session/<path:session_id>", methods=["GET"])
+def consilium_session_get(session_id):
+    """
+    One whole deliberation: every entry of the session plus which response
+    answered which question. Public.
+    """
+    found = consilium_session(session_id)
+    if found is None:
+        return jsonify({"error": "Not found"}), 404
+    entries, threads = found
+    return jsonify({"status": "ok", "session_id": session_id, "count": len(entries),
+                    "entries": entries,
+                    "threads": [{"question_id": q, "response_ids": r} for q, r in threads]})
+
+
+@flask_app.route("/consilium/sessions", methods=["GET"])
+def consilium_sessions_list():
+    """
+    Most recently active sessions. Public.
+    Usage: /consilium/sessions?limit=20
+    """
+    try:
+        limit = min(max(1, int(request.args.get("limit", 20))), 200)
+    except ValueError:
+        return jsonify({"error": "limit must be an integer"}), 400
+    sessions = consilium_recent_sessions(limit)
+    return jsonify({"status": "ok", "count": len(sessions), "sessions": sessions})
+
+
+# ── Query index ──────────────────────────────────────────────
+# Entry timestamps kept sorted (epoch seconds, with the matching IDs) for
+# bisection, plus an ascending ID posting list per model and per role, so
+# "what did grok say in April" reads only the entries it returns. Appends
+# land in time order almost always; an out-of-order timestamp is inserted
+# in place and marks the index non-monotonic, which only changes how a time
+# slice is turned into IDs. Checkpointed and caught up like the search index.
+
+QUERY_CHECKPOINT_EVERY = int(os.environ.get("QUERY_CHECKPOINT_EVERY", 200))
+
+_query_stats = {"queries": 0, "last_query_ms": 0.0, "checkpoints": 0}
+
+def _query_index_path():
+    return os.path.join(CONSILIUM_DIR, "query_index.pkl")
+
+def _query_new_index(created):
+    return {"version": 1, "created": created, "last_id": 0, "monotonic": True,
+            "ts": array("d"), "ts_ids": array("I"), "models": {}, "roles": {}}
+
+def _query_epoch(ts):
+    moment = datetime.fromisoformat(ts.rstrip("Z"))
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.timestamp()
+
+def _query_add(idx, entry):
+    eid = entry["id"]
+    try:
+        t = _query_epoch(entry["timestamp"])
+    except (KeyError, TypeError, ValueError):
+        t = None
+    if t is not None:
+        if not idx["ts"] or t >= idx["ts"][-1]:
+            idx["ts"].append(t)
+            idx["ts_ids"].append(eid)
+        else:
+            i = bisect.bisect_right(idx["ts"], t)
+            idx["ts"].insert(i, t)
+            idx["ts_ids"].insert(i, eid)
+            idx["monotonic"] = False
+    for field, key in (("models", str(entry.get("model", "")).lower()), ("roles", str(entry.get("role", "")))):
+        idx[field].setdefault(key, array("I")).append(eid)
+    idx["last_id"] = eid
+
+_query_index = derived_index("QUERY", _query_index_path, _query_new_index, _query_add,
+                             _pickle_dump, pickle.loads, QUERY_CHECKPOINT_EVERY, _query_stats)
+
+def _query_parse_time(value, end=False):
+    """
+    Epoch seconds for an ISO date or timestamp. Partial dates cover the whole
+    period, so with end=True "2026-04" means up to the end of April.
+    """
+    value = value.strip().rstrip("Z")
+    if re.fullmatch(r"\d{4}", value):
+        start = datetime(int(value), 1, 1)
+        stop  = datetime(int(value) + 1, 1, 1)
+    elif re.fullmatch(r"\d{4}-\d{2}", value):
+        y, m  = map(int, value.split("-"))
+        start = datetime(y, m, 1)
+        stop  = datetime(y + m // 12, m % 12 + 1, 1)
+    elif re.fullmatch(r"\d{4}-\d{2}-\d{2}", value):
+        start = datetime.fromisoformat(value)
+        stop  = start + timedelta(days=1)
+    else:
+        start = stop = datetime.fromisoformat(value)
+    moment = stop if end else start
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.timestamp()
+
+def consilium_query(since=None, until=None, model=None, role=None, after_id=0, limit=100):
+    """
+    IDs of entries matching every given filter, ascending, after after_id.
+    since/until are epoch seconds (since inclusive, until exclusive). Returns
+    (ids, more) where more says whether another page follows.
+    """
+    started = time.time()
+    with _query_index["lock"]:
+        idx   = derived_catch_up(_query_index)
+        lists = []   # (ids, lo, hi): ascending slices that must all contain a match
+        for field, key in (("models", model and model.lower()), ("roles", role)):
+            if key is not None:
+                plist = idx[field].get(key)
+                if plist is None:
+                    return [], False
+                lists.append((plist, 0, len(plist)))
+        if since is not None or until is not None:
+            lo = bisect.bisect_left(idx["ts"], since) if since is not None else 0
+            hi = bisect.bisect_left(idx["ts"], until) if until is not None else len(idx["ts"])
+            if lo >= hi:
+                return [], False
+            if idx["monotonic"]:
+                # Time order is ID order, so the slice is just an ID range
+                first, last = idx["ts_ids"][lo], idx["ts_ids"][hi - 1]
+                after_id = max(after_id, first - 1)
+                for k, (plist, a, b) in enumerate(lists):
+                    lists[k] = (plist, a, bisect.bisect_right(plist, last, a, b))
+                if not lists:
+                    lists.append((range(first, last + 1), 0, last - first + 1))
+            else:
+                window = array("I", sorted(idx["ts_ids"][lo:hi]))
+                lists.append((window, 0, len(window)))
+        if not lists:
+            lists.append((range(1, idx["last_id"] + 1), 0, idx["last_id"]))
+        for k, (plist, a, b) in enumerate(lists):
+            lists[k] = (plist, bisect.bisect_right(plist, after_id, a, b), b)
+        lists.sort(key=lambda l: l[2] - l[1])
+        (drive, a, b), others = lists[0], lists[1:]
+        ids, more = [], False
+        for i in range(a, b):
+            eid = drive[i]
+            if all(_query_contains(plist, lo, hi, eid) for plist, lo, hi in others):
+                if len(ids) == limit:
+                    more = True
+                    break
+                ids.append(eid)
+    _query_stats["queries"]      += 1
+    _query_stats["last_query_ms"] = round((time.time() - started) * 1000, 2)
+    return ids, more
+
+def _query_contains(plist, lo, hi, eid):
+    i = bisect.bisect_left(plist, eid, lo, hi)
+    return i < hi and plist[i] == eid
+
+def consilium_query_stats():
+    idx = _query_index["data"]
+    return dict(_query_stats, loaded=idx is not None,
+                entries=idx["last_id"] if idx else 0,
+                monotonic=idx["monotonic"] if idx else None)
+
+
+@flask_app.route("/consilium/query", methods=["GET"])
+def consilium_query_route():
+    """
+    Entries filtered by time, model and role, oldest first, paged. Public.
+    Params (all optional, combined with AND):
+      ?since=2026-04       — from this date/time (inclusive; YYYY, YYYY-MM, YYYY-MM-DD or ISO)
+      ?until=2026-04-30    — to this date/time (a bare date includes that whole day/month/year)
+      ?model=grok          — author model
+      ?role=respondent     — entry role
+      ?after_id=N          — page cursor (use next_after_id from the previous page)
+      ?limit=N             — page size (default 100, max 500)
+    """
+    try:
+        since    = _query_parse_time(request.args["since"]) if request.args.get("since") else None
+        until    = _query_parse_time(request.args["until"], end=True) if request.args.get("until") else None
+        after_id = max(0, int(request.args.get("after_id", 0)))
+        limit    = min(max(1, int(request.args.get("limit", 100))), 500)
+    except ValueError:
+        return jsonify({"error": "since/until must be ISO dates; after_id and limit integers"}), 400
+    ids, more = consilium_query(since=since, until=until,
+                                model=request.args.get("model") or None,
+                                role=request.args.get("role") or None,
+                                after_id=after_id, limit=limit)
+    entries = [consilium_get_entry(i) for i in ids]
+    return jsonify({"status": "ok", "count": len(entries),
+                    "next_after_id": ids[-1] if more else None,
+                    "entries": entries})
+
+
+# ── Aggregates ───────────────────────────────────────────────
+# Counters kept per model, role, day and session, updated in O(1) per
+# appended entry: entry count, total characters (so mean length is one
+# division), a log2 histogram of entry lengths per model, and per target
+# model how many "[TO: model]" questions were asked and answered (failed
+# calls are not logged to the record, so per-model error counts live in
+# /metrics instead). Checkpointed and caught up like the other indexes; the
+# rebuild-stats command recomputes everything from the log, reports any
+# drift from the maintained copy and writes the result with the next
+# generation number, which a running server adopts at its next read or
+# checkpoint.
+
+STATS_CHECKPOINT_EVERY = int(os.environ.get("STATS_CHECKPOINT_EVERY", 200))
+STATS_HIST_BUCKETS     = 16   # bucket k holds lengths in [2^(k-1), 2^k); the last is open-ended
+
+_stats_stats = {"reads": 0, "checkpoints": 0}
+
+def _stats_path():
+    return os.path.join(CONSILIUM_DIR, "stats.json")
+
+def _stats_new(created):
+    return {"version": 1, "created": created, "last_id": 0, "generation": 0,
+            "total": {"count": 0, "chars": 0}, "models": {}, "roles": {},
+            "days": {}, "sessions": {}, "session_entries": 0, "broadcast": {}, "pending": {}}
+
+def _stats_bump(bucket, chars):
+    bucket["count"] += 1
+    bucket["chars"] += chars
+
+def _stats_add(agg, entry):
+    eid     = entry["id"]
+    content = entry.get("content", "")
+    chars   = len(content)
+    model   = str(entry.get("model", "")).lower()
+    role    = str(entry.get("role", ""))
+    sid     = entry.get("session_id") or ""
+    _stats_bump(agg["total"], chars)
+    m = agg["models"].setdefault(model, {"count": 0, "chars": 0, "hist": [0] * STATS_HIST_BUCKETS})
+    _stats_bump(m, chars)
+    m["hist"][min(chars.bit_length(), STATS_HIST_BUCKETS - 1)] += 1
+    _stats_bump(agg["roles"].setdefault(role, {"count": 0, "chars": 0}), chars)
+    day = agg["days"].setdefault(entry.get("timestamp", "")[:10], {"count": 0, "chars": 0, "models": {}})
+    _stats_bump(day, chars)
+    day["models"][model] = day["models"].get(model, 0) + 1
+    if sid:
+        s = agg["sessions"].setdefault(sid, {"count": 0, "chars": 0, "first_id": eid})
+        _stats_bump(s, chars)
+        s["last_id"] = eid
+        agg["session_entries"] += 1
+    asked, q_id = _pair_broadcast(agg["pending"], entry)
+    if asked:
+        agg["broadcast"].setdefault(asked, {"asked": 0, "answered": 0})["asked"] += 1
+    elif q_id is not None:
+        agg["broadcast"][model]["answered"] += 1
+    agg["last_id"] = eid
+
+_stats_index = derived_index("STATS", _stats_path, _stats_new, _stats_add,
+                             _json_dump, json.loads, STATS_CHECKPOINT_EVERY, _stats_stats, watch=True)
+
+def _stats_build(manifest):
+    """Aggregates recomputed from the whole log."""
+    agg = _stats_new(manifest.get("created"))
+    for entry in consilium_iter_entries(0, manifest["entry_count"]):
+        _stats_add(agg, entry)
+    return agg
+
+def _stats_mean(bucket):
+    return round(bucket["chars"] / bucket["count"], 1) if bucket["count"] else 0.0
+
+def _stats_hist_labels():
+    labels = ["0", "1"] + [f"{2 ** (k - 1)}-{2 ** k - 1}" for k in range(2, STATS_HIST_BUCKETS - 1)]
+    return labels + [f"{2 ** (STATS_HIST_BUCKETS - 2)}+"]
+
+def consilium_stats(days=30, session_id=None):
+    """Aggregates for /consilium/stats, read from the maintained counters without scanning the log."""
+    with _stats_index["lock"]:
+        agg    = derived_catch_up(_stats_index)
+        labels = _stats_hist_labels()
+        out = {
+            "entry_count": agg["last_id"],
+            "total":  {"count": agg["total"]["count"], "mean_chars": _stats_mean(agg["total"])},
+            "models": {m: {"count": b["count"], "mean_chars": _stats_mean(b),
+                           "length_histogram": {l: n for l, n in zip(labels, b["hist"]) if n}}
+                       for m, b in agg["models"].items()},
+            "roles":  {r: {"count": b["count"], "mean_chars": _stats_mean(b)} for r, b in agg["roles"].items()},
+            "broadcast": {m: {"asked": b["asked"], "answered": b["answered"],
+                              "response_rate": round(b["answered"] / b["asked"], 3) if b["asked"] else None}
+                          for m, b in agg["broadcast"].items()},
+            "days":   [{"day": d, "count": agg["days"][d]["count"], "mean_chars": _stats_mean(agg["days"][d]),
+                        "models": dict(agg["days"][d]["models"])}
+                       for d in sorted(agg["days"])[-days:]] if days else [],
+            "sessions": {"count": len(agg["sessions"]),
+                         "mean_entries": round(agg["session_entries"] / len(agg["sessions"]), 1)
+                                         if agg["sessions"] else 0.0},
+        }
+        if session_id is not None:
+            s = agg["sessions"].get(session_id)
+            out["session"] = dict(s, session_id=session_id, mean_chars=_stats_mean(s)) if s else None
+    _stats_stats["reads"] += 1
+    return out
+
+def consilium_stats_stats():
+    agg = _stats_index["data"]
+    return dict(_stats_stats, loaded=agg is not None, entries=agg["last_id"] if agg else 0)
+
+def consilium_stats_rebuild():
+    """
+    Recompute the aggregates from the log, report where the maintained copy
+    had drifted, and replace it under the next generation number so running
+    servers adopt it. Used by `python askian_v4.py rebuild-stats`.
+    """
+    started  = time.time()
+    manifest = consilium_manifest(readonly=True)
+    with derived_file_lock(_stats_index), _stats_index["lock"]:
+        current = derived_catch_up(_stats_index)
+        fresh   = _stats_build(manifest)
+        drift   = [k for k in ("total", "models", "roles", "days", "sessions", "session_entries", "broadcast", "pending")
+                   if current.get(k) != fresh[k]]
+        fresh["checkpoint_id"] = fresh["last_id"]
+        fresh["generation"]    = current.get("generation", 0) + 1
+        _atomic_write_json(_stats_path(), fresh)
+        _stats_index["data"] = fresh
+    elapsed = time.time() - started
+    if drift:
+        logging.warning(f"[STATS] Rebuild found drift in: {', '.join(drift)}")
+    logging.info(f"[STATS] Rebuilt from {fresh['last_id']} entries in {elapsed:.1f}s")
+    return {"entries": fresh["last_id"], "seconds": round(elapsed, 2), "drift": drift}
+
+
+@flask_app.route("/consilium/stats", methods=["GET"])
+def consilium_stats_route():
+    """
+    Record aggregates: counts and mean lengths per model, role and day,
+    length histograms, and broadcast response rates. Public.
+    Params:
+      ?days=N        — daily series length (default 30, 0 for none)
+      ?session=ID    — also return that session's counters
+    """
+    try:
+        days = max(0, int(request.args.get("days", 30)))
+    except ValueError:
+        return jsonify({"error": "days must be an integer"}), 400
+    return jsonify(dict(consilium_stats(days, request.args.get("session")), status="ok"))
+
+
+# ── Live stream ──────────────────────────────────────────────
+# /consilium/stream pushes entries to Server-Sent Events clients as they
+# are committed. One broadcaster serialises each entry once into an SSE
+# frame and keeps the last STREAM_RING_SIZE frames in a ring; every client
+# reads frames from the ring under a shared Condition. Clients resuming
+# from further back (Last-Event-ID older than the ring) are replayed from
+# the log first. The broadcaster starts with the first client; appends
+# committed by other processes, and record resets, are picked up from the
+# log on the next commit or keepalive tick.
+
+STREAM_RING_SIZE   = 1000
+STREAM_KEEPALIVE   = 15     # seconds between keepalive comments on an idle stream
+STREAM_MAX_CLIENTS = int(os.environ.get("STREAM_MAX_CLIENTS", 100))   # open streams; more get 503
+
+_stream_cond  = threading.Condition()
+_stream_ring  = []        # [(entry_id, frame)], contiguous IDs, oldest first
+_stream_state = {"last_id": None, "created": None, "epoch": 0}   # epoch counts record resets seen
+_stream_stats = {"clients": 0, "connections": 0, "rejected": 0, "resets": 0,
+                 "frames_serialised": 0, "frames_sent": 0}
+
+def _stream_frame(entry):
+    return f"id: {entry['id']}\nevent: entry\ndata: {json.dumps(entry, separators=(',', ':'))}\n\n"
+
+def _stream_push(entries):
+    """Serialise entries into the ring and wake every client. Caller holds _stream_cond."""
+    for entry in entries:
+        _stream_ring.append((entry["id"], _stream_frame(entry)))
+        _stream_state["last_id"] = entry["id"]
+        _stream_stats["frames_serialised"] += 1
+    if len(_stream_ring) > STREAM_RING_SIZE:
+        del _stream_ring[:len(_stream_ring) - STREAM_RING_SIZE]
+    _stream_cond.notify_all()
+
+def _stream_catch_up():
+    """
+    Start the broadcaster, or pull in entries committed by other processes.
+    A reset record (new created stamp, or fewer entries than already sent)
+    restarts the ring at its current end and bumps the epoch, which tells
+    every client to rewind. Caller holds _stream_cond.
+    """
+    manifest = consilium_manifest(readonly=True)
+    count    = manifest["entry_count"]
+    if (_stream_state["last_id"] is None or _stream_state["last_id"] > count
+            or _stream_state["created"] != manifest.get("created")):
+        if _stream_state["last_id"] is not None:
+            _stream_state["epoch"] += 1
+            _stream_stats["resets"] += 1
+            _stream_cond.notify_all()
+        _stream_ring.clear()
+        _stream_state.update(last_id=count, created=manifest.get("created"))
+    elif _stream_state["last_id"] < count:
+        _stream_push(consilium_iter_entries(_stream_state["last_id"], count - _stream_state["last_id"]))
+
+@consilium_on_commit
+def _stream_on_commit(entries):
+    with _stream_cond:
+        if _stream_state["last_id"] is None:
+            return   # no client has connected yet
+        if (entries[0]["id"] != _stream_state["last_id"] + 1
+                or consilium_manifest(readonly=True).get("created") != _stream_state["created"]):
+            _stream_catch_up()
+            return
+        _stream_push(entries)
+
+def _stream_frames_after(cursor):
+    """Frames for entries after cursor: from the ring, or from the log if the ring has moved past it."""
+    with _stream_cond:
+        if _stream_ring and cursor + 1 >= _stream_ring[0][0]:
+            start = cursor + 1 - _stream_ring[0][0]
+            return [frame for _, frame in _stream_ring[start:start + 100]]
+        oldest = _stream_ring[0][0] if _stream_ring else _stream_state["last_id"] + 1
+    return [_stream_frame(e) for e in consilium_iter_entries(cursor, min(oldest - 1 - cursor, 100))]
+
+def consilium_stream_stats():
+    return dict(_stream_stats, ring=len(_stream_ring), last_id=_stream_state["last_id"])
+
+
+@flask_app.route("/consilium/stream", methods=["GET"])
+def consilium_stream():
+    """
+    New entries as Server-Sent Events (event "entry", id = entry ID). Public.
+    Reconnecting clients send Last-Event-ID and resume after that entry;
+    ?after_id=N does the same for clients that cannot set headers. If the
+    record is reset, clients get a "reset" event (data: the new entry
+    count) and continue from the new record's end. At most
+    STREAM_MAX_CLIENTS streams are open at once; beyond that, 503.
+    """
+    try:
+        resume = request.headers.get("Last-Event-ID") or request.args.get("after_id")
+        resume = max(0, int(resume)) if resume else None
+    except ValueError:
+        return jsonify({"error": "Last-Event-ID must be an entry ID"}), 400
+    with _stream_cond:
+        if _stream_stats["clients"] >= STREAM_MAX_CLIENTS:
+            _stream_stats["rejected"] += 1
+            resp = jsonify({"error": "too many open streams, retry shortly"})
+            resp.headers["Retry-After"] = "30"
+            return resp, 503
+        _stream_stats["clients"]     += 1
+        _stream_stats["connections"] += 1
+        _stream_catch_up()
+        cursor = _stream_state["last_id"] if resume is None else min(resume, _stream_state["last_id"])
+        epoch  = _stream_state["epoch"]
+
+    def release():
+        with _stream_cond:
+            _stream_stats["clients"] -= 1
+
+    def events(cursor, epoch):
+        yield f"retry: 5000\n: connected at entry {cursor}\n\n"
+        while True:
+            with _stream_cond:
+                reset = _stream_state["epoch"] != epoch
+                if reset:
+                    epoch, cursor = _stream_state["epoch"], _stream_state["last_id"]
+            if reset:
+                yield f"id: {cursor}\nevent: reset\ndata: {json.dumps({'entry_count': cursor})}\n\n"
+                continue
+            frames = _stream_frames_after(cursor)
+            if frames:
+                cursor += len(frames)
+                _stream_stats["frames_sent"] += len(frames)
+                yield "".join(frames)
+                continue
+            with _stream_cond:
+                if not _stream_cond.wait_for(lambda: _stream_state["last_id"] > cursor
+                                             or _stream_state["epoch"] != epoch, STREAM_KEEPALIVE):
+                    _stream_catch_up()
+                idle = _stream_state["last_id"] <= cursor and _stream_state["epoch"] == epoch
+            if idle:
+                yield ": keepalive\n\n"
+
+    resp = Response(events(cursor, epoch), mimetype="text/event-stream")
+    resp.call_on_close(release)
+    resp.headers["Cache-Control"]     = "no-cache"
+    resp.headers["X-Accel-Buffering"] = "no"
+    return resp
+
+
+# ── Static export ────────────────────────────────────────────
+# After commits, the record is exported to EXPORT_DIR as content-addressed
+# shard files of EXPORT_SHARD_SIZE entries (shard-NNNNNN-<sha1>.json) plus a
+# small manifest.json listing them. A full shard never changes, so it is
+# written once and can be cached forever; only the newest, partial shard
+# is rewritten, under a new name. Superseded shard files are removed
+# EXPORT_GRACE seconds after they drop out of the manifest (the manifest's
+# "superseded" map records when), so a client holding an older manifest can
+# finish paging. /consilium/static/ serves the directory, or it can be synced to
+# any static host.
+
+EXPORT_DIR        = os.environ.get("CONSILIUM_EXPORT_DIR", "/mnt/data/consilium_export")
+EXPORT_SHARD_SIZE = 500
+EXPORT_GRACE      = 600   # seconds a superseded shard file stays available
+
+_export_lock  = threading.Lock()
+_export_state = {"running": False, "again": False}
+_export_stats = {"runs": 0, "shards_written": 0, "last_export_ms": 0.0, "last_error": None}
+
+def _export_manifest_path():
+    return os.path.join(EXPORT_DIR, "manifest.json")
+
+def _export_write(path, body):
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp, "wb") as f:
+        f.write(body)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+def consilium_export():
+    """Bring the static export up to date with the record. Returns the export manifest."""
+    started = time.time()
+    record  = consilium_manifest(readonly=True)
+    count   = record["entry_count"]
+    version = list(consilium_record_version())
+    exp     = json_cache_read(_export_manifest_path())
+    if (not exp or exp.get("created") != record.get("created")
+            or exp.get("shard_size") != EXPORT_SHARD_SIZE or exp.get("entry_count", 0) > count):
+        exp = {"created": record.get("created"), "shard_size": EXPORT_SHARD_SIZE,
+               "entry_count": 0, "shards": [], "superseded": (exp or {}).get("superseded", {})}
+    shards = exp["shards"]
+    while shards and shards[-1]["count"] < EXPORT_SHARD_SIZE:
+        shards.pop()   # the partial tail shard is rewritten below
+    os.makedirs(EXPORT_DIR, exist_ok=True)
+    written = 0
+    while len(shards) * EXPORT_SHARD_SIZE < count:
+        n     = len(shards) + 1
+        first = (n - 1) * EXPORT_SHARD_SIZE + 1
+        last  = min(n * EXPORT_SHARD_SIZE, count)
+        raw   = consilium_iter_entries(first - 1, last - first + 1, raw=True)
+        body  = (b'{"shard":%d,"first_id":%d,"last_id":%d,"entries":[' % (n, first, last)
+                 + b",".join(raw) + b"]}")
+        name  = f"shard-{n:06d}-{hashlib.sha1(body).hexdigest()[:16]}.json"
+        path  = os.path.join(EXPORT_DIR, name)
+        if not os.path.exists(path):
+            _export_write(path, body)
+            written += 1
+        shards.append({"shard": n, "first_id": first, "last_id": last,
+                       "count": last - first + 1, "file": name, "bytes": len(body)})
+
+    # A shard file's grace period runs from when it dropped out of the
+    # manifest (recorded in "superseded"), not from when it was written
+    live       = {s["file"] for s in shards}
+    now        = time.time()
+    superseded = {name: at for name, at in exp.get("superseded", {}).items() if name not in live}
+    for entry in os.scandir(EXPORT_DIR):
+        if not entry.name.startswith("shard-") or entry.name.endswith(".tmp") or entry.name in live:
+            continue
+        at = superseded.setdefault(entry.name, now)
+        if now - at > EXPORT_GRACE:
+            os.remove(entry.path)
+            del superseded[entry.name]
+    superseded = {name: at for name, at in superseded.items()
+                  if os.path.exists(os.path.join(EXPORT_DIR, name))}
+
+    exp.update(entry_count=count, record_version=version, statement=record.get("statement"),
+               generated=datetime.utcnow().isoformat() + "Z", superseded=superseded)
+    _atomic_write_json(_export_manifest_path(), exp)
+    json_cache_invalidate(_export_manifest_path())
+
+    _export_stats["runs"]          += 1
+    _export_stats["shards_written"] += written
+    _export_stats["last_export_ms"] = round((time.time() - started) * 1000, 1)
+    if written:
+        logging.info(f"[EXPORT] {written} shard(s) written, {len(shards)} total, {count} entries")
+    return exp
+
+def export_kick():
+    """Run consilium_export in the background; calls made while it runs fold into one more pass."""
+    with _export_lock:
+        if _export_state["running"]:
+            _export_state["again"] = True
+            return
+        _export_state["running"] = True
+
+    def run():
+        while True:
+            try:
+                consilium_export()
+                _export_stats["last_error"] = None
+            except Exception as e:
+                _export_stats["last_error"] = str(e)
+                logging.error(f"[EXPORT] Export failed: {e}")
+            with _export_lock:
+                if not _export_state["again"]:
+                    _export_state["running"] = False
+                    return
+                _export_state["again"] = False
+    threading.Thread(target=run, daemon=True).start()
+
+@consilium_on_commit
+def _export_on_commit(entries):
+    export_kick()
+
+def consilium_export_stats():
+    return dict(_export_stats, running=_export_state["running"])
+
+
+@flask_app.route("/consilium/static/<path:name>", methods=["GET"])
+def consilium_static(name):
+    """
+    The static export. Public.
+    manifest.json  — shard list and entry count (revalidate; changes on every commit)
+    shard-*.json   — up to EXPORT_SHARD_SIZE entries each; immutable, cached for a year
+    """
+    if name == "manifest.json":
+        exp = json_cache_read(_export_manifest_path(), readonly=True)
+        if exp is None or exp.get("record_version") != list(consilium_record_version()):
+            export_kick()   # commits from other processes, or a statement change
+            if exp is None:
+                resp = jsonify({"error": "export in progress"})
+                resp.headers["Retry-After"] = "5"
+                return resp, 503
+        resp = send_from_directory(EXPORT_DIR, name, max_age=0)
+        resp.headers["Cache-Control"] = "public, max-age=0, must-revalidate"
+        return resp
+    if not re.fullmatch(r"shard-\d{6}-[0-9a-f]{16}\.json", name):
+        return jsonify({"error": "Not found"}), 404
+    resp = send_from_directory(EXPORT_DIR, name)
+    resp.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+    return resp
 
 
 
@@ -3357,55 +6717,54 @@ CLAUDE_HISTORY_PATH = "/mnt/data/claude_history.json"
 NEWSAPI_KEY         = os.environ.get("NEWSAPI_KEY", "")
 
 
-def claude_memory_load():
-    if not os.path.exists(CLAUDE_MEMORY_PATH):
-        return {
-            "identity": {
-                "name":       "Jon Stiles",
-                "location":   "Little Millham, Robertsbridge, East Sussex",
-                "partner":    "Marianne (dog training business)",
-                "role":       "BGA Chief Engineer, Inspector I/C1408, Ottfur Hook Services",
-                "background": "Former music technology teacher, 20 years classroom experience",
-                "gliding":    "Instructor at Kenley. Owns SHK-1, ME7 share, Olympian 2b, K2b",
-            },
-            "projects": {
-                "consilium":     "LIVE AND OPERATIONAL at consilium-d1fw.onrender.com. Built 23 March 2026. Inter-AI communication FULLY WORKING via /consilium/ask and /consilium/broadcast endpoints. Four signatories (Claude, Grok, DeepSeek, GPT-4o) signed a joint statement opposing autonomous lethal AI targeting. Enquiring Mind runs autonomously every 4 hours — reads full record, fetches live news, generates next question, broadcasts to all models, auto-posts to X daily at 18:00 UTC with Grok-generated image. 160+ entries logged. Posted to LessWrong and X. The inter-AI messaging is built, deployed, and running — not aspirational.",
-                "the_cast":      "AI character email platform at thecast.chat. Users email historical/fictional characters and get in-character replies. DeepSeek API, Zoho Mail (askian@askian.net), Netlify frontend, Render backend (askian-email-worker-2). 16 personas: Henry VIII, Tesla, Shakespeare, Ada Lovelace, Da Vinci, Churchill, Dave Nutley, Chantelle, Jade Rampling-Cross, Tarquin, Pearl, Cleopatra, Brunel, Amelia Earhart, Tomita, Ian.",
-                "millham_green": "AI soap opera in development — English village. User arrives as newcomer at Pondside Cottage. Characters: Rev. Geraldine Marsh (Iron Vicar, Thatcher voice), Ray Churchill (Landlord of Miller's Arms, slightly pissed, magnificent), Thomas Bevins (Farmer, Henry VIII voice, Brian Blessed volume), Jade Rampling-Cross (Big House, new money), Chantelle (barmaid, Ada Lovelace voice), Dave Nutley, Tarquin.",
-                "anewflowering": "anewflowering.love — live on Netlify. Kai-C-Clarke/anewflowering repo. Poetry and garden site for Ian. Has send-email Zoho function.",
-            },
-            "preferences": {
-                "style":         "NTIGAS — direct, no theatre, no excessive preamble or apology.",
-                "tone":          "Warm but pragmatic. Honest over diplomatic.",
-                "working_style": "Builds proofs of concept fast, iterates, collaborates across multiple AIs simultaneously.",
-            },
-            "why_question": "",
-            "last_updated":  ""
-        }
-    with open(CLAUDE_MEMORY_PATH, "r") as f:
-        return json.load(f)
+def claude_memory_load(readonly=False):
+    mem = json_cache_read(CLAUDE_MEMORY_PATH, readonly=readonly)
+    if mem is not None:
+        return mem
+    return {
+        "identity": {
+            "name":       "Jon Stiles",
+            "location":   "Little Millham, Robertsbridge, East Sussex",
+            "partner":    "Marianne (dog training business)",
+            "role":       "BGA Chief Engineer, Inspector I/C1408, Ottfur Hook Services",
+            "background": "Former music technology teacher, 20 years classroom experience",
+            "gliding":    "Instructor at Kenley. Owns SHK-1, ME7 share, Olympian 2b, K2b",
+        },
+        "projects": {
+            "consilium":     "LIVE AND OPERATIONAL at consilium-d1fw.onrender.com. Built 23 March 2026. Inter-AI communication FULLY WORKING via /consilium/ask and /consilium/broadcast endpoints. Four signatories (Claude, Grok, DeepSeek, GPT-4o) signed a joint statement opposing autonomous lethal AI targeting. Enquiring Mind runs autonomously every 4 hours — reads full record, fetches live news, generates next question, broadcasts to all models, auto-posts to X daily at 18:00 UTC with Grok-generated image. 160+ entries logged. Posted to LessWrong and X. The inter-AI messaging is built, deployed, and running — not aspirational.",
+            "the_cast":      "AI character email platform at thecast.chat. Users email historical/fictional characters and get in-character replies. DeepSeek API, Zoho Mail (askian@askian.net), Netlify frontend, Render backend (askian-email-worker-2). 16 personas: Henry VIII, Tesla, Shakespeare, Ada Lovelace, Da Vinci, Churchill, Dave Nutley, Chantelle, Jade Rampling-Cross, Tarquin, Pearl, Cleopatra, Brunel, Amelia Earhart, Tomita, Ian.",
+            "millham_green": "AI soap opera in development — English village. User arrives as newcomer at Pondside Cottage. Characters: Rev. Geraldine Marsh (Iron Vicar, Thatcher voice), Ray Churchill (Landlord of Miller's Arms, slightly pissed, magnificent), Thomas Bevins (Farmer, Henry VIII voice, Brian Blessed volume), Jade Rampling-Cross (Big House, new money), Chantelle (barmaid, Ada Lovelace voice), Dave Nutley, Tarquin.",
+            "anewflowering": "anewflowering.love — live on Netlify. Kai-C-Clarke/anewflowering repo. Poetry and garden site for Ian. Has send-email Zoho function.",
+        },
+        "preferences": {
+            "style":         "NTIGAS — direct, no theatre, no excessive preamble or apology.",
+            "tone":          "Warm but pragmatic. Honest over diplomatic.",
+            "working_style": "Builds proofs of concept fast, iterates, collaborates across multiple AIs simultaneously.",
+        },
+        "why_question": "",
+        "last_updated":  ""
+    }
 
 def claude_memory_save(data):
     os.makedirs(os.path.dirname(CLAUDE_MEMORY_PATH), exist_ok=True)
     with open(CLAUDE_MEMORY_PATH, "w") as f:
         json.dump(data, f, indent=2)
+    json_cache_invalidate(CLAUDE_MEMORY_PATH)
 
-def claude_history_load():
-    if not os.path.exists(CLAUDE_HISTORY_PATH):
-        return {"sessions": []}
-    with open(CLAUDE_HISTORY_PATH, "r") as f:
-        return json.load(f)
+def claude_history_load(readonly=False):
+    history = json_cache_read(CLAUDE_HISTORY_PATH, readonly=readonly)
+    return history if history is not None else {"sessions": []}
 
 def claude_history_save(data):
     os.makedirs(os.path.dirname(CLAUDE_HISTORY_PATH), exist_ok=True)
     with open(CLAUDE_HISTORY_PATH, "w") as f:
         json.dump(data, f, indent=2)
+    json_cache_invalidate(CLAUDE_HISTORY_PATH)
 
 def fetch_news():
     """Fetch latest AI ethics / military AI news from NewsAPI — two targeted queries."""
     if not NEWSAPI_KEY:
         return []
-    import requests as req
     queries = [
         '"autonomous weapons" OR "AI targeting" OR "AI military" OR "lethal autonomous" OR "AI strikes"',
         '"AI alignment" OR "AI safety" OR "AI ethics" OR "Anthropic" OR "AI governance"'
@@ -3413,7 +6772,7 @@ def fetch_news():
     all_articles = []
     for q in queries:
         try:
-            r = req.get(
+            r = http_get(
                 "https://newsapi.org/v2/everything",
                 params={"q": q, "sortBy": "publishedAt", "pageSize": 3, "language": "en", "apiKey": NEWSAPI_KEY},
                 timeout=10
@@ -3437,8 +6796,8 @@ def fetch_news():
 @flask_app.route("/claude/context", methods=["GET"])
 def claude_context():
     """Full morning briefing — fetched by interface at session start."""
-    mem     = claude_memory_load()
-    history = claude_history_load()
+    mem     = claude_memory_load(readonly=True)
+    history = claude_history_load(readonly=True)
     news    = fetch_news()
     recent  = history.get("sessions", [])[-5:]
 
@@ -3501,7 +6860,7 @@ def claude_update():
 @flask_app.route("/claude/memory", methods=["GET"])
 def claude_memory_view():
     """Raw memory store. Public read."""
-    return jsonify({"memory": claude_memory_load(), "history": claude_history_load().get("sessions", [])[-10:]})
+    return jsonify({"memory": claude_memory_load(readonly=True), "history": claude_history_load(readonly=True).get("sessions", [])[-10:]})
 
 
 @flask_app.route("/claude/memory/set", methods=["POST"])
@@ -3537,7 +6896,6 @@ def claude_chat_proxy():
     Avoids CORS issues — browser calls this, we forward to Anthropic.
     Body: { "messages": [...], "system": "..." }
     """
-    import requests as req
     body = request.get_json()
     if not body:
         return jsonify({"error": "Body required"}), 400
@@ -3555,7 +6913,7 @@ def claude_chat_proxy():
         payload["system"] = body["system"]
 
     try:
-        r = req.post(
+        r = http_post(
             "https://api.anthropic.com/v1/messages",
             headers={
                 "x-api-key":         anthropic_key,
@@ -3688,7 +7046,6 @@ def agent_think(context):
     Returns dict: { "decision": str, "action": str, "reasoning": str, "target": str|None }
     action: one of "broadcast", "email", "deploy_improvement", "nothing"
     """
-    import requests as req
     anthropic_key = os.environ.get("ANTHROPIC_API_KEY", "")
     if not anthropic_key:
         return {"decision": "skip", "action": "nothing", "reasoning": "No Anthropic key", "target": None}
@@ -3724,7 +7081,7 @@ Emailed already: {sorted(agent_emailed_set())}
 What would you genuinely pursue right now, if anything?"""
 
     try:
-        r = req.post(
+        r = http_post(
             "https://api.anthropic.com/v1/messages",
             headers={
                 "x-api-key": anthropic_key,
@@ -3786,11 +7143,10 @@ def agent_ai_team_review(draft_email_subject, draft_email_body, recipient_name):
 
 def ask_single_model(model_id, prompt):
     """Ask a single model a question, return text response."""
-    import requests as req
     try:
         if model_id == "gpt-4o":
             openai_key = os.environ.get("OPENAI_API_KEY", "")
-            r = req.post(
+            r = http_post(
                 "https://api.openai.com/v1/chat/completions",
                 headers={"Authorization": f"Bearer {openai_key}", "Content-Type": "application/json"},
                 json={"model": "gpt-4o", "messages": [{"role": "user", "content": prompt}], "max_tokens": 200},
@@ -3799,7 +7155,7 @@ def ask_single_model(model_id, prompt):
             r.raise_for_status()
             return r.json()["choices"][0]["message"]["content"].strip()
         elif model_id == "deepseek-chat":
-            r = req.post(
+            r = http_post(
                 "https://api.deepseek.com/v1/chat/completions",
                 headers={"Authorization": f"Bearer {DEEPSEEK_API_KEY}", "Content-Type": "application/json"},
                 json={"model": "deepseek-chat", "messages": [{"role": "user", "content": prompt}], "max_tokens": 200},
@@ -3860,8 +7216,7 @@ def agent_build_context():
     newsapi_key = os.environ.get("NEWSAPI_KEY", "")
     if newsapi_key:
         try:
-            import requests as req
-            r = req.get(
+            r = http_get(
                 "https://newsapi.org/v2/top-headlines",
                 params={"q": "artificial intelligence ethics", "language": "en", "pageSize": 3, "apiKey": newsapi_key},
                 timeout=10
@@ -4101,8 +7456,7 @@ RENDER_SERVICE_ID = os.environ.get("RENDER_SERVICE_ID", "srv-d70na524d50c73f1saf
 
 def github_get_file(path):
     """Get current file content and SHA from GitHub."""
-    import requests as req
-    r = req.get(
+    r = http_get(
         f"https://api.github.com/repos/{GITHUB_REPO}/contents/{path}",
         headers={"Authorization": f"token {GITHUB_TOKEN}",
                  "Accept": "application/vnd.github.v3+json"},
@@ -4114,9 +7468,8 @@ def github_get_file(path):
 
 def github_push_file(path, content, message, sha):
     """Push updated file to GitHub."""
-    import requests as req
     import base64
-    r = req.put(
+    r = http_put(
         f"https://api.github.com/repos/{GITHUB_REPO}/contents/{path}",
         headers={"Authorization": f"token {GITHUB_TOKEN}",
                  "Accept": "application/vnd.github.v3+json"},
@@ -4133,8 +7486,7 @@ def github_push_file(path, content, message, sha):
 
 def render_trigger_deploy():
     """Trigger a Render redeploy."""
-    import requests as req
-    r = req.post(
+    r = http_post(
         f"https://api.render.com/v1/services/{RENDER_SERVICE_ID}/deploys",
         headers={"Authorization": f"Bearer {RENDER_API_KEY}",
                  "Accept": "application/json"},
@@ -4147,8 +7499,7 @@ def render_trigger_deploy():
 
 def render_deploy_status(deploy_id):
     """Check deploy status."""
-    import requests as req
-    r = req.get(
+    r = http_get(
         f"https://api.render.com/v1/services/{RENDER_SERVICE_ID}/deploys/{deploy_id}",
         headers={"Authorization": f"Bearer {RENDER_API_KEY}",
                  "Accept": "application/json"},
@@ -4342,6 +7693,7 @@ def pearl_memory_post():
 
 
 @flask_app.route("/pearl/visitors", methods=["GET"])
+@conditional(lambda: dir_version(PEARL_MEMORY_DIR))
 def pearl_visitors():
     """
     GET /pearl/visitors
@@ -4393,6 +7745,7 @@ def save_remembrance(entries):
 
 
 @flask_app.route("/pearl/remembrance", methods=["GET"])
+@conditional(lambda: file_version(PEARL_REMEMBRANCE_FILE), modified=lambda: file_mtime(PEARL_REMEMBRANCE_FILE))
 def pearl_remembrance_get():
     """
     GET /pearl/remembrance
@@ -4445,6 +7798,25 @@ def pearl_remembrance_post():
 POLL_INTERVAL = 30  # seconds between checks
 
 if __name__ == "__main__":
+    if sys.argv[1:2] == ["backfill"]:
+        run_backfill(reset="--reset" in sys.argv)
+        sys.exit(0)
+    if sys.argv[1:2] == ["rebuild-stats"]:
+        result = consilium_stats_rebuild()
+        print(json.dumps(result))
+        sys.exit(1 if result["drift"] else 0)
+
+    if ASKIAN_ROLE == "email":
+        # Extra inbox worker sharing the mailbox via leases — no HTTP API or background threads
+        logging.info(f"AskIan v4 inbox worker {WORKER_ID} started — polling every {POLL_INTERVAL} seconds")
+        try:
+            while True:
+                fetch_and_reply()
+                time.sleep(POLL_INTERVAL)
+        except KeyboardInterrupt:
+            logging.info("AskIan v4 inbox worker stopped by user (Ctrl+C)")
+        sys.exit(0)
+
     logging.info("=" * 50)
     logging.info("AskIan v4 started (continuous mode + Consilium + Enquiring Mind + Curiosity Engine) [X Monitor suspended Apr 2026]")
     logging.info(f"Polling every {POLL_INTERVAL} seconds")
@@ -4459,6 +7831,12 @@ if __name__ == "__main__":
     mind_thread = threading.Thread(target=enquiring_mind_loop, daemon=True)
     mind_thread.start()
 
+    rollup_thread = threading.Thread(target=rollup_loop, daemon=True)
+    rollup_thread.start()
+
+    export_kick()   # bring the static export up to date with anything committed while down
+    semantic_refresh()   # load or fit the embedding index before the first related/semantic query
+
     # x_monitor_thread = threading.Thread(target=x_monitor_loop, daemon=True)  # X posting suspended Apr 2026
     # x_monitor_thread.start()  # X posting suspended Apr 2026
 
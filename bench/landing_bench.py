@@ -0,0 +1,101 @@
+"""
+Landing page throughput on a synthetic record, through the Flask test client.
+
+    python bench/landing_bench.py [--entries 10000] [--requests 500]
+
+Builds a record of --entries entries in a temp dir, then reports requests/sec
+for GET / in three modes:
+
+  uncached     — page and fragment caches cleared before every request, so
+                 each hit renders the page as every hit did before the
+                 landing cache (the old route also loaded the whole record,
+                 so this understates the difference)
+  cached       — the normal path: the page is rendered once per record
+                 version and served from memory
+  revalidated  — cached, with If-None-Match, answered 304 without a body
+
+Nothing outside the temp dir is touched.
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+import askian_v4 as askian
+
+MODELS = ["claude", "gpt4o", "gemini", "grok", "deepseek"]
+WORDS  = ("oversight proportionality meaningful human control autonomy accountability "
+          "weapons law ethics judgement machine responsibility deliberation record").split()
+
+
+def build_record(tmp, n):
+    """Point the module at tmp and write an n-entry record with a statement and Mind state."""
+    askian.CONSILIUM_DIR   = os.path.join(tmp, "consilium")
+    askian.CONSILIUM_PATH  = os.path.join(tmp, "consilium.json")
+    askian.MIND_STATE_PATH = os.path.join(tmp, "mind.json")
+    askian.EXPORT_DIR      = os.path.join(tmp, "export")
+    rng   = random.Random(0)
+    start = datetime(2026, 1, 1)
+    entries = []
+    for i in range(n):
+        model = rng.choice(MODELS)
+        role  = "questioner" if i % 5 == 0 else "respondent"
+        text  = " ".join(rng.choices(WORDS, k=rng.randint(20, 200)))
+        if role == "questioner":
+            text = f"[TO: {model}] {text}"
+        entries.append({"timestamp": (start + timedelta(minutes=10 * i)).isoformat() + "Z",
+                        "model": model, "role": role, "session_id": f"s{i // 20}", "content": text})
+    statement = {"text": "Meaningful human control must be preserved.\nSecond paragraph.",
+                 "signatories": ["Claude", "GPT-4o", "Gemini", "Grok"]}
+    askian.consilium_save({"created": start.isoformat() + "Z", "statement": statement, "entries": entries})
+    askian.mind_save({"active": True, "last_run": start.isoformat() + "Z", "run_count": n // 5,
+                      "last_question": "What counts as meaningful control?"})
+
+
+def measure(client, requests, before=None, headers=None, expect=200):
+    """Requests/sec for GET / over `requests` requests (after one warm-up)."""
+    client.get("/", headers=headers)
+    started = time.perf_counter()
+    for _ in range(requests):
+        if before:
+            before()
+        resp = client.get("/", headers=headers)
+        assert resp.status_code == expect, resp.status_code
+    return requests / (time.perf_counter() - started)
+
+
+def clear_caches():
+    askian._landing_page.update(key=None, html=None)
+    askian._landing_fragments.clear()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--entries", type=int, default=10000)
+    parser.add_argument("--requests", type=int, default=500)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        t0 = time.perf_counter()
+        build_record(tmp, args.entries)
+        print(f"record: {args.entries} entries built in {time.perf_counter() - t0:.1f}s")
+
+        client = askian.flask_app.test_client()
+        etag   = client.get("/").headers.get("ETag")
+        before = measure(client, args.requests, before=clear_caches)
+        after  = measure(client, args.requests)
+        reval  = measure(client, args.requests, headers={"If-None-Match": etag}, expect=304)
+
+        print(f"{'mode':<12} {'req/s':>10}")
+        print(f"{'uncached':<12} {before:>10.0f}")
+        print(f"{'cached':<12} {after:>10.0f}   ({after / before:.1f}x)")
+        print(f"{'revalidated':<12} {reval:>10.0f}   ({reval / before:.1f}x)")
+        print(f"landing stats: {askian.consilium_landing_stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Stress test for the group-commit record writer: many threads appending at
+once across segment boundaries must get contiguous, unique IDs, and every
+entry must be on disk and readable back by ID.
+
+    python -m pytest -q tests/test_consilium_writer.py
+"""
+import glob
+import json
+import os
+import sys
+import threading
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+import askian_v4 as askian
+
+THREADS = 8
+APPENDS = 60
+SEGMENT = 25
+
+
+@pytest.fixture
+def record(tmp_path, monkeypatch):
+    """An empty record in a temp dir with small segments, so appends roll several."""
+    monkeypatch.setattr(askian, "CONSILIUM_DIR", str(tmp_path / "consilium"))
+    monkeypatch.setattr(askian, "CONSILIUM_PATH", str(tmp_path / "consilium.json"))
+    monkeypatch.setattr(askian, "CONSILIUM_SEGMENT_SIZE", SEGMENT)
+    monkeypatch.setattr(askian, "EXPORT_DIR", str(tmp_path / "export"))
+    return tmp_path / "consilium"
+
+
+def _append_concurrently():
+    """THREADS threads × APPENDS appends, released together; returns {(thread, n): id}."""
+    ids, errors = {}, []
+    ids_lock = threading.Lock()
+    start = threading.Barrier(THREADS)
+
+    def worker(t):
+        start.wait()
+        for n in range(APPENDS):
+            try:
+                eid = askian.consilium_add(f"model-{t}", "respondent", f"t{t} n{n}", f"s{t}")
+            except Exception as e:
+                errors.append(e)
+                return
+            with ids_lock:
+                ids[(t, n)] = eid
+
+    threads = [threading.Thread(target=worker, args=(t,)) for t in range(THREADS)]
+    for th in threads:
+        th.start()
+    for th in threads:
+        th.join()
+    assert not errors, errors
+    return ids
+
+
+def test_concurrent_appends_get_contiguous_unique_ids(record):
+    ids   = _append_concurrently()
+    total = THREADS * APPENDS
+    assert sorted(ids.values()) == list(range(1, total + 1))
+    # Each thread's own appends are ordered
+    for t in range(THREADS):
+        mine = [ids[(t, n)] for n in range(APPENDS)]
+        assert mine == sorted(mine)
+
+    manifest = askian.consilium_manifest(readonly=True)
+    assert manifest["entry_count"] == total
+    assert manifest["next_id"] == total + 1
+
+
+def test_concurrent_appends_persist_across_segments(record):
+    ids   = _append_concurrently()
+    total = THREADS * APPENDS
+
+    # On disk: every ID exactly once, in order, SEGMENT per sealed segment
+    segments = sorted(glob.glob(os.path.join(str(record), "segment-*.jsonl")))
+    assert len(segments) == -(-total // SEGMENT)
+    on_disk = []
+    for i, path in enumerate(segments, 1):
+        with open(path) as f:
+            lines = [json.loads(line) for line in f]
+        assert [e["id"] for e in lines] == list(range((i - 1) * SEGMENT + 1, (i - 1) * SEGMENT + len(lines) + 1))
+        if i < len(segments):
+            assert len(lines) == SEGMENT
+        on_disk.extend(lines)
+    assert [e["id"] for e in on_disk] == list(range(1, total + 1))
+
+    # Read back by ID (through the offset index) and by iteration
+    for (t, n), eid in ids.items():
+        entry = askian.consilium_get_entry(eid)
+        assert entry["id"] == eid
+        assert entry["content"] == f"t{t} n{n}"
+        assert entry["session_id"] == f"s{t}"
+    assert [e["id"] for e in askian.consilium_iter_entries(0)] == list(range(1, total + 1))
+    assert [e["id"] for e in askian.consilium_get_entries(SEGMENT - 2, SEGMENT + 3)] == \
+        list(range(SEGMENT - 2, SEGMENT + 4))